@@ -0,0 +1,111 @@
+import os
+import heapq
+import pygame as pg
+from random import Random
+from statistics import median
+from time import perf_counter
+from typing import Any, Generator
+from src.entities import MazeGrid
+from src.scenes import shared_config
+from src.entities.astar_engine import AStarEngine
+from src.entities.maze_manager import LAYOUT_PROP_TABLE, MAZE_LAYOUT_FOLDER_PATH, MAZE_LAYOUT_FILE_EXTENSION
+
+BENCHMARK_SEED: int = 1234
+BENCHMARK_QUERY_COUNT: int = 200
+BENCHMARK_REPEAT_COUNT: int = 5
+
+def performLegacyAStar(
+    initial_position: tuple[int, int],
+    target_position: tuple[int, int],
+    maze: list[list[bool]]
+) -> list[tuple[int, int]]:
+    # ? Verbatim Copy of the Dictionary-Based performAStar it Replaced
+    def heuristic(a: tuple[int, int], b: tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def neighbors(x: int, y: int) -> Generator[tuple[int, int], Any, None]:
+        for dx, dy in ((1,0), (-1,0), (0,1), (0,-1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < shared_config.GRID_COLUMN_COUNT and 0 <= ny < shared_config.GRID_ROW_COUNT and not maze[nx][ny]:
+                yield (nx, ny)
+
+    open_set: list[tuple[int, int, tuple[int, int]]] = []
+    heapq.heappush(open_set, (heuristic(initial_position, target_position), 0, initial_position))
+
+    came_from: dict[tuple[int, int], tuple[int, int]] = {}
+    g_score: dict[tuple[int, int], int] = { initial_position: 0 }
+
+    while open_set:
+        _, current_g, current = heapq.heappop(open_set)
+
+        if current == target_position:
+            path: list[tuple[int, int]] = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            return path[::-1]
+
+        for neighbor in neighbors(*current):
+            tentative_g = current_g + 1
+            if tentative_g < g_score.get(neighbor, float("inf")):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                f_score = tentative_g + heuristic(neighbor, target_position)
+                heapq.heappush(open_set, (f_score, tentative_g, neighbor))
+
+    return []
+
+def loadLayoutGrids() -> list[tuple[str, MazeGrid]]:
+    grids: list[tuple[str, MazeGrid]] = []
+
+    for sub_path in sorted(os.listdir(MAZE_LAYOUT_FOLDER_PATH)):
+        if not sub_path.endswith(MAZE_LAYOUT_FILE_EXTENSION):
+            continue
+
+        grid: MazeGrid = MazeGrid(shared_config.GRID_COLUMN_COUNT, shared_config.GRID_ROW_COUNT, LAYOUT_PROP_TABLE)
+        grid.decodeLayout(pg.image.load(os.path.join(MAZE_LAYOUT_FOLDER_PATH, sub_path)))
+        grids.append((sub_path, grid))
+
+    return grids
+
+def getFloorQueries(grid: MazeGrid, query_count: int, seed: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    random: Random = Random(seed)
+    floor_cells: list[tuple[int, int]] = grid.getCells(grid.solid_mask == 0)
+
+    return [(random.choice(floor_cells), random.choice(floor_cells)) for _ in range(query_count)]
+
+def timeQueries(search, queries: list[tuple[tuple[int, int], tuple[int, int]]]) -> float:
+    samples: list[float] = []
+
+    for _ in range(BENCHMARK_REPEAT_COUNT):
+        start_time: float = perf_counter()
+        for initial_position, target_position in queries:
+            search(initial_position, target_position)
+        samples.append((perf_counter() - start_time) / len(queries))
+
+    return median(samples)
+
+def main() -> None:
+    print(f"{'layout':<12}{'legacy us':>12}{'engine us':>12}{'speedup':>10}  paths")
+
+    for layout_name, grid in loadLayoutGrids():
+        nested_mask: list[list[bool]] = grid.solid_mask.astype(bool).tolist()
+        engine: AStarEngine = AStarEngine(grid)
+        queries = getFloorQueries(grid, BENCHMARK_QUERY_COUNT, BENCHMARK_SEED)
+
+        identical: bool = all(
+            performLegacyAStar(initial_position, target_position, nested_mask) ==
+            engine.search(initial_position, target_position)
+            for initial_position, target_position in queries
+        )
+
+        legacy_time: float = timeQueries(lambda a, b: performLegacyAStar(a, b, nested_mask), queries)
+        engine_time: float = timeQueries(engine.search, queries)
+
+        print(
+            f"{layout_name:<12}{legacy_time * 1e6:>12.1f}{engine_time * 1e6:>12.1f}"
+            f"{legacy_time / engine_time:>9.2f}x  {'identical' if identical else 'DIFFERENT'}"
+        )
+
+if __name__ == "__main__":
+    main()
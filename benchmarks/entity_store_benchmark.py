@@ -0,0 +1,123 @@
+import pygame as pg
+from time import perf_counter
+from src.core import GameContext, createHeadlessContext, seedRandomStreams, getTextures
+from src.core.application import SIMULATION_STEP
+from src.entities import ChaseEnemy, SkinnyBird, NobodyRollyPolly
+from src.scenes import GameScene, ConclusionScene
+from src.scenes.game_scene import (
+    MASON_MANTIS_FRAME_TIME,
+    MASON_MANTIS_INITIAL_X,
+    MASON_MANTIS_INITIAL_Y,
+    SCORP_DRAGON_FRAME_TIME,
+    SCORP_DRAGON_INITIAL_X,
+    SCORP_DRAGON_INITIAL_Y
+)
+from .astar_benchmark import BENCHMARK_SEED
+
+BENCHMARK_FRAME_COUNT: int = 240
+BENCHMARK_WARMUP_FRAME_COUNT: int = 30
+BENCHMARK_SWARM_SIZES: tuple[int, ...] = (0, 64, 256, 512, 1024)
+
+class CrowdedGameScene(GameScene):
+    def __init__(self, app: GameContext, conclusion_scene: ConclusionScene, extra_enemy_count: int) -> None:
+        super().__init__(app, conclusion_scene)
+
+        self.extra_chasers: list[ChaseEnemy] = []
+        self.extra_birds: list[SkinnyBird] = []
+        self.extra_nobodies: list[NobodyRollyPolly] = []
+
+        for index in range(extra_enemy_count):
+            match index % 4:
+                case 0:
+                    self.extra_chasers.append(ChaseEnemy(
+                        self.entities,
+                        MASON_MANTIS_FRAME_TIME,
+                        getTextures(1, 6, root_indices=(2, 7)),
+                        (MASON_MANTIS_INITIAL_X, MASON_MANTIS_INITIAL_Y)
+                    ))
+                case 1:
+                    self.extra_chasers.append(ChaseEnemy(
+                        self.entities,
+                        SCORP_DRAGON_FRAME_TIME,
+                        getTextures(1, 4, root_indices=(1, 4)),
+                        (SCORP_DRAGON_INITIAL_X, SCORP_DRAGON_INITIAL_Y)
+                    ))
+                case 2:
+                    self.extra_birds.append(SkinnyBird(self.entities))
+                case _:
+                    self.extra_nobodies.append(NobodyRollyPolly(self.entities))
+
+    def enter(self) -> None:
+        super().enter()
+
+        for chaser in self.extra_chasers:
+            chaser.reset()
+
+        for bird in self.extra_birds:
+            bird.reset()
+
+        for nobody in self.extra_nobodies:
+            nobody.reset(self.maze_manager, self.pathfinding)
+
+    def updateEnemies(self, delta_time: float) -> None:
+        super().updateEnemies(delta_time)
+
+        for index, chaser in enumerate(self.extra_chasers):
+            chaser.update(delta_time, self.red_player if index % 2 == 0 else self.blue_player, self.maze_manager, self.flow_fields)
+
+        for bird in self.extra_birds:
+            bird.update(delta_time, self.red_player, self.blue_player, self.maze_manager)
+
+        for nobody in self.extra_nobodies:
+            nobody.update(delta_time, self.red_player, self.blue_player, self.maze_manager, self.pathfinding)
+
+    def drawEnemies(self, canvas: pg.Surface) -> None:
+        super().drawEnemies(canvas)
+
+        for enemy in (*self.extra_chasers, *self.extra_birds, *self.extra_nobodies):
+            enemy.draw(canvas, self.render_alpha)
+
+class TimedGameScene(CrowdedGameScene):
+    # ? Splits the Views' Decisions From the Store's Batch Steps Around Them
+    def __init__(self, app: GameContext, conclusion_scene: ConclusionScene, extra_enemy_count: int) -> None:
+        super().__init__(app, conclusion_scene, extra_enemy_count)
+
+        self.enemy_time: float = 0.0
+
+    def updateEnemies(self, delta_time: float) -> None:
+        start: float = perf_counter()
+        super().updateEnemies(delta_time)
+        self.enemy_time += perf_counter() - start
+
+def benchmarkSwarm(context: GameContext, swarm_size: int) -> tuple[float, float]:
+    game_scene: TimedGameScene = TimedGameScene(context, ConclusionScene(context), swarm_size)
+
+    seedRandomStreams(BENCHMARK_SEED)
+    game_scene.enter()
+
+    for _ in range(BENCHMARK_WARMUP_FRAME_COUNT):
+        game_scene.update(SIMULATION_STEP)
+
+    game_scene.enemy_time = 0.0
+
+    start: float = perf_counter()
+    for _ in range(BENCHMARK_FRAME_COUNT):
+        game_scene.update(SIMULATION_STEP)
+    update_time: float = perf_counter() - start
+
+    game_scene.release()
+
+    return (game_scene.enemy_time / BENCHMARK_FRAME_COUNT, update_time / BENCHMARK_FRAME_COUNT)
+
+def main() -> None:
+    context: GameContext = createHeadlessContext()
+
+    # ? Extras Cycle Through Chasers, Birds and Nobodies on Top of the Usual Four Enemies
+    print(f"{'extras':>8}{'updateEnemies ms/frm':>22}{'update ms/frm':>15}")
+
+    for swarm_size in BENCHMARK_SWARM_SIZES:
+        enemy_time, update_time = benchmarkSwarm(context, swarm_size)
+        print(f"{swarm_size:>8}{enemy_time * 1e3:>22.3f}{update_time * 1e3:>15.3f}")
+
+if __name__ == "__main__":
+    main()
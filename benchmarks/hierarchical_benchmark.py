@@ -0,0 +1,90 @@
+import numpy as np
+from time import perf_counter
+from src.entities import MazeGrid
+from src.entities.astar_engine import AStarEngine
+from src.entities.junction_graph import HierarchicalPathfinder
+from .astar_benchmark import BENCHMARK_SEED, loadLayoutGrids, getFloorQueries, timeQueries
+
+GENERATED_MAZE_QUERY_COUNT: int = 20
+GENERATED_MAZE_SIZES: tuple[tuple[int, int], ...] = ((101, 101), (201, 201))
+GENERATED_MAZE_LOOP_FRACTION: float = 0.05
+
+# ? (Cluster Size, Level Count) Pairs; Level 0 Searches the Junction Graph Directly
+HIERARCHY_CONFIGURATIONS: tuple[tuple[int, int], ...] = ((16, 0), (16, 1), (16, 2))
+
+def createCorridorMaze(column_count: int, row_count: int, loop_fraction: float, seed: int) -> MazeGrid:
+    random: np.random.Generator = np.random.default_rng(seed)
+
+    grid: MazeGrid = MazeGrid(column_count, row_count, {})
+    grid.solid_mask[:, :] = 1
+
+    # ? Depth-First Carving Leaves One-Cell Corridors Between Odd Cells
+    stack: list[tuple[int, int]] = [(1, 1)]
+    grid.solid_mask[1, 1] = 0
+
+    while stack:
+        x, y = stack[-1]
+        directions: list[tuple[int, int]] = [
+            (dx, dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < column_count - 1 and 0 < y + dy < row_count - 1 and grid.solid_mask[x + dx, y + dy]
+        ]
+
+        if not directions:
+            stack.pop()
+            continue
+
+        dx, dy = directions[random.integers(len(directions))]
+        grid.solid_mask[x + dx // 2, y + dy // 2] = 0
+        grid.solid_mask[x + dx, y + dy] = 0
+        stack.append((x + dx, y + dy))
+
+    # ? Knocking Out a Few Walls Adds Loops Like the Shipped Layouts Have
+    wall_cells: np.ndarray = np.argwhere(grid.solid_mask[1:-1, 1:-1] == 1) + 1
+    for x, y in wall_cells[random.random(len(wall_cells)) < loop_fraction]:
+        grid.solid_mask[x, y] = 0
+
+    grid.layout_version += 1
+    return grid
+
+def benchmarkGrid(name: str, grid: MazeGrid, query_count: int) -> None:
+    engine: AStarEngine = AStarEngine(grid)
+    queries = getFloorQueries(grid, query_count, BENCHMARK_SEED)
+    astar_time: float = timeQueries(engine.search, queries)
+
+    results: list[str] = [f"{name:<14}{astar_time * 1e6:>11.1f}"]
+
+    for cluster_size, level_count in HIERARCHY_CONFIGURATIONS:
+        build_start: float = perf_counter()
+        pathfinder: HierarchicalPathfinder = HierarchicalPathfinder(grid, cluster_size, level_count)
+        build_time: float = perf_counter() - build_start
+
+        same_lengths: bool = all(
+            len(engine.search(initial_position, target_position)) ==
+            len(pathfinder.search(initial_position, target_position))
+            for initial_position, target_position in queries
+        )
+
+        query_time: float = timeQueries(pathfinder.search, queries)
+        results.append(
+            f"{query_time * 1e6:>11.1f}{len(pathfinder.level_nodes[-1]):>7}{build_time * 1e3:>9.1f}"
+            f"{'' if same_lengths else ' MISMATCH':<1}"
+        )
+
+    print("".join(results))
+
+def main() -> None:
+    header: list[str] = [f"{'map':<14}{'astar us':>11}"]
+    for cluster_size, level_count in HIERARCHY_CONFIGURATIONS:
+        header.append(f"{f'L{level_count} us':>11}{'nodes':>7}{'build ms':>9}")
+
+    print("".join(header))
+
+    for layout_name, grid in loadLayoutGrids():
+        benchmarkGrid(layout_name, grid, 200)
+
+    for column_count, row_count in GENERATED_MAZE_SIZES:
+        grid: MazeGrid = createCorridorMaze(column_count, row_count, GENERATED_MAZE_LOOP_FRACTION, BENCHMARK_SEED)
+        benchmarkGrid(f"maze {column_count}x{row_count}", grid, GENERATED_MAZE_QUERY_COUNT)
+
+if __name__ == "__main__":
+    main()
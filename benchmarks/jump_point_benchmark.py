@@ -0,0 +1,60 @@
+import numpy as np
+from src.entities import MazeGrid
+from src.entities.astar_engine import AStarEngine
+from src.entities.jump_point_search import JumpPointSearch
+from .astar_benchmark import BENCHMARK_SEED, loadLayoutGrids, getFloorQueries, timeQueries
+
+OPEN_MAP_QUERY_COUNT: int = 20
+OPEN_MAP_SIZES: tuple[tuple[int, int], ...] = ((128, 128), (256, 256))
+OPEN_MAP_OBSTACLE_DENSITY: float = 0.1
+
+def createOpenAreaGrid(column_count: int, row_count: int, obstacle_density: float, seed: int) -> MazeGrid:
+    random: np.random.Generator = np.random.default_rng(seed)
+
+    grid: MazeGrid = MazeGrid(column_count, row_count, {})
+    grid.solid_mask[:, :] = random.random((column_count, row_count)) < obstacle_density
+    grid.layout_version += 1
+
+    return grid
+
+def getAverageExpansions(searcher: AStarEngine | JumpPointSearch, queries: list[tuple[tuple[int, int], tuple[int, int]]]) -> float:
+    expansion_count: int = 0
+
+    for initial_position, target_position in queries:
+        searcher.search(initial_position, target_position)
+        expansion_count += searcher.expansion_count
+
+    return expansion_count / len(queries)
+
+def benchmarkGrid(name: str, grid: MazeGrid, query_count: int) -> None:
+    engine: AStarEngine = AStarEngine(grid)
+    jump_point_search: JumpPointSearch = JumpPointSearch(grid)
+    queries = getFloorQueries(grid, query_count, BENCHMARK_SEED)
+
+    same_lengths: bool = all(
+        len(engine.search(initial_position, target_position)) ==
+        len(jump_point_search.search(initial_position, target_position))
+        for initial_position, target_position in queries
+    )
+
+    astar_time: float = timeQueries(engine.search, queries)
+    jump_point_time: float = timeQueries(jump_point_search.search, queries)
+
+    print(
+        f"{name:<16}{astar_time * 1e6:>11.1f}{getAverageExpansions(engine, queries):>10.1f}"
+        f"{jump_point_time * 1e6:>11.1f}{getAverageExpansions(jump_point_search, queries):>10.1f}"
+        f"{astar_time / jump_point_time:>9.2f}x  {'optimal' if same_lengths else 'LENGTH MISMATCH'}"
+    )
+
+def main() -> None:
+    print(f"{'map':<16}{'astar us':>11}{'expanded':>10}{'jps us':>11}{'expanded':>10}{'speedup':>10}  paths")
+
+    for layout_name, grid in loadLayoutGrids():
+        benchmarkGrid(layout_name, grid, 200)
+
+    for column_count, row_count in OPEN_MAP_SIZES:
+        grid: MazeGrid = createOpenAreaGrid(column_count, row_count, OPEN_MAP_OBSTACLE_DENSITY, BENCHMARK_SEED)
+        benchmarkGrid(f"open {column_count}x{row_count}", grid, OPEN_MAP_QUERY_COUNT)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import sys
+import tracemalloc
+from src.entities import Player, ChaseEnemy, SkinnyBird, NobodyRollyPolly, MazeManager, EntityStore, PropType, PropTable
+
+MEMORY_PROP_COUNTS: tuple[int, ...] = (100, 1000, 10000, 100000)
+MEMORY_ENTITY_CLASSES: tuple[type, ...] = (Player, ChaseEnemy, SkinnyBird, NobodyRollyPolly, MazeManager)
+
+class DictInstance:
+    # ? Stands in for the Same Class Before it Declared __slots__
+    pass
+
+def getSlottedBytes(cls: type) -> int:
+    return sys.getsizeof(cls.__new__(cls))
+
+def getDictBytes(attribute_names: tuple[str, ...]) -> int:
+    instance: DictInstance = DictInstance()
+    for attribute_name in attribute_names:
+        setattr(instance, attribute_name, None)
+
+    return sys.getsizeof(instance) + sys.getsizeof(instance.__dict__)
+
+def getEntityStoreBytes() -> float:
+    entities: EntityStore = EntityStore()
+    array_bytes: int = sum(value.nbytes for value in vars(entities).values() if hasattr(value, "nbytes"))
+    return array_bytes / entities.capacity
+
+def getMapSize(prop_count: int) -> tuple[int, int]:
+    # ? A Square Map Twice the Prop Count, Like a Big Generated Layout
+    side: int = int((prop_count * 2) ** 0.5) + 1
+    return (side, side)
+
+def getCell(index: int, row_count: int) -> tuple[int, int]:
+    return ((index * 2) // row_count, (index * 2) % row_count)
+
+def measureTableProps(prop_count: int) -> tuple[int, int]:
+    column_count, row_count = getMapSize(prop_count)
+
+    tracemalloc.start()
+    props: PropTable = PropTable(column_count, row_count)
+
+    for index in range(prop_count):
+        prop_type: PropType = PropType.PURSE if index % 10 == 0 else PropType.COIN
+        props.add(getCell(index, row_count), prop_type, 100 if prop_type == PropType.PURSE else 0)
+
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (allocated_bytes, props.getByteCount())
+
+def measureLegacyProps(prop_count: int) -> int:
+    _, row_count = getMapSize(prop_count)
+
+    tracemalloc.start()
+    coin_positions: list[tuple[int, int]] = []
+    purse_positions: list[tuple[int, int]] = []
+    purse_payloads: dict[tuple[int, int], int] = {}
+
+    # ? Tuples in Per-Type Lists Plus a Payload Dictionary, as MazeManager Used to Hold Them
+    for index in range(prop_count):
+        cell: tuple[int, int] = getCell(index, row_count)
+        if index % 10 == 0:
+            purse_positions.append(cell)
+            purse_payloads[cell] = 100
+        else:
+            coin_positions.append(cell)
+
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated_bytes
+
+def main() -> None:
+    print(f"{'class':<18}{'slots B':>9}{'dict B':>9}")
+    for cls in MEMORY_ENTITY_CLASSES:
+        print(f"{cls.__name__:<18}{getSlottedBytes(cls):>9}{getDictBytes(cls.__slots__):>9}")
+
+    print(f"{'EntityStore slot':<18}{getEntityStoreBytes():>9.0f}")
+    print()
+
+    print(f"{'props':>8}{'table B':>12}{'B/prop':>9}{'arrays B':>12}{'legacy B':>12}{'B/prop':>9}")
+    for prop_count in MEMORY_PROP_COUNTS:
+        table_bytes, array_bytes = measureTableProps(prop_count)
+        legacy_bytes: int = measureLegacyProps(prop_count)
+        print(
+            f"{prop_count:>8}{table_bytes:>12}{table_bytes / prop_count:>9.1f}{array_bytes:>12}"
+            f"{legacy_bytes:>12}{legacy_bytes / prop_count:>9.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
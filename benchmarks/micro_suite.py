@@ -0,0 +1,186 @@
+import os
+import argparse
+import pygame as pg
+from random import Random
+from typing import Callable
+from src.core import GameContext, createHeadlessContext, seedRandomStreams
+from src.entities import Player, MazeManager, MazeGrid, EntityStore, NobodyRollyPolly, LineOfSightIndex
+from src.entities.__utils import performAStar
+from src.scenes import GameScene, ConclusionScene, shared_config
+from .astar_benchmark import BENCHMARK_SEED, loadLayoutGrids, getFloorQueries
+from .timing import BenchmarkStats, measure, writeReport, loadReport, compareResults, printResults, printComparisons, TIMING_SAMPLE_COUNT
+
+MICRO_SUITE_NAME: str = "micro"
+
+MICRO_QUERY_COUNT: int = 64
+MICRO_POSITION_COUNT: int = 256
+MICRO_SIGHT_ORIGIN_COUNT: int = 16
+
+# ? A Case Builds its State Once, Then Hands Back the Timed Call and the Operations it Performs
+BenchmarkCase = tuple[str, Callable[[], object], int]
+
+def getFloorPositions(grid: MazeGrid, count: int, random: Random) -> list[tuple[float, float]]:
+    floor_cells: list[tuple[int, int]] = grid.getCells(grid.solid_mask == 0)
+
+    # ? Up to Half a Cell Off Centre, so Most Positions Overlap a Wall to Push Out Of
+    return [
+        (
+            (cell[0] + random.uniform(-0.5, 0.5)) * shared_config.GRID_CELL_SIZE,
+            (cell[1] + random.uniform(-0.5, 0.5)) * shared_config.GRID_CELL_SIZE
+        )
+        for cell in (random.choice(floor_cells) for _ in range(count))
+    ]
+
+def getAStarCases() -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+
+    for layout_name, grid in loadLayoutGrids():
+        queries: list[tuple[tuple[int, int], tuple[int, int]]] = getFloorQueries(grid, MICRO_QUERY_COUNT, BENCHMARK_SEED)
+
+        def searchQueries(grid: MazeGrid = grid, queries: list[tuple[tuple[int, int], tuple[int, int]]] = queries) -> None:
+            for initial_position, target_position in queries:
+                performAStar(initial_position, target_position, grid)
+
+        cases.append((f"performAStar/{layout_name}", searchQueries, len(queries)))
+
+    return cases
+
+def getWallCollisionCases(context: GameContext) -> list[BenchmarkCase]:
+    random: Random = Random(BENCHMARK_SEED)
+    player: Player = Player(True, context)
+
+    placements: list[tuple[MazeGrid, float, float]] = []
+    for _, grid in loadLayoutGrids():
+        placements.extend((grid, x, y) for x, y in getFloorPositions(grid, MICRO_POSITION_COUNT, random))
+
+    def collidePlacements() -> None:
+        for grid, x, y in placements:
+            player.position_x, player.position_y = x, y
+            player.handleWallCollisions(grid)
+
+    return [("Player.handleWallCollisions", collidePlacements, len(placements))]
+
+def getMazeCases() -> list[BenchmarkCase]:
+    cases: list[BenchmarkCase] = []
+    maze_manager: MazeManager = MazeManager()
+    layout_file_paths: list[str] = sorted(maze_manager.layout_file_paths)
+
+    # ? Pinning the Layout List Makes Each Reset Rebuild the Same Maze
+    for layout_file_path in layout_file_paths:
+        def resetLayout(layout_file_path: str = layout_file_path) -> None:
+            maze_manager.layout_file_paths = [layout_file_path]
+            maze_manager.reset()
+
+        cases.append((f"MazeManager.reset/{os.path.basename(layout_file_path)}", resetLayout, 1))
+
+    # ? Drawing Gets its Own Maze, Since the Reset Cases Leave Theirs on Whichever Layout Ran Last
+    drawn_maze: MazeManager = MazeManager()
+    drawn_maze.layout_file_paths = layout_file_paths[:1]
+
+    seedRandomStreams(BENCHMARK_SEED)
+    drawn_maze.reset()
+
+    canvas: pg.Surface = pg.Surface((
+        shared_config.GRID_CELL_SIZE * shared_config.GRID_COLUMN_COUNT + shared_config.GRID_RENDER_OFFSET_X * 2,
+        shared_config.GRID_CELL_SIZE * shared_config.GRID_ROW_COUNT + shared_config.GRID_RENDER_OFFSET_Y * 2
+    ))
+    effect_layer: pg.Surface = pg.Surface((
+        shared_config.GRID_CELL_SIZE * shared_config.GRID_COLUMN_COUNT,
+        shared_config.GRID_CELL_SIZE * shared_config.GRID_ROW_COUNT
+    ))
+
+    cases.append(("MazeManager.drawProps", lambda: drawn_maze.drawProps(canvas), 1))
+    cases.append(("MazeManager.drawShimmers", lambda: drawn_maze.drawShimmers(effect_layer), 1))
+
+    return cases
+
+def getLineOfSightCases() -> list[BenchmarkCase]:
+    random: Random = Random(BENCHMARK_SEED)
+    entities: EntityStore = EntityStore()
+    rolly_polly: NobodyRollyPolly = NobodyRollyPolly(entities)
+
+    # ? Private to Nobody's Patrol State; Reached Through its Mangled Name Only Here
+    has_line_of_sight: Callable[[tuple[float, float], tuple[float, float], LineOfSightIndex], bool] = rolly_polly._NobodyRollyPolly__hasLineOfSight
+
+    sightings: list[tuple[tuple[float, float], LineOfSightIndex, list[tuple[float, float]]]] = []
+    for _, grid in loadLayoutGrids():
+        line_of_sight: LineOfSightIndex = LineOfSightIndex(grid)
+        floor_cells: list[tuple[int, int]] = grid.getCells(grid.solid_mask == 0)
+
+        for _ in range(MICRO_SIGHT_ORIGIN_COUNT):
+            origin_x, origin_y = random.choice(floor_cells)
+
+            # ? Mostly Aligned Targets, Which Reach the Mask Test; the Rest Exit Early
+            targets: list[tuple[float, float]] = []
+            for target_x, target_y in (random.choice(floor_cells) for _ in range(MICRO_SIGHT_ORIGIN_COUNT)):
+                match random.randrange(4):
+                    case 0:
+                        target_x = origin_x
+                    case 1 | 2:
+                        target_y = origin_y
+                    case _:
+                        pass
+
+                targets.append((target_x * shared_config.GRID_CELL_SIZE, target_y * shared_config.GRID_CELL_SIZE))
+
+            sightings.append((
+                (origin_x * shared_config.GRID_CELL_SIZE, origin_y * shared_config.GRID_CELL_SIZE),
+                line_of_sight,
+                targets
+            ))
+
+    def checkSightings() -> None:
+        for origin, line_of_sight, targets in sightings:
+            for target in targets:
+                has_line_of_sight(origin, target, line_of_sight)
+
+    return [("NobodyRollyPolly.__hasLineOfSight", checkSightings, sum(len(targets) for _, _, targets in sightings))]
+
+def getGameSceneCases(context: GameContext) -> list[BenchmarkCase]:
+    game_scene: GameScene = GameScene(context, ConclusionScene(context))
+
+    seedRandomStreams(BENCHMARK_SEED)
+    game_scene.enter()
+
+    canvas: pg.Surface = context.render_surface
+
+    return [
+        ("GameScene.drawFlashlights", lambda: game_scene.drawFlashlights(canvas), 1),
+        ("GameScene.draw", lambda: game_scene.draw(canvas), 1)
+    ]
+
+def getCases(context: GameContext) -> list[BenchmarkCase]:
+    return (
+        getAStarCases() +
+        getWallCollisionCases(context) +
+        getMazeCases() +
+        getLineOfSightCases() +
+        getGameSceneCases(context)
+    )
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Time entity and maze hot paths")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--samples", type=int, default=TIMING_SAMPLE_COUNT)
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a previous JSON report")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    context: GameContext = createHeadlessContext()
+
+    results: list[BenchmarkStats] = []
+    for name, function, operation_count in getCases(context):
+        if arguments.filter in name:
+            results.append(measure(name, function, operation_count, arguments.samples))
+
+    printResults(results)
+
+    if not arguments.output is None:
+        writeReport(arguments.output, MICRO_SUITE_NAME, results)
+
+    if not arguments.compare is None:
+        print()
+        printComparisons(compareResults(loadReport(arguments.compare), results))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+from statistics import mean
+from time import perf_counter, thread_time
+from src.entities import MazeGrid, PathfindingService
+from src.entities.pathfinding_workers import PathfindingWorkerPool, PathfindingWorkerKind
+from .astar_benchmark import BENCHMARK_SEED, loadLayoutGrids, getFloorQueries
+
+BENCHMARK_FRAME_COUNT: int = 120
+BENCHMARK_REQUESTS_PER_FRAME: int = 4
+BENCHMARK_RENDER_WORK: int = 40000
+
+def simulateRenderWork() -> int:
+    # ? Stands in for the Draw Calls the Workers Should Overlap With
+    total: int = 0
+    for value in range(BENCHMARK_RENDER_WORK):
+        total += value * value
+
+    return total
+
+def benchmarkService(name: str, service: PathfindingService, grid: MazeGrid) -> None:
+    service.reset(grid)
+    queries = getFloorQueries(grid, BENCHMARK_FRAME_COUNT * BENCHMARK_REQUESTS_PER_FRAME, BENCHMARK_SEED)
+
+    pathfinding_times: list[float] = []
+    frame_times: list[float] = []
+    futures = []
+
+    for frame_index in range(BENCHMARK_FRAME_COUNT):
+        frame_start: float = perf_counter()
+        pathfinding_start: float = thread_time()
+
+        for query_index in range(BENCHMARK_REQUESTS_PER_FRAME):
+            futures.append(service.requestPath(*queries[frame_index * BENCHMARK_REQUESTS_PER_FRAME + query_index]))
+
+        service.update()
+        pathfinding_times.append(thread_time() - pathfinding_start)
+
+        simulateRenderWork()
+        frame_times.append(perf_counter() - frame_start)
+
+    # ? Drain Whatever is Still in Flight so Every Mode Does the Same Work
+    drain_frames: int = 0
+    while not all(future.done() for future in futures):
+        service.update()
+        drain_frames += 1
+
+    print(
+        f"{name:<10}{mean(pathfinding_times) * 1e3:>14.3f}{max(pathfinding_times) * 1e3:>12.3f}"
+        f"{mean(frame_times) * 1e3:>12.3f}{drain_frames:>14}"
+    )
+
+def main() -> None:
+    _, grid = loadLayoutGrids()[0]
+
+    print(f"cpu count: {os.cpu_count()}, {BENCHMARK_REQUESTS_PER_FRAME} uncached requests per frame")
+    print(f"{'mode':<10}{'main ms/frm':>14}{'main max':>12}{'frame ms':>12}{'drain updates':>14}")
+
+    # ? An Unbounded Budget Measures Full Searches on the Main Thread
+    benchmarkService("inline", PathfindingService(expansion_budget=1 << 30), grid)
+
+    for worker_kind in PathfindingWorkerKind:
+        worker_pool: PathfindingWorkerPool = PathfindingWorkerPool(worker_kind)
+
+        try:
+            service: PathfindingService = PathfindingService(worker_pool=worker_pool)
+
+            # ? Warm the Workers so Process Start-Up Stays Out of the Numbers
+            worker_pool.publish(grid)
+            for future in [worker_pool.submit(*query) for query in getFloorQueries(grid, 8, BENCHMARK_SEED + 1)]:
+                future.result()
+
+            benchmarkService(worker_kind.name.lower(), service, grid)
+        finally:
+            worker_pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+import os
+import json
+import argparse
+import tempfile
+import numpy as np
+import pygame as pg
+from random import Random
+from time import perf_counter
+from dataclasses import dataclass, asdict, field
+from src.core import GameContext, Input, VirtualJoystick, createHeadlessContext, seedRandomStreams
+from src.core.application import SIMULATION_STEP
+from src.scenes import Scene, MenuScene, FadeScene, GameScene, ConclusionScene, shared_config
+from src.scenes.game_scene import GAME_DURATION
+from src.entities.maze_manager import MAZE_LAYOUT_FOLDER_PATH
+from .astar_benchmark import BENCHMARK_SEED
+from .timing import getEnvironment, formatTime
+from .entity_store_benchmark import CrowdedGameScene
+
+SCENARIO_SUITE_NAME: str = "scenario"
+SCENARIO_REPORT_VERSION: int = 2
+SCENARIO_LAYOUT_NAME: str = "lvl_0.png"
+SCENARIO_BASELINE_PATH: str = "./benchmarks/baselines/scenario_baseline.json"
+
+# ? The Cabinets Present at 60 Hz, so a Frame's Update and Draw Must Fit in One Refresh
+SCENARIO_FRAME_BUDGET: float = 1.0 / 60.0
+SCENARIO_PERCENTILES: tuple[float, ...] = (50.0, 95.0, 99.0)
+
+# ? A Tail Percentile Must Grow by More Than This Before a Run Counts as a Regression
+SCENARIO_REGRESSION_TOLERANCE: float = 0.1
+
+# ? Changes Smaller Than This Share of the Frame Budget Are Noise, Whatever Their Ratio
+SCENARIO_NEGLIGIBLE_FRACTION: float = 0.02
+
+# ? One Run's p99 Rests on a Handful of Frames, so Verdicts Need Every Repeat to Agree
+SCENARIO_REPEAT_COUNT: int = 3
+
+SCENARIO_MENU_PRESS_TIME: float = 1.0
+SCENARIO_STICK_HOLD_TIME: float = 0.5
+SCENARIO_FLOOR_CODE: int = 0xFFFFFF
+
+@dataclass
+class ScenarioConfig:
+    name: str
+
+    # ? Cycles Through Chasers, Birds and Nobodies on Top of the Usual Four Enemies
+    extra_enemy_count: int = 0
+
+    # ? The Layout Tiled This Many Times per Axis, With Doorways Cut Through the Seams
+    grid_scale: int = 1
+
+SCENARIO_CONFIGS: tuple[ScenarioConfig, ...] = (
+    ScenarioConfig("standard"),
+    ScenarioConfig("crowded", extra_enemy_count=64),
+    ScenarioConfig("large_grid", grid_scale=2)
+)
+
+@dataclass
+class FrameTimeStats:
+    name: str
+    frame_count: int
+    p50: float
+    p95: float
+    p99: float
+    worst: float
+    mean: float
+    over_budget_count: int
+
+    # ? The Lowest and Highest p99 Across Repeated Runs; Equal to p99 for a Single Run
+    p99_low: float
+    p99_high: float
+
+@dataclass
+class ScenarioResult:
+    name: str
+    stats: list[FrameTimeStats] = field(default_factory=list)
+
+    # ? Entering Runs Once Between Frames, Like a Layout Load, so it is Reported Apart
+    enter_times: dict[str, float] = field(default_factory=dict)
+
+class ScriptedInput:
+    def __init__(self, seed: int) -> None:
+        self.random: Random = Random(seed)
+        self.hold_time: float = 0.0
+
+    def drive(self, scene: Scene, scene_time: float, red_joystick: VirtualJoystick, blue_joystick: VirtualJoystick) -> None:
+        # ? START Leaves the Menu, Then Stays Released so the Conclusion Waits Out its Pause
+        is_pressing_start: bool = isinstance(scene, MenuScene) and scene_time >= SCENARIO_MENU_PRESS_TIME
+        red_joystick.setButton(Input.START_BUTTON, is_pressing_start)
+        blue_joystick.setButton(Input.START_BUTTON, is_pressing_start)
+
+        if not isinstance(scene, GameScene):
+            return
+
+        self.hold_time -= SIMULATION_STEP
+        if self.hold_time > 0.0:
+            return
+
+        self.hold_time = SCENARIO_STICK_HOLD_TIME
+        for joystick in (red_joystick, blue_joystick):
+            joystick.setAxis(Input.LEFT_STICK_X_AXIS, self.random.uniform(-1.0, 1.0))
+            joystick.setAxis(Input.LEFT_STICK_Y_AXIS, self.random.uniform(-1.0, 1.0))
+
+def isFloorColour(colour: pg.Color) -> bool:
+    return colour.r == 255
+
+def buildTiledLayout(layout_file_path: str, grid_scale: int, folder_path: str) -> str:
+    column_count, row_count = shared_config.GRID_COLUMN_COUNT, shared_config.GRID_ROW_COUNT
+    layout: pg.Surface = pg.image.load(layout_file_path)
+
+    tiled_layout: pg.Surface = pg.Surface((column_count * grid_scale, row_count * grid_scale))
+    for tile_x in range(grid_scale):
+        for tile_y in range(grid_scale):
+            tiled_layout.blit(layout, (tile_x * column_count, tile_y * row_count), (0, 0, column_count, row_count))
+
+    # ? Neighbouring Tiles Meet Across Two Border Walls; Open Them Wherever Floor Faces Floor
+    for seam in range(1, grid_scale):
+        seam_x: int = seam * column_count
+        for y in range(row_count * grid_scale):
+            if isFloorColour(tiled_layout.get_at((seam_x - 2, y))) and isFloorColour(tiled_layout.get_at((seam_x + 1, y))):
+                tiled_layout.set_at((seam_x - 1, y), SCENARIO_FLOOR_CODE)
+                tiled_layout.set_at((seam_x, y), SCENARIO_FLOOR_CODE)
+
+        seam_y: int = seam * row_count
+        for x in range(column_count * grid_scale):
+            if isFloorColour(tiled_layout.get_at((x, seam_y - 2))) and isFloorColour(tiled_layout.get_at((x, seam_y + 1))):
+                tiled_layout.set_at((x, seam_y - 1), SCENARIO_FLOOR_CODE)
+                tiled_layout.set_at((x, seam_y), SCENARIO_FLOOR_CODE)
+
+    tiled_layout_path: str = os.path.join(folder_path, f"x{grid_scale}_{os.path.basename(layout_file_path)}")
+    pg.image.save(tiled_layout, tiled_layout_path)
+
+    return tiled_layout_path
+
+def summarizeFrames(name: str, frame_times: list[float], frame_budget: float) -> FrameTimeStats:
+    times: np.ndarray = np.asarray(frame_times, dtype=np.float64)
+    p50, p95, p99 = np.percentile(times, SCENARIO_PERCENTILES).tolist()
+
+    return FrameTimeStats(
+        name,
+        len(times),
+        p50,
+        p95,
+        p99,
+        float(times.max()),
+        float(times.mean()),
+        int(np.count_nonzero(times > frame_budget)),
+        p99,
+        p99
+    )
+
+def mergeRepeats(repeats: list[ScenarioResult]) -> ScenarioResult:
+    # ? Medians of the Per-Run Percentiles, Keeping the Spread of p99 for Comparisons
+    merged: ScenarioResult = ScenarioResult(repeats[0].name)
+
+    for index, stats in enumerate(repeats[0].stats):
+        runs: list[FrameTimeStats] = [repeat.stats[index] for repeat in repeats]
+        p99s: list[float] = [run.p99 for run in runs]
+
+        merged.stats.append(FrameTimeStats(
+            stats.name,
+            sum(run.frame_count for run in runs),
+            float(np.median([run.p50 for run in runs])),
+            float(np.median([run.p95 for run in runs])),
+            float(np.median(p99s)),
+            max(run.worst for run in runs),
+            sum(run.mean * run.frame_count for run in runs) / sum(run.frame_count for run in runs),
+            sum(run.over_budget_count for run in runs),
+            min(p99s),
+            max(p99s)
+        ))
+
+    for scene_name in repeats[0].enter_times:
+        merged.enter_times[scene_name] = float(np.median([repeat.enter_times[scene_name] for repeat in repeats]))
+
+    return merged
+
+def runScenario(config: ScenarioConfig, context: GameContext, game_duration: float, frame_budget: float) -> ScenarioResult:
+    red_joystick, blue_joystick = context.red_joystick, context.blue_joystick
+    assert isinstance(red_joystick, VirtualJoystick) and isinstance(blue_joystick, VirtualJoystick)
+
+    column_count, row_count = shared_config.GRID_COLUMN_COUNT, shared_config.GRID_ROW_COUNT
+    result: ScenarioResult = ScenarioResult(config.name)
+
+    with tempfile.TemporaryDirectory() as folder_path:
+        layout_file_path: str = os.path.join(MAZE_LAYOUT_FOLDER_PATH, SCENARIO_LAYOUT_NAME)
+        if config.grid_scale > 1:
+            layout_file_path = buildTiledLayout(layout_file_path, config.grid_scale, folder_path)
+
+        # ? Grid Sizes Are Read When Mazes and Surfaces Are Built, so Scale Them First
+        shared_config.GRID_COLUMN_COUNT = column_count * config.grid_scale
+        shared_config.GRID_ROW_COUNT = row_count * config.grid_scale
+
+        conclusion_scene: ConclusionScene = ConclusionScene(context, None)
+        game_scene: CrowdedGameScene = CrowdedGameScene(context, conclusion_scene, config.extra_enemy_count)
+        game_scene.maze_manager.layout_file_paths = [layout_file_path]
+
+        scenes: list[Scene] = [MenuScene(context), FadeScene(context), game_scene, conclusion_scene]
+        script: ScriptedInput = ScriptedInput(BENCHMARK_SEED)
+
+        try:
+            for scene in scenes:
+                # ? The Crowded Subclass Reports Under the Scene it Stands In For
+                scene_name: str = GameScene.__name__ if scene is game_scene else type(scene).__name__
+                if scene is game_scene:
+                    seedRandomStreams(BENCHMARK_SEED)
+
+                enter_start_time: float = perf_counter()
+                scene.enter()
+                result.enter_times[scene_name] = perf_counter() - enter_start_time
+
+                if scene is game_scene:
+                    game_scene.game_time = game_duration
+
+                update_times: list[float] = []
+                draw_times: list[float] = []
+                frame_times: list[float] = []
+                scene_time: float = 0.0
+
+                while True:
+                    script.drive(scene, scene_time, red_joystick, blue_joystick)
+
+                    frame_start_time: float = perf_counter()
+                    scene.update(SIMULATION_STEP)
+                    update_end_time: float = perf_counter()
+
+                    context.render_surface.fill((0, 0, 0))
+                    scene.interpolate(1.0)
+                    scene.draw(context.render_surface)
+                    draw_end_time: float = perf_counter()
+
+                    update_times.append(update_end_time - frame_start_time)
+                    draw_times.append(draw_end_time - update_end_time)
+                    frame_times.append(draw_end_time - frame_start_time)
+                    scene_time += SIMULATION_STEP
+
+                    if scene.shouldTransition():
+                        scene.exit()
+                        break
+
+                result.stats.append(summarizeFrames(f"{config.name}/{scene_name}/update", update_times, frame_budget))
+                result.stats.append(summarizeFrames(f"{config.name}/{scene_name}/draw", draw_times, frame_budget))
+                result.stats.append(summarizeFrames(f"{config.name}/{scene_name}/frame", frame_times, frame_budget))
+        finally:
+            game_scene.release()
+            shared_config.GRID_COLUMN_COUNT, shared_config.GRID_ROW_COUNT = column_count, row_count
+
+    return result
+
+def writeScenarioReport(path: str, results: list[ScenarioResult], frame_budget: float) -> None:
+    folder_path: str = os.path.dirname(path)
+    if folder_path:
+        os.makedirs(folder_path, exist_ok=True)
+
+    with open(path, "w") as file:
+        json.dump({
+            "version": SCENARIO_REPORT_VERSION,
+            "suite": SCENARIO_SUITE_NAME,
+            "environment": getEnvironment(),
+            "frame_budget": frame_budget,
+            "scenarios": [asdict(result) for result in results]
+        }, file, indent=2)
+
+def loadScenarioReport(path: str) -> list[ScenarioResult]:
+    with open(path, "r") as file:
+        report: dict = json.load(file)
+
+    assert report.get("version") == SCENARIO_REPORT_VERSION, f"{path} has an unsupported scenario report version"
+    return [
+        ScenarioResult(
+            scenario["name"],
+            [FrameTimeStats(**stats) for stats in scenario["stats"]],
+            scenario["enter_times"]
+        )
+        for scenario in report["scenarios"]
+    ]
+
+def printScenarioResults(results: list[ScenarioResult], frame_budget: float) -> None:
+    print(f"{'scenario/scene/phase':<36}{'frames':>8}{'p50':>12}{'p95':>12}{'p99':>12}{'worst':>12}{'over':>7}")
+
+    for result in results:
+        for stats in result.stats:
+            print(
+                f"{stats.name:<36}{stats.frame_count:>8}{formatTime(stats.p50):>12}{formatTime(stats.p95):>12}"
+                f"{formatTime(stats.p99):>12}{formatTime(stats.worst):>12}{stats.over_budget_count:>7}"
+            )
+
+        for scene_name, enter_time in result.enter_times.items():
+            enter_name: str = f"{result.name}/{scene_name}/enter"
+            print(f"{enter_name:<36}{1:>8}{formatTime(enter_time):>12}")
+
+        game_frames: FrameTimeStats | None = next((stats for stats in result.stats if stats.name.endswith("GameScene/frame")), None)
+        if not game_frames is None:
+            verdict: str = "holds" if game_frames.p99 <= frame_budget else "MISSES"
+            print(f"{result.name}: {verdict} {1.0 / frame_budget:.0f} fps at p99 ({formatTime(game_frames.p99)})")
+
+        print()
+
+def printScenarioComparisons(baseline: list[ScenarioResult], current: list[ScenarioResult], frame_budget: float) -> None:
+    baseline_stats: dict[str, FrameTimeStats] = {stats.name: stats for result in baseline for stats in result.stats}
+    negligible_time: float = frame_budget * SCENARIO_NEGLIGIBLE_FRACTION
+
+    print(f"{'scenario/scene/phase':<36}{'base p99':>12}{'p99':>12}{'ratio':>9}{'p99 range':>26}  verdict")
+
+    for result in current:
+        for stats in result.stats:
+            previous: FrameTimeStats | None = baseline_stats.get(stats.name)
+            if previous is None or previous.p99 <= 0.0:
+                continue
+
+            # ? Slower Only When Every Repeat Lost to Every Baseline Repeat by a Margin That Matters
+            ratio: float = stats.p99 / previous.p99
+            verdict: str = "same"
+            if abs(stats.p99 - previous.p99) >= negligible_time:
+                if stats.p99_low > previous.p99_high * (1.0 + SCENARIO_REGRESSION_TOLERANCE):
+                    verdict = "SLOWER"
+                elif stats.p99_high < previous.p99_low * (1.0 - SCENARIO_REGRESSION_TOLERANCE):
+                    verdict = "faster"
+
+            p99_range: str = f"{formatTime(stats.p99_low)} - {formatTime(stats.p99_high)}"
+            print(
+                f"{stats.name:<36}{formatTime(previous.p99):>12}{formatTime(stats.p99):>12}{ratio:>8.2f}x"
+                f"{p99_range:>26}  {verdict}"
+            )
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Time whole-game scenarios frame by frame")
+    parser.add_argument("--scenario", action="append", choices=[config.name for config in SCENARIO_CONFIGS], help="run only these scenarios")
+    parser.add_argument("--game-seconds", type=float, default=GAME_DURATION, help="length of the match in each scenario")
+    parser.add_argument("--budget-fps", type=float, default=1.0 / SCENARIO_FRAME_BUDGET)
+    parser.add_argument("--repeats", type=int, default=SCENARIO_REPEAT_COUNT, help="runs per scenario, merged into one result")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a previous JSON report")
+    parser.add_argument("--baseline", action="store_true", help="compare against the stored release baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the release baseline")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if arguments.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    frame_budget: float = 1.0 / arguments.budget_fps
+    context: GameContext = createHeadlessContext()
+
+    results: list[ScenarioResult] = [
+        mergeRepeats([runScenario(config, context, arguments.game_seconds, frame_budget) for _ in range(arguments.repeats)])
+        for config in SCENARIO_CONFIGS
+        if arguments.scenario is None or config.name in arguments.scenario
+    ]
+
+    printScenarioResults(results, frame_budget)
+
+    if not arguments.output is None:
+        writeScenarioReport(arguments.output, results, frame_budget)
+
+    compare_path: str | None = SCENARIO_BASELINE_PATH if arguments.baseline else arguments.compare
+    if not compare_path is None:
+        printScenarioComparisons(loadScenarioReport(compare_path), results, frame_budget)
+
+    if arguments.save_baseline:
+        writeScenarioReport(SCENARIO_BASELINE_PATH, results, frame_budget)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import gc
+import json
+import math
+import platform
+import subprocess
+import numpy as np
+import pygame as pg
+from typing import Callable
+from time import perf_counter_ns
+from datetime import datetime, timezone
+from statistics import mean, median, stdev
+from dataclasses import dataclass, asdict
+
+BENCHMARK_REPORT_VERSION: int = 1
+
+TIMING_WARMUP_TIME: float = 0.2
+TIMING_MIN_SAMPLE_TIME: float = 0.02
+TIMING_SAMPLE_COUNT: int = 25
+
+# ? Two-Sided 95% Normal Quantile, Used for the Rank Bounds Around the Median
+TIMING_CONFIDENCE_Z: float = 1.96
+
+@dataclass
+class BenchmarkStats:
+    name: str
+    unit: str
+
+    # ? Calls per Sample, Chosen so Each Sample Outlasts the Timer's Noise; Times Are per Operation
+    loop_count: int
+    sample_count: int
+
+    median: float
+    mean: float
+    stdev: float
+    minimum: float
+    maximum: float
+    iqr: float
+
+    # ? Distribution-Free Confidence Interval for the Median, From Order Statistics
+    median_low: float
+    median_high: float
+
+@dataclass
+class BenchmarkComparison:
+    name: str
+    baseline_median: float
+    current_median: float
+    ratio: float
+
+    # ? Only Called a Change When the Two Median Intervals Do Not Overlap
+    is_significant: bool
+
+def calibrateLoopCount(function: Callable[[], object], min_sample_time: float) -> int:
+    loop_count: int = 1
+
+    while True:
+        start_time: int = perf_counter_ns()
+        for _ in range(loop_count):
+            function()
+        elapsed_time: float = (perf_counter_ns() - start_time) * 1e-9
+
+        if elapsed_time >= min_sample_time:
+            return loop_count
+
+        # ? Jump Straight to the Estimate, Padded so One More Round Usually Suffices
+        if elapsed_time > 0.0:
+            loop_count = max(loop_count * 2, int(loop_count * min_sample_time * 1.2 / elapsed_time))
+        else:
+            loop_count *= 10
+
+def summarize(name: str, samples: list[float], loop_count: int, unit: str = "s") -> BenchmarkStats:
+    ordered: list[float] = sorted(samples)
+    count: int = len(ordered)
+
+    # ? One-Based Ranks n/2 - z*sqrt(n)/2 and 1 + n/2 + z*sqrt(n)/2, Shifted to Zero-Based
+    spread: float = TIMING_CONFIDENCE_Z * math.sqrt(count) * 0.5
+    low_rank: int = max(0, math.floor(count * 0.5 - spread) - 1)
+    high_rank: int = min(count - 1, math.ceil(1.0 + count * 0.5 + spread) - 1)
+
+    first_quartile, _, third_quartile = np.percentile(ordered, (25.0, 50.0, 75.0)).tolist()
+
+    return BenchmarkStats(
+        name,
+        unit,
+        loop_count,
+        count,
+        median(ordered),
+        mean(ordered),
+        stdev(ordered) if count > 1 else 0.0,
+        ordered[0],
+        ordered[-1],
+        third_quartile - first_quartile,
+        ordered[low_rank],
+        ordered[high_rank]
+    )
+
+def measure(
+    name: str,
+    function: Callable[[], object],
+    operation_count: int = 1,
+    sample_count: int = TIMING_SAMPLE_COUNT,
+    warmup_time: float = TIMING_WARMUP_TIME,
+    min_sample_time: float = TIMING_MIN_SAMPLE_TIME
+) -> BenchmarkStats:
+    # ? Warm Caches, Lazy Tables and the Allocator Before Anything Counts
+    warmup_end: int = perf_counter_ns() + int(warmup_time * 1e9)
+    while perf_counter_ns() < warmup_end:
+        function()
+
+    loop_count: int = calibrateLoopCount(function, min_sample_time)
+    samples: list[float] = []
+
+    # ? A Collection Landing in One Sample Would Read as Noise in the Code Under Test
+    gc_was_enabled: bool = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(sample_count):
+            start_time: int = perf_counter_ns()
+            for _ in range(loop_count):
+                function()
+            samples.append((perf_counter_ns() - start_time) * 1e-9 / (loop_count * operation_count))
+
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return summarize(name, samples, loop_count)
+
+def getGitRevision() -> str | None:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "--short", "HEAD"),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def getEnvironment() -> dict[str, str | None]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": getGitRevision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "pygame": pg.version.ver
+    }
+
+def writeReport(path: str, suite: str, results: list[BenchmarkStats]) -> None:
+    with open(path, "w") as file:
+        json.dump({
+            "version": BENCHMARK_REPORT_VERSION,
+            "suite": suite,
+            "environment": getEnvironment(),
+            "results": [asdict(result) for result in results]
+        }, file, indent=2)
+
+def loadReport(path: str) -> list[BenchmarkStats]:
+    with open(path, "r") as file:
+        report: dict = json.load(file)
+
+    assert report.get("version") == BENCHMARK_REPORT_VERSION, f"{path} has an unsupported benchmark report version"
+    return [BenchmarkStats(**result) for result in report["results"]]
+
+def compareResults(baseline: list[BenchmarkStats], current: list[BenchmarkStats]) -> list[BenchmarkComparison]:
+    baseline_by_name: dict[str, BenchmarkStats] = {result.name: result for result in baseline}
+    comparisons: list[BenchmarkComparison] = []
+
+    for result in current:
+        previous: BenchmarkStats | None = baseline_by_name.get(result.name)
+        if previous is None or previous.median <= 0.0:
+            continue
+
+        comparisons.append(BenchmarkComparison(
+            result.name,
+            previous.median,
+            result.median,
+            result.median / previous.median,
+            result.median_low > previous.median_high or result.median_high < previous.median_low
+        ))
+
+    return comparisons
+
+def formatTime(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.3f} us"
+
+    return f"{seconds * 1e9:.1f} ns"
+
+def printResults(results: list[BenchmarkStats]) -> None:
+    print(f"{'benchmark':<40}{'median':>14}{'95% ci':>28}{'iqr':>12}{'loops':>8}")
+
+    for result in results:
+        interval: str = f"{formatTime(result.median_low)} - {formatTime(result.median_high)}"
+        print(
+            f"{result.name:<40}{formatTime(result.median):>14}{interval:>28}"
+            f"{formatTime(result.iqr):>12}{result.loop_count:>8}"
+        )
+
+def printComparisons(comparisons: list[BenchmarkComparison]) -> None:
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'ratio':>9}  verdict")
+
+    for comparison in comparisons:
+        verdict: str = "same"
+        if comparison.is_significant:
+            verdict = "faster" if comparison.ratio < 1.0 else "SLOWER"
+
+        print(
+            f"{comparison.name:<40}{formatTime(comparison.baseline_median):>14}"
+            f"{formatTime(comparison.current_median):>14}{comparison.ratio:>8.2f}x  {verdict}"
+        )
@@ -0,0 +1,52 @@
+import argparse
+from src import runHeadless, HeadlessCreateInfo, HeadlessReport, runReplay, ReplayCreateInfo, ReplayReport
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Run matches without a display or joysticks")
+    parser.add_argument("--matches", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=60.0, help="simulation steps per simulated second")
+    parser.add_argument("--draw", action="store_true", help="also draw every step into an offscreen canvas")
+    parser.add_argument("--record", metavar="PATH", help="write the matches to a replay log")
+    parser.add_argument("--replay", metavar="PATH", help="replay a log instead of running new matches")
+    parser.add_argument("--start", type=int, default=0, help="first replayed frame that is timed")
+    parser.add_argument("--end", type=int, default=None, help="frame the replay stops before")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if not arguments.replay is None:
+        replay_report: ReplayReport = runReplay(ReplayCreateInfo(
+            arguments.replay,
+            arguments.start,
+            arguments.end,
+            arguments.draw
+        ))
+
+        print(
+            f"{replay_report.frame_count} frames ({replay_report.skipped_frame_count} fast-forwarded), "
+            f"{replay_report.step_count} steps, {replay_report.recorded_time:.1f}s recorded replayed in "
+            f"{replay_report.wall_time:.2f}s ({replay_report.recorded_seconds_per_wall_second:.1f}x)"
+        )
+
+        if replay_report.divergent_frame is None:
+            print(f"{replay_report.checkpoint_count} checkpoints matched")
+        else:
+            print(f"diverged from the recording at frame {replay_report.divergent_frame}")
+
+        for slow_frame in replay_report.slow_frames:
+            print(
+                f"frame {slow_frame.frame_index}: recorded {slow_frame.recorded_delta * 1e3:.1f}ms, "
+                f"replayed {slow_frame.replayed_time * 1e3:.2f}ms"
+            )
+    else:
+        report: HeadlessReport = runHeadless(HeadlessCreateInfo(
+            arguments.matches,
+            1.0 / arguments.rate,
+            arguments.draw,
+            arguments.record
+        ))
+
+        print(
+            f"{report.match_count} matches, {report.step_count} steps, {report.draw_count} draws, "
+            f"{report.simulated_time:.1f}s simulated in {report.wall_time:.2f}s wall "
+            f"({report.simulated_seconds_per_wall_second:.1f} sim s / wall s)"
+        )
+        print(f"red scores {report.red_scores}, blue scores {report.blue_scores}")
@@ -1,7 +1,13 @@
+import argparse
 from src import main, ApplicationCreateInfo
 
 if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Medieval Farlands")
+    parser.add_argument("--record", metavar="PATH", help="write every match to a replay log")
+    arguments: argparse.Namespace = parser.parse_args()
+
     main(ApplicationCreateInfo(
         "Medieval Farlands",
-        (1568, 800)
-    ))
\ No newline at end of file
+        (1568, 800),
+        arguments.record
+    ))
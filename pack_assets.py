@@ -0,0 +1,4 @@
+from src.core import packAssets
+
+if __name__ == "__main__":
+    packAssets()
@@ -1,4 +1,4 @@
-from .core import init, run, shutdown, ApplicationCreateInfo
+from .core import init, run, shutdown, ApplicationCreateInfo, runHeadless, HeadlessCreateInfo, HeadlessReport, runReplay, ReplayCreateInfo, ReplayReport
 
 def main(create_info: ApplicationCreateInfo) -> None:
     init(create_info)
@@ -7,5 +7,11 @@ def main(create_info: ApplicationCreateInfo) -> None:
 
 __all__ = [
     "main",
-    "ApplicationCreateInfo"
+    "ApplicationCreateInfo",
+    "runHeadless",
+    "HeadlessCreateInfo",
+    "HeadlessReport",
+    "runReplay",
+    "ReplayCreateInfo",
+    "ReplayReport"
 ]
\ No newline at end of file
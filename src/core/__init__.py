@@ -1,16 +1,52 @@
-from .input import Input
+from .input import Input, VirtualJoystick
 from .game_context import GameContext
-from .assets import createFont, getTexture, getTextures
+from .random_streams import RandomStream, createRandomSeed, seedRandomStreams, getRandomStream
+from .assets import createFont, getTexture, getTextures, getTextureCacheStats, evictTextures, TextureCacheStats, loadLayout, packAssets
+from .rotation_cache import RotationCache, RotationCacheStats, getRotationCache, setRotationCache, getRotatedTexture
+from .text import GlyphAtlas, TextLabel, getGlyphAtlas
 from .application import init, run, shutdown, ApplicationCreateInfo
+from .replay import ReplayRecorder, ReplayLog, ReplayFrame, ReplayKeyframe, digestGameScene
+from .headless import runHeadless, runReplay, createHeadlessContext, HeadlessCreateInfo, HeadlessReport, ReplayCreateInfo, ReplayReport, ReplaySlowFrame
 
 __all__ = [
     "Input",
+    "VirtualJoystick",
     "GameContext",
+    "RandomStream",
+    "createRandomSeed",
+    "seedRandomStreams",
+    "getRandomStream",
     "createFont",
     "getTexture",
     "getTextures",
+    "getTextureCacheStats",
+    "evictTextures",
+    "TextureCacheStats",
+    "loadLayout",
+    "packAssets",
+    "RotationCache",
+    "RotationCacheStats",
+    "getRotationCache",
+    "setRotationCache",
+    "getRotatedTexture",
+    "GlyphAtlas",
+    "TextLabel",
+    "getGlyphAtlas",
     "init",
     "run",
     "shutdown",
-    "ApplicationCreateInfo"
+    "ApplicationCreateInfo",
+    "runHeadless",
+    "createHeadlessContext",
+    "HeadlessCreateInfo",
+    "HeadlessReport",
+    "ReplayRecorder",
+    "ReplayLog",
+    "ReplayFrame",
+    "ReplayKeyframe",
+    "digestGameScene",
+    "runReplay",
+    "ReplayCreateInfo",
+    "ReplayReport",
+    "ReplaySlowFrame"
 ]
\ No newline at end of file
@@ -1,26 +1,37 @@
 import pygame as pg
-from time import time
+from time import perf_counter
 from .input import Input
+from .assets import createFont
 from dataclasses import dataclass
 from .game_context import GameContext
+from .preloader import AssetPreloader
+from .replay import ReplayRecorder
 from ..scenes import Scene, MenuScene, FadeScene, GameScene, ConclusionScene
 
+# ? Lower the Simulation Rate on Weak Hardware; Drawing Still Runs Every Frame
+SIMULATION_RATE: float = 60.0
+SIMULATION_STEP: float = 1.0 / SIMULATION_RATE
+MAX_SIMULATION_STEPS: int = 5
+
 __scene_index: int = 0
 __scenes: list[Scene] = []
 __context: GameContext | None = None
+__recorder: ReplayRecorder | None = None
 
 @dataclass
 class ApplicationCreateInfo:
     title: str
     render_canvas_size: tuple[int, int]
 
+    # ? Records Every Match to a Replay Log so Field Sessions Can be Replayed Offline
+    replay_record_path: str | None = None
+
 def __pollJoystick__(is_red: bool) -> int:
     assert pg.font.get_init()
     assert pg.display.get_init()
     assert pg.joystick.get_init()
     
-    default_font_name: str = pg.font.get_default_font()
-    default_font: pg.font.FontType = pg.font.Font(default_font_name, 18)
+    default_font: pg.font.FontType = createFont(18, None)
     window_surface: pg.Surface = pg.display.get_surface()
 
     if is_red:
@@ -67,8 +78,28 @@ def __pollJoystick__(is_red: bool) -> int:
 
         wait_clock.tick(60.0)
 
+def __createMenuScene(context: GameContext) -> MenuScene:
+    return MenuScene(context)
+
+def __createGameScenes(context: GameContext) -> tuple[ConclusionScene, GameScene]:
+    conclusion_scene = ConclusionScene(context)
+    return (conclusion_scene, GameScene(context, conclusion_scene))
+
+def __enterScene(scene: Scene) -> None:
+    # ? Matches Are Seeded Before Entering, Since Entering Draws the Layout
+    if not __recorder is None and isinstance(scene, GameScene):
+        __recorder.beginMatch(scene)
+
+    scene.enter()
+
+def __exitScene(scene: Scene) -> None:
+    if not __recorder is None and __recorder.isRecordingMatch():
+        __recorder.endMatch()
+
+    scene.exit()
+
 def init(create_info: ApplicationCreateInfo) -> None:
-    global __context, __scene_index, __scenes
+    global __context, __recorder, __scene_index, __scenes
 
     print("Initializing Application")
 
@@ -85,20 +116,41 @@ def init(create_info: ApplicationCreateInfo) -> None:
     # ? Create Application Global State
     __context = GameContext(
         pg.display.set_mode(monitor_sizes[0], pg.FULLSCREEN | pg.SCALED, display=0),
-        pg.Surface(create_info.render_canvas_size),
-        pg.joystick.Joystick(__pollJoystick__(True)),
-        pg.joystick.Joystick(__pollJoystick__(False))
+        pg.Surface(create_info.render_canvas_size)
     )
 
+    # ? Build Game Scenes in the Background While Waiting for Joysticks
+    preloader = AssetPreloader()
+    menu_future = preloader.submit("menu_scene", __createMenuScene, __context)
+    game_future = preloader.submit("game_scenes", __createGameScenes, __context)
+    preloader.seal()
+
+    __context.red_joystick = pg.joystick.Joystick(__pollJoystick__(True))
+    __context.blue_joystick = pg.joystick.Joystick(__pollJoystick__(False))
+
     # ? Initialize Joysticks
     __context.red_joystick.init()
     __context.blue_joystick.init()
 
-    # ? Create Game Scenes
-    menu_scene = MenuScene(__context)
+    # ? Scenes Read the Recorder's Virtual Sticks, Fed From the Real Ones Each Frame
+    if not create_info.replay_record_path is None:
+        __recorder = ReplayRecorder(
+            create_info.replay_record_path,
+            SIMULATION_STEP,
+            __context.red_joystick,
+            __context.blue_joystick
+        )
+
+        __context.red_joystick = __recorder.red_joystick
+        __context.blue_joystick = __recorder.blue_joystick
+
+    # ? Collect Game Scenes
+    preloader.getCompletionFuture().result()
+    preloader.shutdown()
+
+    menu_scene: MenuScene = menu_future.result()
     fade_scene = FadeScene(__context)
-    conclusion_scene = ConclusionScene(__context)
-    game_scene = GameScene(__context, conclusion_scene)
+    conclusion_scene, game_scene = game_future.result()
 
     __scenes = [
         menu_scene,
@@ -124,7 +176,7 @@ def run() -> None:
 
     # ? Enter the First Scene
     active_scene: Scene = __scenes[__scene_index]
-    active_scene.enter()
+    __enterScene(active_scene)
 
     # ? Render Surface Resize Variables
     RENDER_WIDTH, RENDER_HEIGHT = __context.render_surface.get_size()
@@ -135,17 +187,20 @@ def run() -> None:
     canvas_width: int = 0
     canvas_height: int = 0
 
-    # ? Delta Time Initialization
+    # ? Fixed Timestep Initialization
     cur_frame_time: float = 0.0
-    delta_time: float = 0.0
+    frame_delta: float = 0.0
+    step_count: int = 0
+    accumulated_time: float = 0.0
 
-    last_frame_time: float = time()
+    last_frame_time: float = perf_counter()
 
     # ? Main Loop
     is_running: bool = True
     while is_running:
-        cur_frame_time = time()
-        delta_time = cur_frame_time - last_frame_time
+        cur_frame_time = perf_counter()
+        frame_delta = cur_frame_time - last_frame_time
+        accumulated_time += frame_delta
         last_frame_time = cur_frame_time
 
         for event in pg.event.get():
@@ -156,11 +211,30 @@ def run() -> None:
                 case _:
                     pass
 
-        active_scene.update(delta_time)
+        if not __recorder is None:
+            __recorder.sampleInput()
+
+        # ? Scenes Always Advance in Whole Steps, Catching Up at Most a Few per Frame
+        step_count = 0
+        while accumulated_time >= SIMULATION_STEP and step_count < MAX_SIMULATION_STEPS:
+            active_scene.update(SIMULATION_STEP)
+            accumulated_time -= SIMULATION_STEP
+            step_count += 1
+
+            if active_scene.shouldTransition():
+                break
+
+        # ? A Long Hitch Drops the Time it Could Not Catch Up Instead of Spiralling
+        if step_count == MAX_SIMULATION_STEPS:
+            accumulated_time = min(accumulated_time, SIMULATION_STEP)
+
+        if not __recorder is None and __recorder.isRecordingMatch():
+            __recorder.recordFrame(frame_delta, step_count)
 
         __context.window_surface.fill((0, 0, 0))
         __context.render_surface.fill((0, 0, 0))
 
+        active_scene.interpolate(min(accumulated_time / SIMULATION_STEP, 1.0))
         active_scene.draw(__context.render_surface)
 
         window_width, window_height = pg.display.get_window_size()
@@ -186,16 +260,32 @@ def run() -> None:
         pg.display.flip()
 
         if active_scene.shouldTransition():
-            active_scene.exit()
+            __exitScene(active_scene)
 
             __scene_index = (__scene_index + 1) % len(__scenes)
 
             active_scene = __scenes[__scene_index]
-            active_scene.enter()
+            __enterScene(active_scene)
+
+            # ? Time Spent Entering, Like Loading a Layout, is Not Simulated
+            accumulated_time = 0.0
+            last_frame_time = perf_counter()
 
 def shutdown() -> None:
+    global __recorder, __scenes
+
     print("Shutting Down Application")
 
+    # ? Release Scene-Owned Workers and Shared Memory Before Pygame Goes
+    for scene in set(__scenes):
+        scene.release()
+
+    __scenes = []
+
+    if not __recorder is None:
+        __recorder.close()
+        __recorder = None
+
     # ? Shutdown Pygame Modules
     pg.joystick.quit()
     pg.display.quit()
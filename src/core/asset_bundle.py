@@ -0,0 +1,181 @@
+import os
+import json
+import mmap
+import struct
+import pygame as pg
+from enum import IntEnum
+from dataclasses import dataclass
+
+ASSET_BUNDLE_MAGIC: bytes = b"MFAB"
+ASSET_BUNDLE_VERSION: int = 1
+ASSET_BUNDLE_ALIGNMENT: int = 16
+
+ASSET_BUNDLE_HEADER_FORMAT: str = "<4sII"
+ASSET_BUNDLE_HEADER_SIZE: int = struct.calcsize(ASSET_BUNDLE_HEADER_FORMAT)
+
+# ? Matches SDL's ARGB8888 Display Format on Little-Endian Machines
+ASSET_BUNDLE_IMAGE_FORMAT: str = "BGRA"
+ASSET_BUNDLE_LAYOUT_FORMAT: str = "RGB"
+
+class AssetKind(IntEnum):
+    IMAGE = 0
+    LAYOUT = 1
+    FONT = 2
+
+@dataclass
+class AssetBundleEntry:
+    kind: AssetKind
+    offset: int
+    size: int
+    width: int
+    height: int
+    format: str
+
+    # ? Modification Time and Size of the Loose File the Entry Was Packed From
+    source_mtime: int
+    source_size: int
+
+def alignBundleOffset(offset: int) -> int:
+    return (offset + ASSET_BUNDLE_ALIGNMENT - 1) // ASSET_BUNDLE_ALIGNMENT * ASSET_BUNDLE_ALIGNMENT
+
+def getBundleKey(path: str) -> str:
+    return os.path.normpath(path)
+
+def getSourceStamp(path: str) -> tuple[int, int] | None:
+    try:
+        source_stat: os.stat_result = os.stat(path)
+    except OSError:
+        return None
+
+    return (source_stat.st_mtime_ns, source_stat.st_size)
+
+def packAssetBundle(
+    output_path: str,
+    image_paths: list[str],
+    layout_paths: list[str],
+    font_paths: list[str]
+) -> None:
+    blobs: list[tuple[str, bytes, dict[str, object]]] = []
+
+    for image_path in image_paths:
+        image: pg.Surface = pg.image.load(image_path)
+        blobs.append((image_path, pg.image.tobytes(image, ASSET_BUNDLE_IMAGE_FORMAT), {
+            "kind": AssetKind.IMAGE,
+            "width": image.get_width(),
+            "height": image.get_height(),
+            "format": ASSET_BUNDLE_IMAGE_FORMAT
+        }))
+
+    for layout_path in layout_paths:
+        layout: pg.Surface = pg.image.load(layout_path)
+        blobs.append((layout_path, pg.image.tobytes(layout, ASSET_BUNDLE_LAYOUT_FORMAT), {
+            "kind": AssetKind.LAYOUT,
+            "width": layout.get_width(),
+            "height": layout.get_height(),
+            "format": ASSET_BUNDLE_LAYOUT_FORMAT
+        }))
+
+    for font_path in font_paths:
+        with open(font_path, "rb") as font_file:
+            blobs.append((font_path, font_file.read(), {
+                "kind": AssetKind.FONT,
+                "width": 0,
+                "height": 0,
+                "format": ""
+            }))
+
+    # ? Offsets Are Relative to the Start of the Data Section
+    data_offset: int = 0
+    toc: dict[str, dict[str, object]] = {}
+    for path, data, info in blobs:
+        data_offset = alignBundleOffset(data_offset)
+        source_mtime, source_size = getSourceStamp(path)
+        toc[getBundleKey(path)] = {
+            **info,
+            "offset": data_offset,
+            "size": len(data),
+            "source_mtime": source_mtime,
+            "source_size": source_size
+        }
+        data_offset += len(data)
+
+    toc_bytes: bytes = json.dumps(toc).encode("utf-8")
+    data_start: int = alignBundleOffset(ASSET_BUNDLE_HEADER_SIZE + len(toc_bytes))
+
+    with open(output_path, "wb") as bundle_file:
+        bundle_file.write(struct.pack(ASSET_BUNDLE_HEADER_FORMAT, ASSET_BUNDLE_MAGIC, ASSET_BUNDLE_VERSION, len(toc_bytes)))
+        bundle_file.write(toc_bytes)
+
+        for path, data, _ in blobs:
+            entry_start: int = data_start + toc[getBundleKey(path)]["offset"]
+            bundle_file.write(b"\0" * (entry_start - bundle_file.tell()))
+            bundle_file.write(data)
+
+class AssetBundle:
+    def __init__(self, bundle_path: str) -> None:
+        self.bundle_file = open(bundle_path, "rb")
+        self.mapping: mmap.mmap = mmap.mmap(self.bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view: memoryview = memoryview(self.mapping)
+
+        magic, version, toc_size = struct.unpack_from(ASSET_BUNDLE_HEADER_FORMAT, self.mapping, 0)
+        if magic != ASSET_BUNDLE_MAGIC or version != ASSET_BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported asset bundle: {bundle_path}")
+
+        toc_end: int = ASSET_BUNDLE_HEADER_SIZE + toc_size
+        toc: dict[str, dict[str, object]] = json.loads(bytes(self.view[ASSET_BUNDLE_HEADER_SIZE:toc_end]).decode("utf-8"))
+
+        data_start: int = alignBundleOffset(toc_end)
+        self.entries: dict[str, AssetBundleEntry] = {
+            key: AssetBundleEntry(
+                AssetKind(info["kind"]),
+                data_start + info["offset"],
+                info["size"],
+                info["width"],
+                info["height"],
+                info["format"],
+                info["source_mtime"],
+                info["source_size"]
+            )
+            for key, info in toc.items()
+        }
+
+    def __getData(self, path: str, kind: AssetKind) -> tuple[AssetBundleEntry, memoryview] | None:
+        entry: AssetBundleEntry | None = self.entries.get(getBundleKey(path))
+        if entry is None or entry.kind != kind:
+            return None
+
+        # ? An Edited Loose File Wins Over its Stale Packed Copy; a Missing One Leaves the Bundle in Charge
+        source_stamp: tuple[int, int] | None = getSourceStamp(path)
+        if not source_stamp is None and source_stamp != (entry.source_mtime, entry.source_size):
+            return None
+
+        return (entry, self.view[entry.offset:entry.offset + entry.size])
+
+    def __getSurface(self, path: str, kind: AssetKind) -> pg.Surface | None:
+        data = self.__getData(path, kind)
+        if data is None:
+            return None
+
+        entry, buffer = data
+
+        # ? Wraps the Mapped Pages Without Decoding; a Caller That Converts the Surface Pays for its Own Copy
+        return pg.image.frombuffer(buffer, (entry.width, entry.height), entry.format)
+
+    def getImage(self, path: str) -> pg.Surface | None:
+        return self.__getSurface(path, AssetKind.IMAGE)
+
+    def getLayout(self, path: str) -> pg.Surface | None:
+        return self.__getSurface(path, AssetKind.LAYOUT)
+
+    def getFontData(self, path: str) -> bytes | None:
+        data = self.__getData(path, AssetKind.FONT)
+        if data is None:
+            return None
+
+        return bytes(data[1])
+
+    def close(self) -> None:
+        self.view.release()
+        self.mapping.close()
+        self.bundle_file.close()
@@ -1,31 +1,166 @@
+import os
+import io
 import pygame as pg
+from threading import RLock
+from dataclasses import dataclass
+from .asset_bundle import AssetBundle, packAssetBundle
 
 __MASTER_TEXTURE_ATLAS_PATH: str = "./assets/spr_master_atlas.png"
 __PIXELIFY_SANS_REGULAR_PATH: str = "./assets/fonts/PixelifySans-Regular.ttf"
 
+__ASSET_FOLDER_PATH: str = "./assets/"
+__ASSET_BUNDLE_PATH: str = "./assets/assets.bundle"
+__MAZE_LAYOUT_FOLDER_NAME: str = "mazes"
+
 __DEFAULT_TILE_SIZE_WIDTH: int = 32
 __DEFAULT_TILE_SIZE_HEIGHT: int = 32
 __DEFAULT_TILE_SIZE: tuple[int, int] = (__DEFAULT_TILE_SIZE_WIDTH, __DEFAULT_TILE_SIZE_HEIGHT)
 
+@dataclass
+class TextureCacheStats:
+    source_hits: int
+    source_misses: int
+    texture_hits: int
+    texture_misses: int
+    source_count: int
+    texture_count: int
+
+__source_images: dict[str, pg.Surface] = {}
+__textures: dict[tuple[str, tuple[int, int], tuple[int, int]], pg.Surface] = {}
+
+# ? Guards the Caches and SDL_ttf Against Background Preloading
+__cache_lock: RLock = RLock()
+__font_lock: RLock = RLock()
+
+__fonts: dict[tuple[str | None, int], pg.font.FontType] = {}
+__font_data: dict[str, bytes] = {}
+
+__asset_bundle: AssetBundle | None = None
+__asset_bundle_checked: bool = False
+
+__source_hits: int = 0
+__source_misses: int = 0
+__texture_hits: int = 0
+__texture_misses: int = 0
+
+def __getAssetBundle() -> AssetBundle | None:
+    global __asset_bundle, __asset_bundle_checked
+
+    with __cache_lock:
+        if __asset_bundle_checked:
+            return __asset_bundle
+
+        __asset_bundle_checked = True
+
+        # ? Fall Back to Loose Files When No Bundle Was Packed
+        if os.path.isfile(__ASSET_BUNDLE_PATH):
+            try:
+                __asset_bundle = AssetBundle(__ASSET_BUNDLE_PATH)
+            except ValueError as error:
+                print(error)
+
+    return __asset_bundle
+
+def __getSourceKey(source_path: str) -> str:
+    return os.path.normpath(source_path)
+
+def __getSourceImage(source_key: str) -> pg.Surface:
+    global __source_hits, __source_misses
+
+    source_image: pg.Surface | None = __source_images.get(source_key)
+
+    if source_image is None:
+        __source_misses += 1
+
+        # ? Decode Each Source Image Only Once
+        asset_bundle: AssetBundle | None = __getAssetBundle()
+        if not asset_bundle is None:
+            source_image = asset_bundle.getImage(source_key)
+
+        if source_image is None:
+            source_image = pg.image.load(source_key)
+
+        source_image = source_image.convert_alpha()
+        __source_images[source_key] = source_image
+    else:
+        __source_hits += 1
+
+    return source_image
+
+def __getTile(source_key: str, indices: tuple[int, int], tile_size: tuple[int, int]) -> pg.Surface:
+    global __texture_hits, __texture_misses
+
+    with __cache_lock:
+        texture_key: tuple[str, tuple[int, int], tuple[int, int]] = (source_key, indices, tile_size)
+        texture: pg.Surface | None = __textures.get(texture_key)
+
+        if texture is None:
+            __texture_misses += 1
+
+            x_index, y_index = indices
+            width, height = tile_size
+
+            texture = __getSourceImage(source_key).subsurface((
+                x_index * width,
+                y_index * height,
+                width,
+                height
+            ))
+
+            __textures[texture_key] = texture
+        else:
+            __texture_hits += 1
+
+        return texture
+
+def __getFontData(path: str) -> bytes:
+    font_data: bytes | None = __font_data.get(path)
+
+    if font_data is None:
+        asset_bundle: AssetBundle | None = __getAssetBundle()
+        if not asset_bundle is None:
+            font_data = asset_bundle.getFontData(path)
+
+        if font_data is None:
+            with open(path, "rb") as font_file:
+                font_data = font_file.read()
+
+        __font_data[path] = font_data
+
+    return font_data
+
 def createFont(size: int, path: str | None = __PIXELIFY_SANS_REGULAR_PATH) -> pg.font.FontType:
-    return pg.font.Font(path, size)
+    with __font_lock:
+        font_key: tuple[str | None, int] = (None if path is None else os.path.normpath(path), size)
+        font: pg.font.FontType | None = __fonts.get(font_key)
+
+        # ? Read Each TTF Once and Share One Font Object per Size
+        if font is None:
+            if path is None:
+                font = pg.font.Font(None, size)
+            else:
+                font = pg.font.Font(io.BytesIO(__getFontData(font_key[0])), size)
+
+            __fonts[font_key] = font
+
+        return font
+
+def loadLayout(path: str) -> pg.Surface:
+    asset_bundle: AssetBundle | None = __getAssetBundle()
+
+    if not asset_bundle is None:
+        layout: pg.Surface | None = asset_bundle.getLayout(path)
+        if not layout is None:
+            return layout
+
+    return pg.image.load(path)
 
 def getTexture(
         indices: tuple[int, int] = (0, 0),
         tile_size: tuple[int, int] = __DEFAULT_TILE_SIZE,
         source_path: str = __MASTER_TEXTURE_ATLAS_PATH
 ) -> pg.Surface:
-    x_index, y_index = indices
-    width, height = tile_size
-
-    source_image: pg.Surface = pg.image.load(source_path).convert_alpha()
-
-    return source_image.subsurface((
-        x_index * width,
-        y_index * height,
-        width,
-        height
-    ))
+    return __getTile(__getSourceKey(source_path), indices, tile_size)
 
 def getTextures(
         row_count: int,
@@ -36,34 +171,62 @@ def getTextures(
         source_path: str = __MASTER_TEXTURE_ATLAS_PATH
 ) -> list[pg.Surface]:
     x_index, y_index = root_indices
-    width, height = tile_size
+    source_key: str = __getSourceKey(source_path)
 
-    source_image: pg.Surface = pg.image.load(source_path).convert_alpha()
-
-    texture_index: int = 0
-    textures: list[pg.Surface] = [pg.Surface((1, 1)) for _ in range(row_count * column_count)]
+    textures: list[pg.Surface] = []
 
     if in_row_order:
         for column_index in range(column_count):
             for row_index in range(row_count):
-                textures[texture_index] = source_image.subsurface((
-                    (x_index + column_index) * width,
-                    (y_index + row_index) * height,
-                    width,
-                    height
-                ))
-
-                texture_index += 1
+                textures.append(__getTile(source_key, (x_index + column_index, y_index + row_index), tile_size))
     else:
         for row_index in range(row_count):
             for column_index in range(column_count):
-                textures[texture_index] = source_image.subsurface((
-                    (x_index + column_index) * width,
-                    (y_index + row_index) * height,
-                    width,
-                    height
-                ))
+                textures.append(__getTile(source_key, (x_index + column_index, y_index + row_index), tile_size))
+
+    return textures
+
+def getTextureCacheStats() -> TextureCacheStats:
+    return TextureCacheStats(
+        __source_hits,
+        __source_misses,
+        __texture_hits,
+        __texture_misses,
+        len(__source_images),
+        len(__textures)
+    )
+
+def evictTextures(source_path: str | None = None) -> None:
+    # ? Textures Already Handed Out Keep Their Source Image Alive
+    with __cache_lock:
+        if source_path is None:
+            __source_images.clear()
+            __textures.clear()
+            return
+
+        source_key: str = __getSourceKey(source_path)
+        __source_images.pop(source_key, None)
+
+        for texture_key in [key for key in __textures if key[0] == source_key]:
+            del __textures[texture_key]
+
+def packAssets(output_path: str = __ASSET_BUNDLE_PATH) -> None:
+    image_paths: list[str] = []
+    layout_paths: list[str] = []
+    font_paths: list[str] = []
+
+    for folder_path, _, file_names in os.walk(__ASSET_FOLDER_PATH):
+        is_layout_folder: bool = os.path.basename(os.path.normpath(folder_path)) == __MAZE_LAYOUT_FOLDER_NAME
+
+        for file_name in sorted(file_names):
+            file_path: str = os.path.join(folder_path, file_name)
 
-                texture_index += 1
+            if file_name.endswith(".png"):
+                if is_layout_folder:
+                    layout_paths.append(file_path)
+                else:
+                    image_paths.append(file_path)
+            elif file_name.endswith(".ttf"):
+                font_paths.append(file_path)
 
-    return textures
\ No newline at end of file
+    packAssetBundle(output_path, image_paths, layout_paths, font_paths)
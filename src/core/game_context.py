@@ -1,10 +1,12 @@
 import pygame as pg
 from dataclasses import dataclass
+from .input import VirtualJoystick
 
 @dataclass
 class GameContext:
     window_surface: pg.Surface
     render_surface: pg.Surface
 
-    red_joystick: pg.joystick.JoystickType
-    blue_joystick: pg.joystick.JoystickType
\ No newline at end of file
+    # ? Joysticks Are Bound Once Each Player Presses START, or Virtual When Headless
+    red_joystick: pg.joystick.JoystickType | VirtualJoystick | None = None
+    blue_joystick: pg.joystick.JoystickType | VirtualJoystick | None = None
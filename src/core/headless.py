@@ -0,0 +1,227 @@
+import os
+import pygame as pg
+from typing import Callable
+from time import perf_counter
+from dataclasses import dataclass, field
+from .input import VirtualJoystick
+from .game_context import GameContext
+from .application import SIMULATION_STEP
+from .random_streams import seedRandomStreams
+from .replay import ReplayRecorder, ReplayLog, ReplayFrame, ReplayKeyframe, applyStick, digestGameScene
+from ..scenes import GameScene, ConclusionScene
+
+HEADLESS_VIDEO_DRIVER: str = "dummy"
+HEADLESS_RENDER_CANVAS_SIZE: tuple[int, int] = (1568, 800)
+
+@dataclass
+class HeadlessCreateInfo:
+    match_count: int = 1
+    simulation_step: float = SIMULATION_STEP
+
+    # ? Drawing Into the Offscreen Canvas is Optional; Skipping it Measures Simulation Alone
+    draw: bool = False
+
+    # ? Writes Each Step's Input and Every Match Seed to a Replay Log
+    record_path: str | None = None
+
+@dataclass
+class HeadlessReport:
+    match_count: int = 0
+    step_count: int = 0
+    draw_count: int = 0
+
+    simulated_time: float = 0.0
+    wall_time: float = 0.0
+    simulated_seconds_per_wall_second: float = 0.0
+
+    red_scores: list[int] = field(default_factory=list)
+    blue_scores: list[int] = field(default_factory=list)
+
+@dataclass
+class ReplayCreateInfo:
+    path: str
+
+    # ? Frames Before the Start Are Fast-Forwarded From the Nearest Keyframe Without Timing
+    start_frame: int = 0
+    end_frame: int | None = None
+
+    draw: bool = False
+
+    # ? Recorded Frames Longer Than This Are Reported With Their Replayed Cost
+    slow_frame_threshold: float = 2.0 * SIMULATION_STEP
+
+@dataclass
+class ReplaySlowFrame:
+    frame_index: int
+    recorded_delta: float
+    replayed_time: float
+
+@dataclass
+class ReplayReport:
+    frame_count: int = 0
+    step_count: int = 0
+    skipped_frame_count: int = 0
+
+    recorded_time: float = 0.0
+    wall_time: float = 0.0
+    recorded_seconds_per_wall_second: float = 0.0
+
+    checkpoint_count: int = 0
+    divergent_frame: int | None = None
+
+    slow_frames: list[ReplaySlowFrame] = field(default_factory=list)
+
+# ? Called Before Every Step to Drive the Virtual Joysticks
+HeadlessController = Callable[[GameScene, VirtualJoystick, VirtualJoystick], None]
+
+def createHeadlessContext() -> GameContext:
+    # ? Must be Set Before the Display Initializes to Take Effect; Overrides Any Driver the Shell Picked
+    os.environ["SDL_VIDEODRIVER"] = HEADLESS_VIDEO_DRIVER
+
+    pg.init()
+    pg.font.init()
+    pg.display.init()
+
+    return GameContext(
+        pg.display.set_mode(HEADLESS_RENDER_CANVAS_SIZE),
+        pg.Surface(HEADLESS_RENDER_CANVAS_SIZE),
+        VirtualJoystick(),
+        VirtualJoystick()
+    )
+
+def runHeadless(
+    create_info: HeadlessCreateInfo,
+    context: GameContext | None = None,
+    controller: HeadlessController | None = None
+) -> HeadlessReport:
+    if context is None:
+        context = createHeadlessContext()
+
+    red_joystick, blue_joystick = context.red_joystick, context.blue_joystick
+    assert isinstance(red_joystick, VirtualJoystick) and isinstance(blue_joystick, VirtualJoystick)
+
+    game_scene: GameScene = GameScene(context, ConclusionScene(context))
+    report: HeadlessReport = HeadlessReport()
+
+    # ? The Controller Keeps Driving its Sticks; the Scene Reads the Recorder's Quantized Copies
+    recorder: ReplayRecorder | None = None
+    if not create_info.record_path is None:
+        recorder = ReplayRecorder(create_info.record_path, create_info.simulation_step, red_joystick, blue_joystick)
+        context.red_joystick, context.blue_joystick = recorder.red_joystick, recorder.blue_joystick
+
+    start_time: float = perf_counter()
+
+    try:
+        for _ in range(create_info.match_count):
+            if not recorder is None:
+                recorder.beginMatch(game_scene)
+
+            game_scene.enter()
+
+            while not game_scene.shouldTransition():
+                if not controller is None:
+                    controller(game_scene, red_joystick, blue_joystick)
+
+                if not recorder is None:
+                    recorder.sampleInput()
+
+                game_scene.update(create_info.simulation_step)
+                report.step_count += 1
+
+                if not recorder is None:
+                    recorder.recordFrame(create_info.simulation_step, 1)
+
+                if create_info.draw:
+                    game_scene.interpolate(1.0)
+                    game_scene.draw(context.render_surface)
+                    report.draw_count += 1
+
+            # ? Scores are Read Directly; the Conclusion Scene Would Write the Highscore File
+            game_scene.exit()
+            report.red_scores.append(game_scene.red_player.getScore())
+            report.blue_scores.append(game_scene.blue_player.getScore())
+            report.match_count += 1
+
+            if not recorder is None:
+                recorder.endMatch()
+    finally:
+        game_scene.release()
+
+        if not recorder is None:
+            recorder.close()
+            context.red_joystick, context.blue_joystick = red_joystick, blue_joystick
+
+    report.wall_time = perf_counter() - start_time
+    report.simulated_time = report.step_count * create_info.simulation_step
+
+    if report.wall_time > 0.0:
+        report.simulated_seconds_per_wall_second = report.simulated_time / report.wall_time
+
+    return report
+
+def runReplay(create_info: ReplayCreateInfo, context: GameContext | None = None) -> ReplayReport:
+    if context is None:
+        context = createHeadlessContext()
+
+    red_joystick, blue_joystick = context.red_joystick, context.blue_joystick
+    assert isinstance(red_joystick, VirtualJoystick) and isinstance(blue_joystick, VirtualJoystick)
+
+    log: ReplayLog = ReplayLog(create_info.path)
+    end_frame: int = log.getFrameCount() if create_info.end_frame is None else min(create_info.end_frame, log.getFrameCount())
+
+    report: ReplayReport = ReplayReport()
+
+    keyframe: ReplayKeyframe | None = log.findKeyframe(create_info.start_frame)
+    if keyframe is None or create_info.start_frame >= end_frame:
+        return report
+
+    game_scene: GameScene = GameScene(context, ConclusionScene(context))
+
+    try:
+        for frame_index in range(keyframe.frame_index, end_frame):
+            match_start: ReplayKeyframe | None = log.getKeyframeAt(frame_index)
+            if not match_start is None:
+                seedRandomStreams(match_start.match_seed)
+                game_scene.enter()
+
+            frame: ReplayFrame = log.frames[frame_index]
+            applyStick(red_joystick, frame.red_stick)
+            applyStick(blue_joystick, frame.blue_stick)
+
+            is_timed: bool = frame_index >= create_info.start_frame
+            frame_start_time: float = perf_counter()
+
+            for _ in range(frame.step_count):
+                game_scene.update(log.simulation_step)
+
+            if is_timed and create_info.draw:
+                game_scene.interpolate(1.0)
+                game_scene.draw(context.render_surface)
+
+            frame_time: float = perf_counter() - frame_start_time
+
+            expected_digest: int | None = log.checkpoints.get(frame_index)
+            if not expected_digest is None:
+                report.checkpoint_count += 1
+
+                if report.divergent_frame is None and digestGameScene(game_scene) != expected_digest:
+                    report.divergent_frame = frame_index
+
+            if not is_timed:
+                report.skipped_frame_count += 1
+                continue
+
+            report.frame_count += 1
+            report.step_count += frame.step_count
+            report.recorded_time += frame.frame_delta
+            report.wall_time += frame_time
+
+            if frame.frame_delta > create_info.slow_frame_threshold:
+                report.slow_frames.append(ReplaySlowFrame(frame_index, frame.frame_delta, frame_time))
+    finally:
+        game_scene.release()
+
+    if report.wall_time > 0.0:
+        report.recorded_seconds_per_wall_second = report.recorded_time / report.wall_time
+
+    return report
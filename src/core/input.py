@@ -4,4 +4,31 @@ class Input(IntEnum):
     LEFT_STICK_X_AXIS = 0
     LEFT_STICK_Y_AXIS = 1
     
-    START_BUTTON = 9
\ No newline at end of file
+    START_BUTTON = 9
+
+VIRTUAL_JOYSTICK_AXIS_COUNT: int = 2
+VIRTUAL_JOYSTICK_BUTTON_COUNT: int = 10
+
+# ? Stands in for a pygame Joystick When Scenes Run Without Devices
+class VirtualJoystick:
+    def __init__(self) -> None:
+        self.axes: list[float] = [0.0] * VIRTUAL_JOYSTICK_AXIS_COUNT
+        self.buttons: list[bool] = [False] * VIRTUAL_JOYSTICK_BUTTON_COUNT
+
+    def init(self) -> None:
+        pass
+
+    def get_init(self) -> bool:
+        return True
+
+    def get_axis(self, axis: int) -> float:
+        return self.axes[axis]
+
+    def get_button(self, button: int) -> bool:
+        return self.buttons[button]
+
+    def setAxis(self, axis: int, value: float) -> None:
+        self.axes[axis] = max(-1.0, min(value, 1.0))
+
+    def setButton(self, button: int, is_pressed: bool) -> None:
+        self.buttons[button] = is_pressed
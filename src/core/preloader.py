@@ -0,0 +1,67 @@
+from threading import Lock
+from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_PRELOADER_WORKER_COUNT: int = 2
+
+class AssetPreloader:
+    def __init__(self, worker_count: int = DEFAULT_PRELOADER_WORKER_COUNT) -> None:
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(worker_count, "asset_preloader")
+
+        self.lock: Lock = Lock()
+        self.futures: dict[str, Future] = {}
+
+        self.is_sealed: bool = False
+        self.submitted_count: int = 0
+        self.completed_count: int = 0
+        self.completion_future: Future = Future()
+        self.completion_future.set_running_or_notify_cancel()
+
+    def __resolveIfComplete(self) -> None:
+        with self.lock:
+            is_complete: bool = self.is_sealed and self.completed_count == self.submitted_count
+
+            if is_complete and not self.completion_future.done():
+                self.completion_future.set_result(None)
+
+    def __onTaskDone(self, _: Future) -> None:
+        with self.lock:
+            self.completed_count += 1
+
+        self.__resolveIfComplete()
+
+    def submit(self, name: str, task: Callable[..., Any], *args: Any) -> Future:
+        assert not name in self.futures
+        assert not self.is_sealed
+
+        with self.lock:
+            self.submitted_count += 1
+
+        future: Future = self.executor.submit(task, *args)
+        self.futures[name] = future
+        future.add_done_callback(self.__onTaskDone)
+
+        return future
+
+    def seal(self) -> None:
+        # ? Completion Resolves Only After the Last Task is Submitted
+        with self.lock:
+            self.is_sealed = True
+
+        self.__resolveIfComplete()
+
+    def getFuture(self, name: str) -> Future:
+        return self.futures[name]
+
+    def getCompletionFuture(self) -> Future:
+        return self.completion_future
+
+    def getProgress(self) -> float:
+        with self.lock:
+            if self.submitted_count == 0:
+                return 1.0
+
+            return self.completed_count / self.submitted_count
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,25 @@
+import os
+from enum import IntEnum
+from random import Random
+
+RANDOM_SEED_BYTE_COUNT: int = 8
+
+class RandomStream(IntEnum):
+    MAZE_LAYOUT = 0
+    MAZE_TEXTURES = 1
+    SKINNY_BIRD = 2
+    NOBODY_ROLLY_POLLY = 3
+
+# ? One Generator per Subsystem, so Extra Draws in One Never Shift Another's Sequence
+__random_streams: list[Random] = [Random() for _ in RandomStream]
+
+def createRandomSeed() -> int:
+    return int.from_bytes(os.urandom(RANDOM_SEED_BYTE_COUNT), "little")
+
+def seedRandomStreams(seed: int) -> None:
+    # ? String Seeds Hash Through SHA-512, Stable Across Runs and Python Builds
+    for stream in RandomStream:
+        __random_streams[stream].seed(f"{seed}/{stream.name}")
+
+def getRandomStream(stream: RandomStream) -> Random:
+    return __random_streams[stream]
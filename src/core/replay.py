@@ -0,0 +1,224 @@
+import zlib
+import struct
+import pygame as pg
+from enum import IntEnum
+from bisect import bisect_right
+from typing import BinaryIO
+from dataclasses import dataclass
+from .input import VirtualJoystick, VIRTUAL_JOYSTICK_AXIS_COUNT, VIRTUAL_JOYSTICK_BUTTON_COUNT
+from .random_streams import createRandomSeed, seedRandomStreams
+from ..scenes import GameScene
+
+REPLAY_MAGIC: bytes = b"MZRP"
+REPLAY_VERSION: int = 1
+
+# ? Checkpoints Catch a Diverging Replay Within a Second Instead of at the Final Score
+REPLAY_CHECKPOINT_INTERVAL: int = 60
+
+# ? Axes Are Stored the Way SDL Reports Them, so the Recorded Run Sees the Same Values as the Replay
+REPLAY_AXIS_SCALE: float = 32767.0
+
+REPLAY_HEADER_STRUCT: struct.Struct = struct.Struct("<4sHd")
+REPLAY_KIND_STRUCT: struct.Struct = struct.Struct("<B")
+REPLAY_FRAME_STRUCT: struct.Struct = struct.Struct("<fBhhHhhH")
+REPLAY_KEYFRAME_STRUCT: struct.Struct = struct.Struct("<IQ")
+REPLAY_CHECKPOINT_STRUCT: struct.Struct = struct.Struct("<II")
+
+REPLAY_DIGEST_STRUCT: struct.Struct = struct.Struct("<dddddiiBB")
+
+class ReplayRecordKind(IntEnum):
+    FRAME = 0
+    KEYFRAME = 1
+    CHECKPOINT = 2
+
+# ? Stick Axes Then the Pressed Buttons as Bits
+StickSample = tuple[int, int, int]
+
+@dataclass
+class ReplayFrame:
+    # ? Wall Time the Recorded Frame Took; the Simulation Itself Only Sees Whole Steps
+    frame_delta: float
+    step_count: int
+    red_stick: StickSample
+    blue_stick: StickSample
+
+@dataclass
+class ReplayKeyframe:
+    frame_index: int
+    match_seed: int
+
+def sampleStick(joystick: pg.joystick.JoystickType | VirtualJoystick) -> StickSample:
+    axes: list[int] = [
+        round(max(-1.0, min(joystick.get_axis(axis), 1.0)) * REPLAY_AXIS_SCALE)
+        for axis in range(VIRTUAL_JOYSTICK_AXIS_COUNT)
+    ]
+
+    buttons: int = 0
+    for button in range(VIRTUAL_JOYSTICK_BUTTON_COUNT):
+        if joystick.get_button(button):
+            buttons |= 1 << button
+
+    return (axes[0], axes[1], buttons)
+
+def applyStick(joystick: VirtualJoystick, sample: StickSample) -> None:
+    for axis in range(VIRTUAL_JOYSTICK_AXIS_COUNT):
+        joystick.setAxis(axis, sample[axis] / REPLAY_AXIS_SCALE)
+
+    for button in range(VIRTUAL_JOYSTICK_BUTTON_COUNT):
+        joystick.setButton(button, bool(sample[2] & (1 << button)))
+
+def digestGameScene(game_scene: GameScene) -> int:
+    red_x, red_y = game_scene.red_player.getPosition()
+    blue_x, blue_y = game_scene.blue_player.getPosition()
+
+    digest: int = zlib.crc32(REPLAY_DIGEST_STRUCT.pack(
+        game_scene.game_time,
+        red_x, red_y,
+        blue_x, blue_y,
+        game_scene.red_player.getScore(),
+        game_scene.blue_player.getScore(),
+        game_scene.red_player.isDead(),
+        game_scene.blue_player.isDead()
+    ))
+
+    # ? Every Enemy Position Sits in the Shared Store, so Two Buffers Cover Them All
+    count: int = game_scene.entities.count
+    digest = zlib.crc32(game_scene.entities.position_x[:count].tobytes(), digest)
+    digest = zlib.crc32(game_scene.entities.position_y[:count].tobytes(), digest)
+
+    return zlib.crc32(game_scene.maze_manager.props.records[:game_scene.maze_manager.props.getCount()].tobytes(), digest)
+
+class ReplayRecorder:
+    def __init__(
+        self,
+        path: str,
+        simulation_step: float,
+        red_joystick: pg.joystick.JoystickType | VirtualJoystick,
+        blue_joystick: pg.joystick.JoystickType | VirtualJoystick
+    ) -> None:
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(REPLAY_HEADER_STRUCT.pack(REPLAY_MAGIC, REPLAY_VERSION, simulation_step))
+
+        # ? Scenes Read the Virtual Sticks, Which Only Ever Hold Values the Log Can Reproduce
+        self.live_red_joystick: pg.joystick.JoystickType | VirtualJoystick = red_joystick
+        self.live_blue_joystick: pg.joystick.JoystickType | VirtualJoystick = blue_joystick
+        self.red_joystick: VirtualJoystick = VirtualJoystick()
+        self.blue_joystick: VirtualJoystick = VirtualJoystick()
+
+        self.red_sample: StickSample = (0, 0, 0)
+        self.blue_sample: StickSample = (0, 0, 0)
+
+        self.frame_count: int = 0
+        self.game_scene: GameScene | None = None
+
+    def sampleInput(self) -> None:
+        self.red_sample = sampleStick(self.live_red_joystick)
+        self.blue_sample = sampleStick(self.live_blue_joystick)
+
+        applyStick(self.red_joystick, self.red_sample)
+        applyStick(self.blue_joystick, self.blue_sample)
+
+    def isRecordingMatch(self) -> bool:
+        return not self.game_scene is None
+
+    def beginMatch(self, game_scene: GameScene) -> None:
+        # ? Must Run Before the Scene Enters, Since Entering Draws the Layout
+        match_seed: int = createRandomSeed()
+        seedRandomStreams(match_seed)
+
+        self.game_scene = game_scene
+        self.__writeRecord(ReplayRecordKind.KEYFRAME, REPLAY_KEYFRAME_STRUCT.pack(self.frame_count, match_seed))
+
+    def recordFrame(self, frame_delta: float, step_count: int) -> None:
+        assert not self.game_scene is None
+
+        self.__writeRecord(ReplayRecordKind.FRAME, REPLAY_FRAME_STRUCT.pack(
+            frame_delta,
+            step_count,
+            *self.red_sample,
+            *self.blue_sample
+        ))
+        self.frame_count += 1
+
+        if self.frame_count % REPLAY_CHECKPOINT_INTERVAL == 0:
+            self.__writeCheckpoint()
+
+    def endMatch(self) -> None:
+        assert not self.game_scene is None
+
+        self.__writeCheckpoint()
+        self.game_scene = None
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.isRecordingMatch():
+            self.endMatch()
+
+        self.file.close()
+
+    def __writeRecord(self, kind: ReplayRecordKind, payload: bytes) -> None:
+        self.file.write(REPLAY_KIND_STRUCT.pack(kind))
+        self.file.write(payload)
+
+    def __writeCheckpoint(self) -> None:
+        assert not self.game_scene is None
+
+        # ? Checkpoints Follow the Frame Before Them, Named by That Frame's Index
+        self.__writeRecord(
+            ReplayRecordKind.CHECKPOINT,
+            REPLAY_CHECKPOINT_STRUCT.pack(self.frame_count - 1, digestGameScene(self.game_scene))
+        )
+
+class ReplayLog:
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+
+        magic, version, simulation_step = REPLAY_HEADER_STRUCT.unpack_from(data, 0)
+        assert magic == REPLAY_MAGIC, f"{path} is not a replay log"
+        assert version == REPLAY_VERSION, f"{path} has replay version {version}, expected {REPLAY_VERSION}"
+
+        self.simulation_step: float = simulation_step
+        self.frames: list[ReplayFrame] = []
+        self.keyframes: list[ReplayKeyframe] = []
+        self.checkpoints: dict[int, int] = {}
+
+        offset: int = REPLAY_HEADER_STRUCT.size
+        while offset < len(data):
+            kind: int = data[offset]
+            offset += REPLAY_KIND_STRUCT.size
+
+            match kind:
+                case ReplayRecordKind.FRAME:
+                    frame_delta, step_count, *sticks = REPLAY_FRAME_STRUCT.unpack_from(data, offset)
+                    self.frames.append(ReplayFrame(frame_delta, step_count, tuple(sticks[:3]), tuple(sticks[3:])))
+                    offset += REPLAY_FRAME_STRUCT.size
+                case ReplayRecordKind.KEYFRAME:
+                    self.keyframes.append(ReplayKeyframe(*REPLAY_KEYFRAME_STRUCT.unpack_from(data, offset)))
+                    offset += REPLAY_KEYFRAME_STRUCT.size
+                case ReplayRecordKind.CHECKPOINT:
+                    frame_index, digest = REPLAY_CHECKPOINT_STRUCT.unpack_from(data, offset)
+                    self.checkpoints[frame_index] = digest
+                    offset += REPLAY_CHECKPOINT_STRUCT.size
+                case _:
+                    raise ValueError(f"{path} has an unknown record kind {kind} at byte {offset - 1}")
+
+        self.keyframe_frames: list[int] = [keyframe.frame_index for keyframe in self.keyframes]
+
+    def getFrameCount(self) -> int:
+        return len(self.frames)
+
+    def findKeyframe(self, frame_index: int) -> ReplayKeyframe | None:
+        # ? Every Match Starts From a Fresh Seed, so the Match Start is the Nearest Restorable State
+        position: int = bisect_right(self.keyframe_frames, frame_index)
+        if position == 0:
+            return None
+
+        return self.keyframes[position - 1]
+
+    def getKeyframeAt(self, frame_index: int) -> ReplayKeyframe | None:
+        position: int = bisect_right(self.keyframe_frames, frame_index)
+        if position == 0 or self.keyframe_frames[position - 1] != frame_index:
+            return None
+
+        return self.keyframes[position - 1]
@@ -0,0 +1,117 @@
+import pygame as pg
+from collections import OrderedDict
+from dataclasses import dataclass
+
+DEFAULT_ROTATION_STEP_COUNT: int = 64
+DEFAULT_ROTATION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+@dataclass
+class RotationCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    bank_count: int
+    byte_count: int
+
+class RotationBank:
+    def __init__(self, texture: pg.Surface, step_count: int) -> None:
+        # ? Holding the Source Keeps its id() Unique While Banked
+        self.texture: pg.Surface = texture
+        self.frames: list[pg.Surface | None] = [None for _ in range(step_count)]
+        self.byte_count: int = 0
+
+class RotationCache:
+    def __init__(
+        self,
+        step_count: int = DEFAULT_ROTATION_STEP_COUNT,
+        max_bytes: int = DEFAULT_ROTATION_CACHE_MAX_BYTES
+    ) -> None:
+        assert step_count > 0
+
+        self.step_count: int = step_count
+        self.step_angle: float = 360.0 / step_count
+        self.max_bytes: int = max_bytes
+
+        self.banks: OrderedDict[int, RotationBank] = OrderedDict[int, RotationBank]()
+        self.byte_count: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __getBank(self, texture: pg.Surface) -> RotationBank:
+        texture_id: int = id(texture)
+        bank: RotationBank | None = self.banks.get(texture_id)
+
+        if bank is None:
+            bank = RotationBank(texture, self.step_count)
+            self.banks[texture_id] = bank
+        else:
+            self.banks.move_to_end(texture_id)
+
+        return bank
+
+    def __bakeFrame(self, bank: RotationBank, step: int) -> pg.Surface:
+        self.misses += 1
+
+        frame: pg.Surface = pg.transform.rotate(bank.texture, step * self.step_angle)
+        frame_bytes: int = frame.get_width() * frame.get_height() * frame.get_bytesize()
+
+        bank.frames[step] = frame
+        bank.byte_count += frame_bytes
+        self.byte_count += frame_bytes
+
+        # ? Evict Least Recently Used Banks, Never the One Being Filled
+        while self.byte_count > self.max_bytes and len(self.banks) > 1:
+            _, evicted_bank = self.banks.popitem(last=False)
+            self.byte_count -= evicted_bank.byte_count
+            self.evictions += 1
+
+        return frame
+
+    def getStep(self, rotation: float) -> int:
+        return int(round(rotation / self.step_angle)) % self.step_count
+
+    def getRotated(self, texture: pg.Surface, rotation: float) -> pg.Surface:
+        bank: RotationBank = self.__getBank(texture)
+        step: int = self.getStep(rotation)
+
+        frame: pg.Surface | None = bank.frames[step]
+        if frame is None:
+            return self.__bakeFrame(bank, step)
+
+        self.hits += 1
+        return frame
+
+    def prebake(self, textures: list[pg.Surface]) -> None:
+        for texture in textures:
+            bank: RotationBank = self.__getBank(texture)
+
+            for step in range(self.step_count):
+                if bank.frames[step] is None:
+                    self.__bakeFrame(bank, step)
+
+    def clear(self) -> None:
+        self.banks.clear()
+        self.byte_count = 0
+
+    def getStats(self) -> RotationCacheStats:
+        return RotationCacheStats(
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self.banks),
+            self.byte_count
+        )
+
+__rotation_cache: RotationCache = RotationCache()
+
+def getRotationCache() -> RotationCache:
+    return __rotation_cache
+
+def setRotationCache(rotation_cache: RotationCache) -> None:
+    global __rotation_cache
+    __rotation_cache = rotation_cache
+
+def getRotatedTexture(texture: pg.Surface, rotation: float) -> pg.Surface:
+    return __rotation_cache.getRotated(texture, rotation)
@@ -0,0 +1,127 @@
+import pygame as pg
+from collections import OrderedDict
+from .assets import createFont
+
+DEFAULT_TEXT_CACHE_SIZE: int = 64
+
+class GlyphAtlas:
+    def __init__(
+        self,
+        font: pg.font.FontType,
+        colour: tuple[int, int, int],
+        angle: float = 0.0,
+        cache_size: int = DEFAULT_TEXT_CACHE_SIZE
+    ) -> None:
+        # ? Glyphs Are Laid Out Exactly, So Only Quarter Turns Are Supported
+        assert angle % 90.0 == 0.0
+
+        self.font: pg.font.FontType = font
+        self.colour: tuple[int, int, int] = colour
+        self.angle: float = angle
+        self.quarter_turns: int = int(angle // 90.0) % 4
+
+        self.line_height: int = font.get_height()
+
+        self.glyphs: dict[str, pg.Surface] = {}
+        self.widths: dict[str, int] = {}
+
+        self.cache_size: int = cache_size
+        self.strings: OrderedDict[str, pg.Surface] = OrderedDict[str, pg.Surface]()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __getGlyph(self, character: str) -> pg.Surface:
+        glyph: pg.Surface | None = self.glyphs.get(character)
+
+        if glyph is None:
+            rendered: pg.Surface = self.font.render(character, False, self.colour)
+
+            glyph = pg.Surface(rendered.get_size(), pg.SRCALPHA)
+            glyph.blit(rendered, (0, 0))
+
+            self.widths[character] = glyph.get_width()
+            self.glyphs[character] = pg.transform.rotate(glyph, self.angle) if self.quarter_turns > 0 else glyph
+
+            glyph = self.glyphs[character]
+
+        return glyph
+
+    def prebake(self, characters: str) -> None:
+        for character in characters:
+            self.__getGlyph(character)
+
+    def __compose(self, text: str) -> pg.Surface:
+        glyphs: list[pg.Surface] = [self.__getGlyph(character) for character in text]
+        widths: list[int] = [self.widths[character] for character in text]
+
+        # ? Pen Offsets Come From the Font so Kerning Matches font.render
+        offsets: list[int] = [
+            self.font.size(text[:index + 1])[0] - self.font.size(character)[0]
+            for index, character in enumerate(text)
+        ]
+        text_width: int = self.font.size(text)[0]
+
+        if self.quarter_turns % 2 == 0:
+            text_surface: pg.Surface = pg.Surface((text_width, self.line_height), pg.SRCALPHA)
+        else:
+            text_surface: pg.Surface = pg.Surface((self.line_height, text_width), pg.SRCALPHA)
+
+        for glyph, width, offset in zip(glyphs, widths, offsets):
+            # ? Map the Unrotated Pen Offset into the Rotated Surface
+            match self.quarter_turns:
+                case 1:
+                    text_surface.blit(glyph, (0, text_width - offset - width))
+                case 2:
+                    text_surface.blit(glyph, (text_width - offset - width, 0))
+                case 3:
+                    text_surface.blit(glyph, (0, offset))
+                case _:
+                    text_surface.blit(glyph, (offset, 0))
+
+        return text_surface
+
+    def render(self, text: str) -> pg.Surface:
+        text_surface: pg.Surface | None = self.strings.get(text)
+
+        if text_surface is None:
+            self.misses += 1
+
+            text_surface = self.__compose(text)
+            self.strings[text] = text_surface
+
+            if len(self.strings) > self.cache_size:
+                self.strings.popitem(last=False)
+        else:
+            self.hits += 1
+            self.strings.move_to_end(text)
+
+        return text_surface
+
+class TextLabel:
+    def __init__(self, atlas: GlyphAtlas, text_format: str = "{}") -> None:
+        self.atlas: GlyphAtlas = atlas
+        self.text_format: str = text_format
+
+        self.value: object = None
+        self.surface: pg.Surface = atlas.render(text_format.format(""))
+
+    def render(self, value: object) -> pg.Surface:
+        # ? Only Touch the Atlas When the Displayed Value Changes
+        if value != self.value:
+            self.value = value
+            self.surface = self.atlas.render(self.text_format.format(value))
+
+        return self.surface
+
+__glyph_atlases: dict[tuple[int, tuple[int, int, int], float], GlyphAtlas] = {}
+
+def getGlyphAtlas(size: int, colour: tuple[int, int, int], angle: float = 0.0) -> GlyphAtlas:
+    atlas_key: tuple[int, tuple[int, int, int], float] = (size, colour, angle)
+    atlas: GlyphAtlas | None = __glyph_atlases.get(atlas_key)
+
+    if atlas is None:
+        atlas = GlyphAtlas(createFont(size), colour, angle)
+        __glyph_atlases[atlas_key] = atlas
+
+    return atlas
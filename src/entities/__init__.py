@@ -1,14 +1,36 @@
 from .player import Player
-from .chase_enemy import ChaseEnemy
+from .maze_grid import MazeGrid
+from .maze_components import MazeComponents
+from .line_of_sight import LineOfSightIndex
+from .floor_cells import FloorCellIndex
+from .entity_store import EntityStore, AnimationMode
+from .flow_field import FlowFieldService
+from .pathfinding_service import PathfindingService
+from .pathfinding_workers import PathfindingWorkerPool, PathfindingWorkerKind
+from .chase_enemy import ChaseEnemy, ChasePlanner
 from .skinny_bird import SkinnyBird
-from .maze_manager import MazeManager, PropType
+from .maze_manager import MazeManager, PropType, PathfindingMode
+from .prop_table import PropTable
 from .nobody_rolly_polly import NobodyRollyPolly
 
 __all__ = [
     "Player",
     "ChaseEnemy",
+    "ChasePlanner",
     "SkinnyBird",
     "MazeManager",
     "PropType",
+    "PropTable",
+    "PathfindingMode",
+    "MazeGrid",
+    "MazeComponents",
+    "LineOfSightIndex",
+    "FloorCellIndex",
+    "EntityStore",
+    "AnimationMode",
+    "FlowFieldService",
+    "PathfindingService",
+    "PathfindingWorkerPool",
+    "PathfindingWorkerKind",
     "NobodyRollyPolly"
 ]
\ No newline at end of file
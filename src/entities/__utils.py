@@ -1,46 +1,66 @@
 import math
-import heapq
-from typing import Any, Generator
-from ..scenes import shared_config
+from weakref import WeakKeyDictionary
+from .maze_grid import MazeGrid
+from .astar_engine import AStarEngine
+from .jump_point_search import JumpPointSearch
+from .junction_graph import HierarchicalPathfinder
 
 RAD_2_DEG: float = 180.0 / math.pi
 
+__astar_engines: WeakKeyDictionary[MazeGrid, AStarEngine] = WeakKeyDictionary[MazeGrid, AStarEngine]()
+__jump_point_searches: WeakKeyDictionary[MazeGrid, JumpPointSearch] = WeakKeyDictionary[MazeGrid, JumpPointSearch]()
+__hierarchical_pathfinders: WeakKeyDictionary[MazeGrid, HierarchicalPathfinder] = WeakKeyDictionary[MazeGrid, HierarchicalPathfinder]()
+
+def getAStarEngine(maze: MazeGrid) -> AStarEngine:
+    engine: AStarEngine | None = __astar_engines.get(maze)
+
+    if engine is None:
+        engine = AStarEngine(maze)
+        __astar_engines[maze] = engine
+    elif engine.layout_version != maze.layout_version:
+        engine.setGrid(maze)
+
+    return engine
+
 def performAStar(
     initial_position: tuple[int, int],
     target_position: tuple[int, int],
-    maze: list[list[bool]]
+    maze: MazeGrid
+) -> list[tuple[int, int]]:
+    return getAStarEngine(maze).search(initial_position, target_position)
+
+def getJumpPointSearch(maze: MazeGrid) -> JumpPointSearch:
+    jump_point_search: JumpPointSearch | None = __jump_point_searches.get(maze)
+
+    if jump_point_search is None:
+        jump_point_search = JumpPointSearch(maze)
+        __jump_point_searches[maze] = jump_point_search
+    elif jump_point_search.layout_version != maze.layout_version:
+        jump_point_search.setGrid(maze)
+
+    return jump_point_search
+
+def performJumpPointSearch(
+    initial_position: tuple[int, int],
+    target_position: tuple[int, int],
+    maze: MazeGrid
+) -> list[tuple[int, int]]:
+    return getJumpPointSearch(maze).search(initial_position, target_position)
+
+def getHierarchicalPathfinder(maze: MazeGrid) -> HierarchicalPathfinder:
+    pathfinder: HierarchicalPathfinder | None = __hierarchical_pathfinders.get(maze)
+
+    if pathfinder is None:
+        pathfinder = HierarchicalPathfinder(maze)
+        __hierarchical_pathfinders[maze] = pathfinder
+    elif pathfinder.layout_version != maze.layout_version:
+        pathfinder.setGrid(maze)
+
+    return pathfinder
+
+def performHierarchicalSearch(
+    initial_position: tuple[int, int],
+    target_position: tuple[int, int],
+    maze: MazeGrid
 ) -> list[tuple[int, int]]:
-    def heuristic(a: tuple[int, int], b: tuple[int, int]) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def neighbors(x: int, y: int) -> Generator[tuple[int, int], Any, None]:
-        for dx, dy in ((1,0), (-1,0), (0,1), (0,-1)):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < shared_config.GRID_COLUMN_COUNT and 0 <= ny < shared_config.GRID_ROW_COUNT and not maze[nx][ny]:
-                yield (nx, ny)
-
-    open_set: list[tuple[int, int, tuple[int, int]]] = []
-    heapq.heappush(open_set, (heuristic(initial_position, target_position), 0, initial_position))
-
-    came_from: dict[tuple[int, int], tuple[int, int]] = {}
-    g_score: dict[tuple[int, int], int] = { initial_position: 0 }
-
-    while open_set:
-        _, current_g, current = heapq.heappop(open_set)
-
-        if current == target_position:
-            path: list[tuple[int, int]] = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            return path[::-1]
-
-        for neighbor in neighbors(*current):
-            tentative_g = current_g + 1
-            if tentative_g < g_score.get(neighbor, float("inf")):
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score = tentative_g + heuristic(neighbor, target_position)
-                heapq.heappush(open_set, (f_score, tentative_g, neighbor))
-
-    return []
+    return getHierarchicalPathfinder(maze).search(initial_position, target_position)
\ No newline at end of file
@@ -0,0 +1,154 @@
+import heapq
+from .maze_grid import MazeGrid
+
+# ? Heap Keys Pack (f, g, cell) Into One Integer, Preserving Tuple Order
+ASTAR_CELL_BITS: int = 24
+ASTAR_SCORE_BITS: int = 20
+ASTAR_CELL_MASK: int = (1 << ASTAR_CELL_BITS) - 1
+ASTAR_SCORE_MASK: int = (1 << ASTAR_SCORE_BITS) - 1
+
+class AStarEngine:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+        self.cell_count: int = self.column_count * self.row_count
+        assert self.cell_count <= ASTAR_CELL_MASK
+
+        # ? Cells Are Numbered Column-Major, So Index Order Matches (x, y) Order
+        self.cell_xs: list[int] = [cell // self.row_count for cell in range(self.cell_count)]
+        self.cell_ys: list[int] = [cell % self.row_count for cell in range(self.cell_count)]
+
+        self.g_scores: list[int] = [0] * self.cell_count
+        self.parents: list[int] = [-1] * self.cell_count
+        self.stamps: list[int] = [0] * self.cell_count
+        self.generation: int = 0
+
+        self.neighbours: list[tuple[int, ...]] = []
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+        self.open_set: list[int] = []
+        self.initial_cell: int = -1
+        self.target_cell: int = -1
+        self.target_x: int = 0
+        self.target_y: int = 0
+        self.found: bool = False
+        self.expansion_count: int = 0
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        solid: list[int] = grid.solid_mask.ravel().tolist()
+
+        # ? Neighbour Tables Follow the Original (+x, -x, +y, -y) Order
+        self.neighbours = []
+        for cell in range(self.cell_count):
+            x, y = self.cell_xs[cell], self.cell_ys[cell]
+            cell_neighbours: list[int] = []
+
+            if x + 1 < self.column_count and not solid[cell + self.row_count]:
+                cell_neighbours.append(cell + self.row_count)
+            if x - 1 >= 0 and not solid[cell - self.row_count]:
+                cell_neighbours.append(cell - self.row_count)
+            if y + 1 < self.row_count and not solid[cell + 1]:
+                cell_neighbours.append(cell + 1)
+            if y - 1 >= 0 and not solid[cell - 1]:
+                cell_neighbours.append(cell - 1)
+
+            self.neighbours.append(tuple(cell_neighbours))
+
+        self.layout_version = grid.layout_version
+
+    def getCell(self, position: tuple[int, int]) -> int:
+        x, y = position
+        if 0 <= x < self.column_count and 0 <= y < self.row_count:
+            return x * self.row_count + y
+
+        return -1
+
+    def begin(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> None:
+        # ? Bumping the Generation Invalidates Every Score Without Clearing
+        self.generation += 1
+        self.found = False
+        self.expansion_count = 0
+        self.open_set = []
+
+        self.initial_cell = self.getCell(initial_position)
+        self.target_cell = self.getCell(target_position)
+        self.target_x, self.target_y = target_position
+
+        if self.initial_cell < 0 or self.target_cell < 0:
+            return
+
+        self.g_scores[self.initial_cell] = 0
+        self.parents[self.initial_cell] = -1
+        self.stamps[self.initial_cell] = self.generation
+
+        initial_h: int = abs(initial_position[0] - self.target_x) + abs(initial_position[1] - self.target_y)
+        self.open_set.append((initial_h << (ASTAR_SCORE_BITS + ASTAR_CELL_BITS)) | self.initial_cell)
+
+    def step(self, expansion_budget: int) -> bool:
+        open_set: list[int] = self.open_set
+        g_scores: list[int] = self.g_scores
+        parents: list[int] = self.parents
+        stamps: list[int] = self.stamps
+        neighbours: list[tuple[int, ...]] = self.neighbours
+        cell_xs: list[int] = self.cell_xs
+        cell_ys: list[int] = self.cell_ys
+
+        generation: int = self.generation
+        target_cell: int = self.target_cell
+        target_x: int = self.target_x
+        target_y: int = self.target_y
+
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        expansions: int = 0
+        while open_set and expansions < expansion_budget:
+            key: int = heappop(open_set)
+            current: int = key & ASTAR_CELL_MASK
+            current_g: int = (key >> ASTAR_CELL_BITS) & ASTAR_SCORE_MASK
+
+            if current == target_cell:
+                self.found = True
+                open_set.clear()
+                break
+
+            # ? Stale Entries Can Never Improve a Neighbour, so Skip Them
+            if current_g > g_scores[current]:
+                continue
+
+            expansions += 1
+            tentative_g: int = current_g + 1
+
+            for neighbour in neighbours[current]:
+                if stamps[neighbour] != generation or tentative_g < g_scores[neighbour]:
+                    stamps[neighbour] = generation
+                    g_scores[neighbour] = tentative_g
+                    parents[neighbour] = current
+
+                    f_score: int = tentative_g + abs(cell_xs[neighbour] - target_x) + abs(cell_ys[neighbour] - target_y)
+                    heappush(open_set, (((f_score << ASTAR_SCORE_BITS) | tentative_g) << ASTAR_CELL_BITS) | neighbour)
+
+        self.expansion_count += expansions
+        return not open_set
+
+    def getPath(self) -> list[tuple[int, int]]:
+        if not self.found:
+            return []
+
+        path: list[tuple[int, int]] = []
+
+        current: int = self.target_cell
+        while current >= 0:
+            path.append((self.cell_xs[current], self.cell_ys[current]))
+            current = self.parents[current] if current != self.initial_cell else -1
+
+        return path[::-1]
+
+    def search(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> list[tuple[int, int]]:
+        self.begin(initial_position, target_position)
+        self.step(self.cell_count + 1)
+
+        return self.getPath()
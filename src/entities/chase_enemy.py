@@ -1,67 +1,94 @@
-import math
 import pygame as pg
+from enum import IntEnum
+from concurrent.futures import Future
 from .player import Player
+from ..core import getRotatedTexture
 from ..scenes import shared_config
-from.maze_manager import MazeManager
-from .__utils import performAStar, RAD_2_DEG
+from .flow_field import FlowFieldService
+from .pathfinding_service import PathfindingService
+from .maze_grid import MazeGrid
+from .maze_manager import MazeManager
+from .dstar_lite import DStarLite
+from .entity_store import EntityStore, AnimationMode
+
+class ChasePlanner(IntEnum):
+    FLOW_FIELD = 0
+    INCREMENTAL = 1
+
+CHASE_PLANNER: ChasePlanner = ChasePlanner.FLOW_FIELD
 
 CHASE_PATH_POLL_TIME: float = 6.0
-CHASE_PATH_ARRIVED_BUFFER: float = shared_config.GRID_CELL_SIZE * 0.05
 
 CHASE_WALK_SPEED: float = shared_config.GRID_CELL_SIZE * 3.0
+CHASE_ROTATION_OFFSET: float = 90.0
 
-CHASE_COLLISION_RADIUS_SQR: float = shared_config.HALF_GRID_CELL_SIZE * shared_config.HALF_GRID_CELL_SIZE
+CHASE_COLLISION_RADIUS: float = shared_config.HALF_GRID_CELL_SIZE
 
 class ChaseEnemy:
+    __slots__ = (
+        "start_position", "entities", "index", "FRAME_TIME", "animation_frames", "path_index", "path_time",
+        "path", "path_request", "planner_mode", "planner"
+    )
+
     def __init__(
         self,
+        entities: EntityStore,
         frame_time: float,
         animation_frames: list[pg.Surface],
         start_position: tuple[float, float]
     ) -> None:
         self.start_position: tuple[float, float] = start_position
 
-        self.position_x: float = start_position[0]
-        self.position_y: float = start_position[1]
-        self.rotation: float = 0.0
+        # ? Movement, Facing and Animation Step in the Shared Store's Batch Updates
+        self.entities: EntityStore = entities
+        self.index: int = entities.allocate(CHASE_COLLISION_RADIUS, self.__handlePlayerHit, self.__handleArrival)
+        entities.setPosition(self.index, start_position)
 
-        self.animation_index: int = 0
-        self.animation_time: float = 0.0
-        self.animation_direction: int = 1
         self.FRAME_TIME: float = frame_time
         self.animation_frames: list[pg.Surface] = animation_frames
 
         self.path_index: int = 0
         self.path_time: float = 0.0
         self.path: list[tuple[int, int]] = []
+        self.path_request: Future | None = None
 
-    def reset(self, target_position: tuple[float, float], maze: list[list[bool]]) -> None:
-        self.position_x, self.position_y = self.start_position
-        
-        self.animation_index = 0
-        self.animation_time = 0.0
+        self.planner_mode: ChasePlanner = CHASE_PLANNER
+        self.planner: DStarLite | None = None
 
-        self.__selectNewPath(target_position, maze)
-
-    def __checkPlayerCollision(self, player: Player, maze: MazeManager) -> None:
-        if player.isDead():
-            return
-        
-        x, y = player.getPosition()
-        delta_x, delta_y = x - self.position_x, y - self.position_y
-        dist_sqr: float = (delta_x * delta_x) + (delta_y * delta_y)
+    def reset(self) -> None:
+        self.entities.setPosition(self.index, self.start_position)
+        self.entities.setAnimation(self.index, self.FRAME_TIME, len(self.animation_frames), AnimationMode.BACK_AND_FORTH)
+        self.entities.clearWaypoint(self.index)
 
-        if dist_sqr <= CHASE_COLLISION_RADIUS_SQR:
-            maze.dropPurse((x, y), player.killPlayer())
-            self.__selectNewPath(self.start_position, maze.getSolidMask())
-
-    def __selectNewPath(self, target_position: tuple[float, float], maze: list[list[bool]]):
         self.path_index = 0
         self.path_time = 0.0
+        self.path.clear()
+        self.path_request = None
+
+        self.planner = None
+
+    def setPlanner(self, planner_mode: ChasePlanner) -> None:
+        self.planner_mode = planner_mode
+        self.planner = None
+
+    def getPosition(self) -> tuple[float, float]:
+        return self.entities.getPosition(self.index)
 
+    def __handlePlayerHit(self, player: Player, maze: MazeManager, pathfinding: PathfindingService) -> None:
+        maze.dropPurse(player.getPosition(), player.killPlayer())
+        self.__selectNewPath(self.start_position, pathfinding)
+
+    def __handleArrival(self) -> None:
+        self.path_index += 1
+
+        if self.path_index < len(self.path):
+            self.entities.advanceWaypoint(self.index, self.path[self.path_index])
+
+    def __selectNewPath(self, target_position: tuple[float, float], pathfinding: PathfindingService):
+        position_x, position_y = self.getPosition()
         int_initial_position: tuple[int, int] = (
-            int((self.position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
-            int((self.position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+            int((position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
+            int((position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
         )
 
         int_target_position: tuple[int, int] = (
@@ -69,53 +96,95 @@ class ChaseEnemy:
             int((target_position[1] + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
         )
 
-        self.path = performAStar(int_initial_position, int_target_position, maze)
+        # ? Finish the Current Step While the Service Plans the Return Trip
+        self.path_request = pathfinding.requestPath(int_initial_position, int_target_position)
 
-    def update(self, delta_time: float, target_player: Player, other_player: Player, maze: MazeManager) -> None:
-        self.animation_time += delta_time
-        if self.animation_time >= self.FRAME_TIME:
-            self.animation_time -= self.FRAME_TIME
-            self.animation_index += self.animation_direction
+    def __receivePath(self) -> None:
+        if not self.path_request.done():
+            return
 
-            if self.animation_index == 0 or self.animation_index == len(self.animation_frames) - 1:
-                self.animation_direction *= -1
+        if not self.path_request.cancelled():
+            self.path_index = 0
+            self.path_time = 0.0
+            self.path = self.path_request.result()
+            self.__beginPath()
 
-        if self.path_index < len(self.path):
-            node_x_index, node_y_index = self.path[self.path_index]
+        self.path_request = None
+
+    def __selectNextStep(self, target_player: Player, maze: MazeManager, flow_fields: FlowFieldService) -> None:
+        self.path_index = 0
+        self.path_time = 0.0
+
+        position_x, position_y = self.getPosition()
+        int_position: tuple[int, int] = (
+            int((position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
+            int((position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+        )
 
-            node_x: float = node_x_index * shared_config.GRID_CELL_SIZE
-            node_y: float = node_y_index * shared_config.GRID_CELL_SIZE
+        next_cell: tuple[int, int] | None = None
 
-            delta_x: float = node_x - self.position_x
-            delta_y: float = node_y - self.position_y
+        match self.planner_mode:
+            case ChasePlanner.FLOW_FIELD:
+                # ? Chasers Share the Target's Flow Field and Read One Step at a Time
+                next_cell = flow_fields.getNextCell(target_player, int_position)
+            case ChasePlanner.INCREMENTAL:
+                next_cell = self.__planNextStep(target_player, int_position, maze)
 
-            node_dist: float = math.sqrt((delta_x * delta_x) + (delta_y * delta_y))
+        self.path = [] if next_cell is None else [next_cell]
+        self.__beginPath()
 
-            if node_dist <= CHASE_PATH_ARRIVED_BUFFER:
-                self.path_index += 1
-            else:
-                self.position_x += delta_x * CHASE_WALK_SPEED * delta_time / node_dist
-                self.position_y += delta_y * CHASE_WALK_SPEED * delta_time / node_dist
+    def __planNextStep(self, target_player: Player, int_position: tuple[int, int], maze: MazeManager) -> tuple[int, int] | None:
+        grid: MazeGrid = maze.getSolidMask()
 
-                self.rotation = 90.0 + math.atan2(delta_y, -delta_x) * RAD_2_DEG
+        if self.planner is None or self.planner.layout_version != grid.layout_version:
+            self.planner = DStarLite(grid)
 
+        target_x, target_y = target_player.getPosition()
+        int_target_position: tuple[int, int] = (
+            int((target_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
+            int((target_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+        )
+
+        # ? The Planner Keeps its Search Between Steps and Repairs it as Either End Moves
+        self.planner.plan(int_position, int_target_position)
+        return self.planner.getNextCell()
+
+    def __beginPath(self) -> None:
+        # ? Later Cells Are Aimed at on Arrival, so a Path Touches the Store Once per Cell
+        if self.path_index < len(self.path):
+            self.entities.setWaypoint(self.index, self.path[self.path_index], CHASE_WALK_SPEED, CHASE_ROTATION_OFFSET)
+        else:
+            self.entities.clearWaypoint(self.index)
+
+    def update(
+        self,
+        delta_time: float,
+        target_player: Player,
+        maze: MazeManager,
+        flow_fields: FlowFieldService
+    ) -> None:
+        if not self.path_request is None:
+            self.__receivePath()
+
+        if self.path_request is None and self.path_index >= len(self.path):
+            self.__selectNextStep(target_player, maze, flow_fields)
+
+        if self.path_index < len(self.path):
+            # ? Give Up on a Long Return Trip and Resume the Chase
             self.path_time += delta_time
             if self.path_time >= CHASE_PATH_POLL_TIME:
-                self.__selectNewPath(target_player.getPosition(), maze.getSolidMask())
-        else:
-            self.__selectNewPath(target_player.getPosition(), maze.getSolidMask())
+                self.__selectNextStep(target_player, maze, flow_fields)
 
-        self.__checkPlayerCollision(target_player, maze)
-        self.__checkPlayerCollision(other_player, maze)
+    def draw(self, canvas: pg.Surface, alpha: float) -> None:
+        position_x, position_y = self.entities.getRenderPosition(self.index, alpha)
 
-    def draw(self, canvas: pg.Surface) -> None:
         canvas.blit(
-            pg.transform.rotate(
-                self.animation_frames[self.animation_index],
-                self.rotation
+            getRotatedTexture(
+                self.animation_frames[self.entities.animation_index[self.index]],
+                float(self.entities.rotation[self.index])
             ),
             (
-                shared_config.GRID_RENDER_OFFSET_X + self.position_x,
-                shared_config.GRID_RENDER_OFFSET_Y + self.position_y
+                shared_config.GRID_RENDER_OFFSET_X + position_x,
+                shared_config.GRID_RENDER_OFFSET_Y + position_y
             )
-        )
\ No newline at end of file
+        )
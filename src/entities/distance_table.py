@@ -0,0 +1,216 @@
+import os
+import numpy as np
+from collections import deque
+from dataclasses import dataclass
+from .maze_grid import MazeGrid
+
+DISTANCE_UNREACHABLE: int = 0xFFFF
+NEXT_HOP_NONE: int = 0xFF
+
+# ? Direction Codes Index Into This Table
+DIRECTION_OFFSETS: tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+@dataclass
+class DistanceTableReport:
+    floor_cell_count: int
+    built_row_count: int
+    index_bytes: int
+    row_bytes: int
+    total_bytes: int
+    full_table_bytes: int
+
+class DistanceTable:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+        self.solid_mask: np.ndarray = grid.solid_mask.copy()
+
+        # ? Dense Floor Numbering, Grid Cells Map to -1 When Solid
+        floor_cells: np.ndarray = np.argwhere(self.solid_mask == 0)
+        self.floor_cells: list[tuple[int, int]] = [(x, y) for x, y in floor_cells.tolist()]
+        self.floor_count: int = len(self.floor_cells)
+        assert self.floor_count < DISTANCE_UNREACHABLE
+
+        self.floor_indices: np.ndarray = np.full((self.column_count, self.row_count), -1, dtype=np.int32)
+        self.floor_indices[floor_cells[:, 0], floor_cells[:, 1]] = np.arange(self.floor_count, dtype=np.int32)
+        self.floor_index_lists: list[list[int]] = self.floor_indices.tolist()
+
+        self.neighbours: list[list[tuple[int, int]]] = []
+        for x, y in self.floor_cells:
+            cell_neighbours: list[tuple[int, int]] = []
+
+            for direction, (dx, dy) in enumerate(DIRECTION_OFFSETS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.column_count and 0 <= ny < self.row_count and self.floor_index_lists[nx][ny] >= 0:
+                    cell_neighbours.append((self.floor_index_lists[nx][ny], direction))
+
+            self.neighbours.append(cell_neighbours)
+
+        # ? Rows Are Rooted at a Goal and Filled on First Use
+        self.distance_rows: list[np.ndarray | None] = [None for _ in range(self.floor_count)]
+        self.next_hop_rows: list[np.ndarray | None] = [None for _ in range(self.floor_count)]
+        self.built_row_count: int = 0
+
+        # ? Cells Settled by Rows Built During the Last search()
+        self.expansion_count: int = 0
+
+    def getFloorIndex(self, cell: tuple[int, int]) -> int:
+        x, y = cell
+        if 0 <= x < self.column_count and 0 <= y < self.row_count:
+            return self.floor_index_lists[x][y]
+
+        return -1
+
+    def __buildRow(self, goal_index: int) -> None:
+        distances: list[int] = [DISTANCE_UNREACHABLE] * self.floor_count
+        next_hops: list[int] = [NEXT_HOP_NONE] * self.floor_count
+        distances[goal_index] = 0
+
+        frontier: deque[int] = deque((goal_index,))
+        while frontier:
+            current: int = frontier.popleft()
+            next_distance: int = distances[current] + 1
+
+            for neighbour, direction in self.neighbours[current]:
+                if distances[neighbour] == DISTANCE_UNREACHABLE:
+                    distances[neighbour] = next_distance
+
+                    # ? Stepping Back Along the Search Direction Leads to the Goal
+                    next_hops[neighbour] = direction ^ 1
+                    frontier.append(neighbour)
+
+        self.expansion_count += self.floor_count - distances.count(DISTANCE_UNREACHABLE)
+
+        self.distance_rows[goal_index] = np.array(distances, dtype=np.uint16)
+        self.next_hop_rows[goal_index] = np.array(next_hops, dtype=np.uint8)
+        self.built_row_count += 1
+
+    def getRow(self, goal_index: int) -> tuple[np.ndarray, np.ndarray]:
+        if self.distance_rows[goal_index] is None:
+            self.__buildRow(goal_index)
+
+        return (self.distance_rows[goal_index], self.next_hop_rows[goal_index])
+
+    def buildAll(self) -> None:
+        for goal_index in range(self.floor_count):
+            if self.distance_rows[goal_index] is None:
+                self.__buildRow(goal_index)
+
+    def getDistance(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> int:
+        initial_index: int = self.getFloorIndex(initial_position)
+        target_index: int = self.getFloorIndex(target_position)
+
+        if initial_index < 0 or target_index < 0:
+            return DISTANCE_UNREACHABLE
+
+        return int(self.getRow(target_index)[0][initial_index])
+
+    def getPath(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> list[tuple[int, int]]:
+        target_index: int = self.getFloorIndex(target_position)
+        if target_index < 0:
+            return []
+
+        distance_row, next_hop_row = self.getRow(target_index)
+
+        path: list[tuple[int, int]] = [initial_position]
+        current_index: int = self.getFloorIndex(initial_position)
+
+        # ? A Start Inside a Wall Steps Out Through its Closest Floor Neighbour
+        if current_index < 0:
+            x, y = initial_position
+            best_distance: int = DISTANCE_UNREACHABLE
+
+            for dx, dy in DIRECTION_OFFSETS:
+                neighbour_index: int = self.getFloorIndex((x + dx, y + dy))
+                if neighbour_index >= 0 and distance_row[neighbour_index] < best_distance:
+                    best_distance = int(distance_row[neighbour_index])
+                    current_index = neighbour_index
+
+            if current_index < 0:
+                return []
+
+            path.append(self.floor_cells[current_index])
+
+        if distance_row[current_index] == DISTANCE_UNREACHABLE:
+            return []
+
+        while current_index != target_index:
+            x, y = self.floor_cells[current_index]
+            dx, dy = DIRECTION_OFFSETS[next_hop_row[current_index]]
+
+            current_index = self.floor_index_lists[x + dx][y + dy]
+            path.append(self.floor_cells[current_index])
+
+        return path
+
+    def search(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> list[tuple[int, int]]:
+        # ? Only a Row Built for This Query is Search Work; Walking an Existing Row is a Lookup
+        self.expansion_count = 0
+        return self.getPath(initial_position, target_position)
+
+    def getMemoryReport(self) -> DistanceTableReport:
+        index_bytes: int = self.floor_indices.nbytes + self.solid_mask.nbytes
+        row_bytes: int = self.built_row_count * self.floor_count * (
+            np.dtype(np.uint16).itemsize + np.dtype(np.uint8).itemsize
+        )
+        full_table_bytes: int = self.floor_count * self.floor_count * (
+            np.dtype(np.uint16).itemsize + np.dtype(np.uint8).itemsize
+        )
+
+        return DistanceTableReport(
+            self.floor_count,
+            self.built_row_count,
+            index_bytes,
+            row_bytes,
+            index_bytes + row_bytes,
+            full_table_bytes
+        )
+
+    def save(self, file_path: str) -> None:
+        self.buildAll()
+
+        np.savez_compressed(
+            file_path,
+            solid_mask=self.solid_mask,
+            distances=np.stack(self.distance_rows),
+            next_hops=np.stack(self.next_hop_rows)
+        )
+
+    def load(self, file_path: str) -> bool:
+        with np.load(file_path) as table_file:
+            # ? Stale Tables From an Edited Layout Are Ignored
+            if not np.array_equal(table_file["solid_mask"], self.solid_mask):
+                return False
+
+            distances: np.ndarray = table_file["distances"]
+            next_hops: np.ndarray = table_file["next_hops"]
+
+        if distances.shape != (self.floor_count, self.floor_count):
+            return False
+
+        self.distance_rows = list(distances)
+        self.next_hop_rows = list(next_hops)
+        self.built_row_count = self.floor_count
+
+        return True
+
+__distance_tables: dict[str, DistanceTable] = {}
+
+def getDistanceTable(layout_path: str, grid: MazeGrid, cache_folder_path: str | None = None) -> DistanceTable:
+    table_key: str = os.path.normpath(layout_path)
+    distance_table: DistanceTable | None = __distance_tables.get(table_key)
+
+    if not distance_table is None and np.array_equal(distance_table.solid_mask, grid.solid_mask):
+        return distance_table
+
+    distance_table = DistanceTable(grid)
+
+    if not cache_folder_path is None:
+        table_file_path: str = os.path.join(cache_folder_path, os.path.basename(table_key) + ".npz")
+
+        if not os.path.isfile(table_file_path) or not distance_table.load(table_file_path):
+            os.makedirs(cache_folder_path, exist_ok=True)
+            distance_table.save(table_file_path)
+
+    __distance_tables[table_key] = distance_table
+    return distance_table
@@ -0,0 +1,241 @@
+import heapq
+from .maze_grid import MazeGrid
+
+DSTAR_INFINITY: int = 1 << 30
+
+class DStarLite:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+        self.cell_count: int = self.column_count * self.row_count
+
+        # ? Cells Are Numbered Column-Major, Matching the A* Engine
+        self.cell_xs: list[int] = [cell // self.row_count for cell in range(self.cell_count)]
+        self.cell_ys: list[int] = [cell % self.row_count for cell in range(self.cell_count)]
+        self.adjacent: list[tuple[int, ...]] = [self.__getAdjacentCells(cell) for cell in range(self.cell_count)]
+
+        self.solid: bytearray = bytearray(self.cell_count)
+        self.g_scores: list[int] = []
+        self.rhs_scores: list[int] = []
+
+        self.open_set: list[tuple[int, int, int]] = []
+        self.open_keys: dict[int, tuple[int, int]] = {}
+
+        self.start_cell: int = -1
+        self.last_start_cell: int = -1
+        self.goal_cell: int = -1
+        self.key_modifier: int = 0
+
+        self.expansion_count: int = 0
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def __getAdjacentCells(self, cell: int) -> tuple[int, ...]:
+        x, y = self.cell_xs[cell], self.cell_ys[cell]
+        adjacent: list[int] = []
+
+        if x + 1 < self.column_count:
+            adjacent.append(cell + self.row_count)
+        if x - 1 >= 0:
+            adjacent.append(cell - self.row_count)
+        if y + 1 < self.row_count:
+            adjacent.append(cell + 1)
+        if y - 1 >= 0:
+            adjacent.append(cell - 1)
+
+        return tuple(adjacent)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        self.solid = bytearray(grid.solid_mask.ravel().tolist())
+        self.layout_version = grid.layout_version
+
+        self.__clearSearch()
+
+    def __clearSearch(self) -> None:
+        self.g_scores = [DSTAR_INFINITY] * self.cell_count
+        self.rhs_scores = [DSTAR_INFINITY] * self.cell_count
+
+        self.open_set = []
+        self.open_keys = {}
+
+        self.start_cell = -1
+        self.last_start_cell = -1
+        self.goal_cell = -1
+        self.key_modifier = 0
+
+    def getCell(self, position: tuple[int, int]) -> int:
+        x, y = position
+        if 0 <= x < self.column_count and 0 <= y < self.row_count:
+            return x * self.row_count + y
+
+        return -1
+
+    def __getHeuristic(self, cell: int) -> int:
+        return abs(self.cell_xs[cell] - self.cell_xs[self.start_cell]) + abs(self.cell_ys[cell] - self.cell_ys[self.start_cell])
+
+    def __getKey(self, cell: int) -> tuple[int, int]:
+        score: int = min(self.g_scores[cell], self.rhs_scores[cell])
+        return (score + self.__getHeuristic(cell) + self.key_modifier, score)
+
+    def __updateCell(self, cell: int) -> None:
+        if cell != self.goal_cell:
+            best_rhs: int = DSTAR_INFINITY
+
+            if not self.solid[cell]:
+                for neighbour in self.adjacent[cell]:
+                    if not self.solid[neighbour] and self.g_scores[neighbour] + 1 < best_rhs:
+                        best_rhs = self.g_scores[neighbour] + 1
+
+            self.rhs_scores[cell] = best_rhs
+
+        # ? Superseded Heap Entries Are Left Behind and Skipped on Pop
+        if self.g_scores[cell] != self.rhs_scores[cell]:
+            key: tuple[int, int] = self.__getKey(cell)
+            self.open_keys[cell] = key
+            heapq.heappush(self.open_set, (key[0], key[1], cell))
+        else:
+            self.open_keys.pop(cell, None)
+
+    def __peekKey(self) -> tuple[int, int] | None:
+        open_set: list[tuple[int, int, int]] = self.open_set
+
+        while open_set:
+            k1, k2, cell = open_set[0]
+            if self.open_keys.get(cell) == (k1, k2):
+                return (k1, k2)
+
+            heapq.heappop(open_set)
+
+        return None
+
+    def __computeShortestPath(self) -> None:
+        g_scores: list[int] = self.g_scores
+        rhs_scores: list[int] = self.rhs_scores
+        start_cell: int = self.start_cell
+
+        while True:
+            top_key: tuple[int, int] | None = self.__peekKey()
+            if top_key is None:
+                break
+
+            if top_key >= self.__getKey(start_cell) and g_scores[start_cell] == rhs_scores[start_cell]:
+                break
+
+            _, _, cell = heapq.heappop(self.open_set)
+            del self.open_keys[cell]
+
+            new_key: tuple[int, int] = self.__getKey(cell)
+            if top_key < new_key:
+                self.open_keys[cell] = new_key
+                heapq.heappush(self.open_set, (new_key[0], new_key[1], cell))
+                continue
+
+            self.expansion_count += 1
+
+            if g_scores[cell] > rhs_scores[cell]:
+                g_scores[cell] = rhs_scores[cell]
+            else:
+                g_scores[cell] = DSTAR_INFINITY
+                self.__updateCell(cell)
+
+            for neighbour in self.adjacent[cell]:
+                self.__updateCell(neighbour)
+
+    def plan(self, start_position: tuple[int, int], goal_position: tuple[int, int]) -> bool:
+        self.expansion_count = 0
+
+        start_cell: int = self.getCell(start_position)
+        goal_cell: int = self.getCell(goal_position)
+        if start_cell < 0:
+            return False
+
+        # ? A Goal Rounding Into a Wall Keeps the Last Floor Goal
+        if goal_cell < 0 or self.solid[goal_cell]:
+            if self.goal_cell < 0:
+                return False
+
+            goal_cell = self.goal_cell
+
+        if self.goal_cell < 0:
+            self.start_cell = self.last_start_cell = start_cell
+            self.goal_cell = goal_cell
+            self.rhs_scores[goal_cell] = 0
+            self.__updateCell(goal_cell)
+        else:
+            # ? A Moving Start Only Shifts Future Keys by the Distance Travelled
+            if start_cell != self.start_cell:
+                self.start_cell = start_cell
+                self.key_modifier += self.__getHeuristic(self.last_start_cell)
+                self.last_start_cell = start_cell
+
+            # ? A Moving Goal Repairs Only the Cells Whose Distances Change
+            if goal_cell != self.goal_cell:
+                old_goal_cell: int = self.goal_cell
+                self.goal_cell = goal_cell
+
+                self.rhs_scores[goal_cell] = 0
+                self.__updateCell(goal_cell)
+                self.__updateCell(old_goal_cell)
+
+        self.__computeShortestPath()
+        return self.g_scores[self.start_cell] < DSTAR_INFINITY
+
+    def notifyCellChanged(self, position: tuple[int, int], is_solid: bool) -> None:
+        cell: int = self.getCell(position)
+        if cell < 0 or bool(self.solid[cell]) == is_solid:
+            return
+
+        self.solid[cell] = 1 if is_solid else 0
+
+        # ? Without a Search in Progress the Next Plan Starts Fresh Anyway
+        if self.goal_cell < 0:
+            return
+
+        if is_solid and cell == self.goal_cell:
+            self.__clearSearch()
+            return
+
+        self.__updateCell(cell)
+        for neighbour in self.adjacent[cell]:
+            self.__updateCell(neighbour)
+
+    def getNextCell(self) -> tuple[int, int] | None:
+        if self.start_cell < 0 or self.start_cell == self.goal_cell:
+            return None
+
+        best_cell: int = -1
+        best_score: int = DSTAR_INFINITY
+
+        for neighbour in self.adjacent[self.start_cell]:
+            if not self.solid[neighbour] and self.g_scores[neighbour] < best_score:
+                best_cell = neighbour
+                best_score = self.g_scores[neighbour]
+
+        if best_cell < 0:
+            return None
+
+        return (self.cell_xs[best_cell], self.cell_ys[best_cell])
+
+    def getPath(self) -> list[tuple[int, int]]:
+        if self.start_cell < 0 or self.g_scores[self.start_cell] >= DSTAR_INFINITY:
+            return []
+
+        cell: int = self.start_cell
+        path: list[tuple[int, int]] = [(self.cell_xs[cell], self.cell_ys[cell])]
+
+        # ? Descending g Scores Walks a Shortest Path to the Goal
+        while cell != self.goal_cell:
+            next_cell: int = cell
+            for neighbour in self.adjacent[cell]:
+                if not self.solid[neighbour] and self.g_scores[neighbour] < self.g_scores[next_cell]:
+                    next_cell = neighbour
+
+            if next_cell == cell:
+                return []
+
+            cell = next_cell
+            path.append((self.cell_xs[cell], self.cell_ys[cell]))
+
+        return path
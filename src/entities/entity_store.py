@@ -0,0 +1,234 @@
+import numpy as np
+from enum import IntEnum
+from typing import Callable
+from .player import Player
+from ..scenes import shared_config
+from .maze_manager import MazeManager
+from .pathfinding_service import PathfindingService
+from .__utils import RAD_2_DEG
+
+ENTITY_STORE_CAPACITY: int = 16
+
+ENTITY_ARRIVED_BUFFER: float = shared_config.GRID_CELL_SIZE * 0.05
+
+class AnimationMode(IntEnum):
+    BACK_AND_FORTH = 0
+    LOOPING = 1
+
+class EntityStore:
+    def __init__(self, capacity: int = ENTITY_STORE_CAPACITY) -> None:
+        self.capacity: int = 0
+        self.count: int = 0
+        self.free_indices: list[int] = []
+
+        # ? Per-Entity Reactions to a Player Collision, Run After the Batch Test
+        self.hit_handlers: list[Callable[[Player, MazeManager, PathfindingService], None] | None] = []
+
+        # ? Per-Entity Reactions to Reaching a Waypoint, Run Only for the Entities That Arrived
+        self.arrival_handlers: list[Callable[[], None] | None] = []
+
+        self.active: np.ndarray = np.zeros(0, dtype=np.bool_)
+
+        self.position_x: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.position_y: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.previous_x: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.previous_y: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.rotation: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.collision_radius_sqr: np.ndarray = np.zeros(0, dtype=np.float64)
+
+        # ? Path Cursor: the Cell Being Walked Toward, its Speed and the Facing Offset
+        self.waypoint_x: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.waypoint_y: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.move_speed: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.rotation_offset: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.has_waypoint: np.ndarray = np.zeros(0, dtype=np.bool_)
+
+        self.animation_time: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.animation_index: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.animation_direction: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.frame_time: np.ndarray = np.zeros(0, dtype=np.float64)
+        self.frame_count: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.animation_mode: np.ndarray = np.zeros(0, dtype=np.int8)
+        self.animation_wrapped: np.ndarray = np.zeros(0, dtype=np.bool_)
+
+        self.__grow(capacity)
+
+    def __grow(self, capacity: int) -> None:
+        for name in (
+            "active", "position_x", "position_y", "previous_x", "previous_y", "rotation", "collision_radius_sqr",
+            "waypoint_x", "waypoint_y", "move_speed", "rotation_offset", "has_waypoint",
+            "animation_time", "animation_index", "animation_direction", "frame_time", "frame_count",
+            "animation_mode", "animation_wrapped"
+        ):
+            array: np.ndarray = getattr(self, name)
+            grown: np.ndarray = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.capacity] = array
+            setattr(self, name, grown)
+
+        self.hit_handlers.extend([None] * (capacity - self.capacity))
+        self.arrival_handlers.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def allocate(
+        self,
+        collision_radius: float,
+        hit_handler: Callable[[Player, MazeManager, PathfindingService], None] | None = None,
+        arrival_handler: Callable[[], None] | None = None
+    ) -> int:
+        if self.free_indices:
+            index: int = self.free_indices.pop()
+        else:
+            if self.count == self.capacity:
+                self.__grow(self.capacity * 2)
+
+            index = self.count
+            self.count += 1
+
+        self.active[index] = True
+        self.collision_radius_sqr[index] = collision_radius * collision_radius
+        self.has_waypoint[index] = False
+        self.frame_count[index] = 0
+        self.hit_handlers[index] = hit_handler
+        self.arrival_handlers[index] = arrival_handler
+
+        return index
+
+    def release(self, index: int) -> None:
+        self.active[index] = False
+        self.has_waypoint[index] = False
+        self.hit_handlers[index] = None
+        self.arrival_handlers[index] = None
+        self.free_indices.append(index)
+
+    def getPosition(self, index: int) -> tuple[float, float]:
+        return (float(self.position_x[index]), float(self.position_y[index]))
+
+    def getRenderPosition(self, index: int, alpha: float) -> tuple[float, float]:
+        previous_x: float = float(self.previous_x[index])
+        previous_y: float = float(self.previous_y[index])
+
+        return (
+            previous_x + (float(self.position_x[index]) - previous_x) * alpha,
+            previous_y + (float(self.position_y[index]) - previous_y) * alpha
+        )
+
+    def setPosition(self, index: int, position: tuple[float, float]) -> None:
+        # ? Placing an Entity Snaps Both Ends so it Never Slides Into Place
+        self.position_x[index], self.position_y[index] = position
+        self.previous_x[index], self.previous_y[index] = position
+
+    def storePreviousPositions(self) -> None:
+        self.previous_x[:self.count] = self.position_x[:self.count]
+        self.previous_y[:self.count] = self.position_y[:self.count]
+
+    def setAnimation(
+        self,
+        index: int,
+        frame_time: float,
+        frame_count: int,
+        mode: AnimationMode,
+        animation_index: int = 0,
+        animation_direction: int = 1
+    ) -> None:
+        self.animation_time[index] = 0.0
+        self.animation_index[index] = animation_index
+        self.animation_direction[index] = animation_direction
+        self.frame_time[index] = frame_time
+        self.frame_count[index] = frame_count
+        self.animation_mode[index] = mode
+        self.animation_wrapped[index] = False
+
+    def setWaypoint(self, index: int, cell: tuple[int, int], move_speed: float, rotation_offset: float) -> None:
+        self.waypoint_x[index] = cell[0] * shared_config.GRID_CELL_SIZE
+        self.waypoint_y[index] = cell[1] * shared_config.GRID_CELL_SIZE
+        self.move_speed[index] = move_speed
+        self.rotation_offset[index] = rotation_offset
+        self.has_waypoint[index] = True
+
+    def advanceWaypoint(self, index: int, cell: tuple[int, int]) -> None:
+        # ? The Next Cell of the Same Walk Keeps the Speed and Facing Offset Already Stored
+        self.waypoint_x[index] = cell[0] * shared_config.GRID_CELL_SIZE
+        self.waypoint_y[index] = cell[1] * shared_config.GRID_CELL_SIZE
+        self.has_waypoint[index] = True
+
+    def clearWaypoint(self, index: int) -> None:
+        self.has_waypoint[index] = False
+
+    def updateAnimations(self, delta_time: float) -> None:
+        count: int = self.count
+        animated: np.ndarray = self.active[:count] & (self.frame_count[:count] > 0)
+
+        animation_time: np.ndarray = self.animation_time[:count]
+        animation_time[animated] += delta_time
+
+        # ? At Most One Frame Step per Update, Matching the Per-Entity Timers
+        stepped: np.ndarray = animated & (animation_time >= self.frame_time[:count])
+        animation_time[stepped] -= self.frame_time[:count][stepped]
+
+        animation_index: np.ndarray = self.animation_index[:count]
+        animation_direction: np.ndarray = self.animation_direction[:count]
+        frame_count: np.ndarray = self.frame_count[:count]
+        animation_index[stepped] += animation_direction[stepped]
+
+        back_and_forth: np.ndarray = stepped & (self.animation_mode[:count] == AnimationMode.BACK_AND_FORTH)
+        turned: np.ndarray = back_and_forth & ((animation_index == 0) | (animation_index == frame_count - 1))
+        animation_direction[turned] *= -1
+
+        looping: np.ndarray = stepped & (self.animation_mode[:count] == AnimationMode.LOOPING)
+        past_end: np.ndarray = looping & (animation_index >= frame_count)
+        before_start: np.ndarray = looping & (animation_index < 0)
+        animation_index[past_end] = 0
+        animation_index[before_start] = frame_count[before_start] - 1
+
+        self.animation_wrapped[:count] = turned | past_end | before_start
+
+    def updateMovement(self, delta_time: float) -> None:
+        count: int = self.count
+        walking: np.ndarray = self.active[:count] & self.has_waypoint[:count]
+        if not walking.any():
+            return
+
+        indices: np.ndarray = np.flatnonzero(walking)
+        delta_x: np.ndarray = self.waypoint_x[indices] - self.position_x[indices]
+        delta_y: np.ndarray = self.waypoint_y[indices] - self.position_y[indices]
+        node_dist: np.ndarray = np.sqrt((delta_x * delta_x) + (delta_y * delta_y))
+
+        # ? Arriving Spends the Frame; the Owner Aims at the Next Cell Before the Next Step
+        arrived: np.ndarray = node_dist <= ENTITY_ARRIVED_BUFFER
+        arrived_indices: np.ndarray = indices[arrived]
+        self.has_waypoint[arrived_indices] = False
+
+        moving: np.ndarray = indices[~arrived]
+        delta_x, delta_y, node_dist = delta_x[~arrived], delta_y[~arrived], node_dist[~arrived]
+        step: np.ndarray = self.move_speed[moving] * delta_time / node_dist
+
+        self.position_x[moving] += delta_x * step
+        self.position_y[moving] += delta_y * step
+        self.rotation[moving] = self.rotation_offset[moving] + np.arctan2(delta_y, -delta_x) * RAD_2_DEG
+
+        for index in arrived_indices.tolist():
+            arrival_handler: Callable[[], None] | None = self.arrival_handlers[index]
+            if not arrival_handler is None:
+                arrival_handler()
+
+    def findHits(self, position: tuple[float, float]) -> np.ndarray:
+        count: int = self.count
+        delta_x: np.ndarray = self.position_x[:count] - position[0]
+        delta_y: np.ndarray = self.position_y[:count] - position[1]
+        dist_sqr: np.ndarray = (delta_x * delta_x) + (delta_y * delta_y)
+
+        return np.flatnonzero(self.active[:count] & (dist_sqr <= self.collision_radius_sqr[:count]))
+
+    def resolvePlayerHits(self, players: tuple[Player, ...], maze: MazeManager, pathfinding: PathfindingService) -> None:
+        for player in players:
+            if player.isDead():
+                continue
+
+            for index in self.findHits(player.getPosition()).tolist():
+                # ? The First Hit Kills; Later Entities Find the Player Already Dead
+                if player.isDead():
+                    break
+
+                hit_handler: Callable[[Player, MazeManager, PathfindingService], None] | None = self.hit_handlers[index]
+                if not hit_handler is None:
+                    hit_handler(player, maze, pathfinding)
@@ -0,0 +1,100 @@
+import numpy as np
+from random import Random
+from .maze_grid import MazeGrid
+
+FLOOR_REGION_SIZE: int = 8
+
+# ? Draws Before a Band Lists its Floor Cells Outright; Most Bands Accept Within One or Two
+FLOOR_BAND_SAMPLE_ATTEMPTS: int = 8
+
+class FloorCellIndex:
+    def __init__(self, grid: MazeGrid, region_size: int = FLOOR_REGION_SIZE) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+        self.region_size: int = region_size
+
+        self.floor_cells: list[tuple[int, int]] = []
+        self.region_cells: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self.floor_mask: np.ndarray = np.zeros((self.column_count, self.row_count), dtype=np.bool_)
+        self.floor_flags: bytes = bytes(self.column_count * self.row_count)
+
+        # ? Every Offset a Centre Can Reach, Ordered by Whole-Cell Distance; No Layout Changes It
+        delta_xs, delta_ys = np.meshgrid(
+            np.arange(1 - self.column_count, self.column_count, dtype=np.int32),
+            np.arange(1 - self.row_count, self.row_count, dtype=np.int32),
+            indexing="ij"
+        )
+        delta_xs, delta_ys = delta_xs.ravel(), delta_ys.ravel()
+        radii: np.ndarray = np.floor(np.sqrt(delta_xs * delta_xs + delta_ys * delta_ys)).astype(np.int32)
+        order: np.ndarray = np.argsort(radii, kind="stable")
+
+        self.max_radius: int = int(radii.max())
+        self.ring_deltas: np.ndarray = np.stack((delta_xs[order], delta_ys[order]), axis=1)
+        self.ring_delta_list: list[tuple[int, int]] = [(x, y) for x, y in self.ring_deltas.tolist()]
+
+        ring_offsets: np.ndarray = np.zeros(self.max_radius + 2, dtype=np.int32)
+        ring_offsets[1:] = np.cumsum(np.bincount(radii, minlength=self.max_radius + 1))
+        self.ring_offsets: list[int] = ring_offsets.tolist()
+
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        self.floor_mask = grid.solid_mask == 0
+        self.floor_flags = self.floor_mask.tobytes()
+
+        self.floor_cells = [(x, y) for x, y in np.argwhere(self.floor_mask).tolist()]
+
+        self.region_cells = {}
+        for x, y in self.floor_cells:
+            self.region_cells.setdefault((x // self.region_size, y // self.region_size), []).append((x, y))
+
+        self.layout_version = grid.layout_version
+
+    def getRegion(self, cell: tuple[int, int]) -> tuple[int, int]:
+        return (cell[0] // self.region_size, cell[1] // self.region_size)
+
+    def sampleFloorCell(self, stream: Random) -> tuple[int, int]:
+        return self.floor_cells[int(stream.random() * len(self.floor_cells))]
+
+    def sampleRegionCell(self, region: tuple[int, int], stream: Random) -> tuple[int, int] | None:
+        cells: list[tuple[int, int]] | None = self.region_cells.get(region)
+        if not cells:
+            return None
+
+        return cells[int(stream.random() * len(cells))]
+
+    def sampleCellInBand(self, centre: tuple[int, int], min_radius: int, max_radius: int, stream: Random) -> tuple[int, int] | None:
+        x: int = max(0, min(centre[0], self.column_count - 1))
+        y: int = max(0, min(centre[1], self.row_count - 1))
+
+        # ? Offsets in the Band Sit Contiguously; Each Cell Has One, so Accepted Draws Stay Uniform
+        first: int = self.ring_offsets[max(0, min(min_radius, self.max_radius + 1))]
+        last: int = self.ring_offsets[max(0, min(max_radius + 1, self.max_radius + 1))]
+
+        if last <= first:
+            return None
+
+        for _ in range(FLOOR_BAND_SAMPLE_ATTEMPTS):
+            delta_x, delta_y = self.ring_delta_list[first + int(stream.random() * (last - first))]
+            cell_x: int = x + delta_x
+            cell_y: int = y + delta_y
+
+            if 0 <= cell_x < self.column_count and 0 <= cell_y < self.row_count and self.floor_flags[cell_x * self.row_count + cell_y]:
+                return (cell_x, cell_y)
+
+        # ? Mostly Wall or Off-Grid Bands List Their Floor Cells Instead of Rejecting Forever
+        cell_xs: np.ndarray = self.ring_deltas[first:last, 0] + x
+        cell_ys: np.ndarray = self.ring_deltas[first:last, 1] + y
+
+        is_inside: np.ndarray = (cell_xs >= 0) & (cell_xs < self.column_count) & (cell_ys >= 0) & (cell_ys < self.row_count)
+        cell_xs, cell_ys = cell_xs[is_inside], cell_ys[is_inside]
+
+        candidates: np.ndarray = np.flatnonzero(self.floor_mask[cell_xs, cell_ys])
+        if len(candidates) == 0:
+            return None
+
+        candidate: int = int(candidates[int(stream.random() * len(candidates))])
+        return (int(cell_xs[candidate]), int(cell_ys[candidate]))
@@ -0,0 +1,73 @@
+import numpy as np
+from ..scenes import shared_config
+from .distance_table import DistanceTable, DISTANCE_UNREACHABLE, DIRECTION_OFFSETS
+
+class FlowField:
+    def __init__(self) -> None:
+        self.cell: tuple[int, int] = (-1, -1)
+        self.goal_index: int = -1
+
+        self.distances: np.ndarray | None = None
+        self.next_hops: np.ndarray | None = None
+
+class FlowFieldService:
+    def __init__(self) -> None:
+        self.distance_table: DistanceTable | None = None
+        self.fields: dict[object, FlowField] = {}
+
+        self.rebuild_count: int = 0
+
+    def reset(self, distance_table: DistanceTable) -> None:
+        self.distance_table = distance_table
+        self.fields.clear()
+
+    def updateTarget(self, target: object, position: tuple[float, float]) -> None:
+        assert not self.distance_table is None
+
+        cell: tuple[int, int] = (
+            int((position[0] + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
+            int((position[1] + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+        )
+
+        field: FlowField | None = self.fields.get(target)
+        if field is None:
+            field = FlowField()
+            self.fields[target] = field
+
+        # ? Fields Only Change When the Target Crosses a Cell Boundary
+        if field.cell == cell:
+            return
+
+        field.cell = cell
+
+        # ? A Target Rounding Into a Wall Keeps its Last Floor Field
+        goal_index: int = self.distance_table.getFloorIndex(cell)
+        if goal_index < 0:
+            return
+
+        field.goal_index = goal_index
+        field.distances, field.next_hops = self.distance_table.getRow(goal_index)
+        self.rebuild_count += 1
+
+    def getDistance(self, target: object, cell: tuple[int, int]) -> int:
+        field: FlowField | None = self.fields.get(target)
+        if field is None or field.distances is None:
+            return DISTANCE_UNREACHABLE
+
+        cell_index: int = self.distance_table.getFloorIndex(cell)
+        if cell_index < 0:
+            return DISTANCE_UNREACHABLE
+
+        return int(field.distances[cell_index])
+
+    def getNextCell(self, target: object, cell: tuple[int, int]) -> tuple[int, int] | None:
+        field: FlowField | None = self.fields.get(target)
+        if field is None or field.distances is None:
+            return None
+
+        cell_index: int = self.distance_table.getFloorIndex(cell)
+        if cell_index < 0 or cell_index == field.goal_index or field.distances[cell_index] == DISTANCE_UNREACHABLE:
+            return None
+
+        dx, dy = DIRECTION_OFFSETS[field.next_hops[cell_index]]
+        return (cell[0] + dx, cell[1] + dy)
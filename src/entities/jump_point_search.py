@@ -0,0 +1,257 @@
+import heapq
+from .maze_grid import MazeGrid
+
+class JumpPointSearch:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+
+        # ? A One-Cell Wall Border Removes Every Bounds Check
+        self.stride: int = self.row_count + 2
+        self.cell_count: int = (self.column_count + 2) * self.stride
+        self.open_cells: bytearray = bytearray(self.cell_count)
+
+        # ? Per-Cell Extents of the Open Run Along Each Axis
+        self.run_x_min: list[int] = []
+        self.run_x_max: list[int] = []
+        self.run_y_min: list[int] = []
+        self.run_y_max: list[int] = []
+
+        # ? First Jump Point (Ignoring the Target) When Jumping From a Cell
+        self.x_jumps: dict[int, list[int]] = {}
+        self.y_jumps: dict[int, list[int]] = {}
+
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+        self.target_cell: int = -1
+        self.target_x: int = 0
+        self.target_y: int = 0
+        self.expansion_count: int = 0
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        stride: int = self.stride
+        open_cells: bytearray = bytearray(self.cell_count)
+        for x, column in enumerate(grid.solid_mask.tolist()):
+            base: int = (x + 1) * stride + 1
+            open_cells[base:base + self.row_count] = bytes(0 if solid else 1 for solid in column)
+
+        self.open_cells = open_cells
+        self.__buildRuns()
+        self.__buildJumps()
+
+        self.layout_version = grid.layout_version
+
+    def __buildRuns(self) -> None:
+        open_cells: bytearray = self.open_cells
+        stride: int = self.stride
+
+        self.run_x_min = [0] * self.cell_count
+        self.run_x_max = [0] * self.cell_count
+        self.run_y_min = [0] * self.cell_count
+        self.run_y_max = [0] * self.cell_count
+
+        for y in range(1, self.row_count + 1):
+            run_start: int = 1
+            for x in range(1, self.column_count + 2):
+                if open_cells[x * stride + y]:
+                    continue
+
+                for run_x in range(run_start, x):
+                    self.run_x_min[run_x * stride + y] = run_start
+                    self.run_x_max[run_x * stride + y] = x - 1
+
+                run_start = x + 1
+
+        for x in range(1, self.column_count + 1):
+            run_start: int = 1
+            for y in range(1, self.row_count + 2):
+                if open_cells[x * stride + y]:
+                    continue
+
+                for run_y in range(run_start, y):
+                    self.run_y_min[x * stride + run_y] = run_start
+                    self.run_y_max[x * stride + run_y] = y - 1
+
+                run_start = y + 1
+
+    def __buildJumps(self) -> None:
+        open_cells: bytearray = self.open_cells
+        stride: int = self.stride
+        cell_count: int = self.cell_count
+
+        # ? Horizontal Jumps Stop Where a Side Opens Past a Wall
+        self.x_jumps = {}
+        for step in (stride, -stride):
+            jumps: list[int] = [-1] * cell_count
+            cells = range(cell_count - 1, -1, -1) if step > 0 else range(cell_count)
+
+            for cell in cells:
+                if not open_cells[cell]:
+                    continue
+
+                if (open_cells[cell - 1] and not open_cells[cell - step - 1]) or (open_cells[cell + 1] and not open_cells[cell - step + 1]):
+                    jumps[cell] = cell
+                elif 0 <= cell + step < cell_count:
+                    jumps[cell] = jumps[cell + step]
+
+            self.x_jumps[step] = jumps
+
+        x_forward: list[int] = self.x_jumps[stride]
+        x_backward: list[int] = self.x_jumps[-stride]
+
+        # ? Vertical Jumps Also Stop Wherever a Horizontal Jump Would Succeed
+        self.y_jumps = {}
+        for step in (1, -1):
+            jumps: list[int] = [-1] * cell_count
+            cells = range(cell_count - 1, -1, -1) if step > 0 else range(cell_count)
+
+            for cell in cells:
+                if not open_cells[cell]:
+                    continue
+
+                if (
+                    (open_cells[cell - stride] and not open_cells[cell - stride - step]) or
+                    (open_cells[cell + stride] and not open_cells[cell + stride - step]) or
+                    x_forward[cell + stride] >= 0 or
+                    x_backward[cell - stride] >= 0
+                ):
+                    jumps[cell] = cell
+                else:
+                    jumps[cell] = jumps[cell + step]
+
+            self.y_jumps[step] = jumps
+
+    def __getCell(self, position: tuple[int, int]) -> int:
+        return (position[0] + 1) * self.stride + position[1] + 1
+
+    def __getPosition(self, cell: int) -> tuple[int, int]:
+        return (cell // self.stride - 1, cell % self.stride - 1)
+
+    def __jumpX(self, cell: int, step: int) -> int:
+        if not self.open_cells[cell]:
+            return -1
+
+        jump_cell: int = self.x_jumps[step][cell]
+
+        # ? The Target Ends the Jump Early if it Sits Ahead in the Same Run
+        x, y = cell // self.stride, cell % self.stride
+        if y == self.target_y + 1 and self.run_x_min[cell] <= self.target_x + 1 <= self.run_x_max[cell]:
+            if (self.target_x + 1 - x) * step >= 0:
+                if jump_cell < 0 or abs(self.target_cell - cell) < abs(jump_cell - cell):
+                    return self.target_cell
+
+        return jump_cell
+
+    def __jumpY(self, cell: int, step: int) -> int:
+        if not self.open_cells[cell]:
+            return -1
+
+        jump_cell: int = self.y_jumps[step][cell]
+
+        # ? Reaching the Target's Row Stops the Jump if the Target is in View
+        y: int = cell % self.stride
+        target_row_y: int = self.target_y + 1
+        if (target_row_y - y) * step >= 0 and self.run_y_min[cell] <= target_row_y <= self.run_y_max[cell]:
+            row_cell: int = cell + target_row_y - y
+
+            if self.run_x_min[row_cell] <= self.target_x + 1 <= self.run_x_max[row_cell]:
+                if jump_cell < 0 or abs(row_cell - cell) < abs(jump_cell - cell):
+                    return row_cell
+
+        return jump_cell
+
+    def __getSuccessorSteps(self, cell: int, parent: int) -> tuple[int, ...]:
+        stride: int = self.stride
+
+        if parent < 0:
+            return (stride, -stride, 1, -1)
+
+        # ? Prune to Straight-Ahead and Perpendicular Moves
+        if abs(cell - parent) >= stride:
+            step: int = stride if cell > parent else -stride
+            return (step, 1, -1)
+
+        step: int = 1 if cell > parent else -1
+        return (step, stride, -stride)
+
+    def search(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> list[tuple[int, int]]:
+        self.expansion_count = 0
+
+        ix, iy = initial_position
+        tx, ty = target_position
+        if not (0 <= ix < self.column_count and 0 <= iy < self.row_count and 0 <= tx < self.column_count and 0 <= ty < self.row_count):
+            return []
+
+        initial_cell: int = self.__getCell(initial_position)
+        self.target_cell = self.__getCell(target_position)
+        self.target_x, self.target_y = target_position
+
+        if initial_cell == self.target_cell:
+            return [initial_position]
+
+        if not self.open_cells[self.target_cell]:
+            return []
+
+        stride: int = self.stride
+        g_scores: dict[int, int] = { initial_cell: 0 }
+        parents: dict[int, int] = { initial_cell: -1 }
+        closed: set[int] = set()
+
+        open_set: list[tuple[int, int, int]] = [(abs(ix - tx) + abs(iy - ty), 0, initial_cell)]
+
+        while open_set:
+            _, current_g, current = heapq.heappop(open_set)
+
+            if current in closed:
+                continue
+
+            if current == self.target_cell:
+                return self.__expandPath(current, parents)
+
+            closed.add(current)
+            self.expansion_count += 1
+
+            for step in self.__getSuccessorSteps(current, parents[current]):
+                if abs(step) == stride:
+                    jump_cell: int = self.__jumpX(current + step, step)
+                    jump_length: int = abs(jump_cell - current) // stride
+                else:
+                    jump_cell: int = self.__jumpY(current + step, step)
+                    jump_length: int = abs(jump_cell - current)
+
+                if jump_cell < 0 or jump_cell in closed:
+                    continue
+
+                jump_g: int = current_g + jump_length
+                if jump_g < g_scores.get(jump_cell, jump_g + 1):
+                    g_scores[jump_cell] = jump_g
+                    parents[jump_cell] = current
+
+                    jx, jy = self.__getPosition(jump_cell)
+                    heapq.heappush(open_set, (jump_g + abs(jx - tx) + abs(jy - ty), jump_g, jump_cell))
+
+        return []
+
+    def __expandPath(self, cell: int, parents: dict[int, int]) -> list[tuple[int, int]]:
+        jump_points: list[int] = []
+        while cell >= 0:
+            jump_points.append(cell)
+            cell = parents[cell]
+
+        jump_points.reverse()
+
+        # ? Jump Points Are Joined by Straight Runs of Cells
+        path: list[tuple[int, int]] = [self.__getPosition(jump_points[0])]
+        for start_cell, end_cell in zip(jump_points, jump_points[1:]):
+            delta: int = end_cell - start_cell
+            step: int = (self.stride if delta > 0 else -self.stride) if abs(delta) >= self.stride else (1 if delta > 0 else -1)
+
+            cell = start_cell
+            while cell != end_cell:
+                cell += step
+                path.append(self.__getPosition(cell))
+
+        return path
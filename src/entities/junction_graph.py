@@ -0,0 +1,417 @@
+import heapq
+from dataclasses import dataclass
+from .maze_grid import MazeGrid
+
+HIERARCHY_CLUSTER_SIZE: int = 16
+HIERARCHY_LEVEL_COUNT: int = 0
+
+# ? Query Endpoints Are Spliced in as Temporary Nodes With Negative Ids
+JUNCTION_START_NODE: int = -1
+JUNCTION_GOAL_NODE: int = -2
+
+# ? Neighbour -> (Weight, Refinement); Level 0 Refines to Cells, Higher Levels to Nodes Below
+EdgeTable = dict[int, dict[int, tuple[int, tuple]]]
+
+@dataclass
+class Corridor:
+    first_node: int
+    last_node: int
+    cells: tuple[tuple[int, int], ...]
+
+@dataclass
+class JunctionGraphReport:
+    floor_cell_count: int
+    junction_count: int
+    corridor_count: int
+    level_node_counts: list[int]
+
+class JunctionGraph:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+
+        self.solid: list[list[int]] = []
+        self.node_positions: dict[int, tuple[int, int]] = {}
+        self.edges: EdgeTable = {}
+
+        # ? Every Corridor Cell Knows its Corridor and Offset for Query Splicing
+        self.corridors: list[Corridor] = []
+        self.corridor_cells: dict[tuple[int, int], tuple[int, int]] = {}
+
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        self.solid = grid.solid_mask.tolist()
+        self.node_positions = {}
+        self.edges = {}
+        self.corridors = []
+        self.corridor_cells = {}
+
+        for x in range(self.column_count):
+            for y in range(self.row_count):
+                if not self.solid[x][y] and len(self.getFloorNeighbours((x, y))) != 2:
+                    self.__addNode((x, y))
+
+        for node in list(self.node_positions):
+            self.__traceCorridors(node)
+
+        # ? Loops With no Junction on Them Get One so Every Cell is Covered
+        for x in range(self.column_count):
+            for y in range(self.row_count):
+                if not self.solid[x][y] and not (x, y) in self.corridor_cells and not self.getNode((x, y)) in self.node_positions:
+                    self.__traceCorridors(self.__addNode((x, y)))
+
+        self.layout_version = grid.layout_version
+
+    def getNode(self, position: tuple[int, int]) -> int:
+        return position[0] * self.row_count + position[1]
+
+    def getFloorNeighbours(self, position: tuple[int, int]) -> list[tuple[int, int]]:
+        x, y = position
+        neighbours: list[tuple[int, int]] = []
+
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.column_count and 0 <= ny < self.row_count and not self.solid[nx][ny]:
+                neighbours.append((nx, ny))
+
+        return neighbours
+
+    def __addNode(self, position: tuple[int, int]) -> int:
+        node: int = self.getNode(position)
+        self.node_positions[node] = position
+        self.edges[node] = {}
+
+        return node
+
+    def __addEdge(self, first_node: int, last_node: int, cells: tuple[tuple[int, int], ...]) -> None:
+        weight: int = len(cells) - 1
+        if first_node == last_node:
+            return
+
+        # ? Parallel Corridors Keep Only the Shorter One
+        current: tuple[int, tuple] | None = self.edges[first_node].get(last_node)
+        if current is None or weight < current[0]:
+            self.edges[first_node][last_node] = (weight, cells)
+            self.edges[last_node][first_node] = (weight, cells[::-1])
+
+    def __traceCorridors(self, node: int) -> None:
+        node_position: tuple[int, int] = self.node_positions[node]
+
+        for neighbour in self.getFloorNeighbours(node_position):
+            if self.getNode(neighbour) in self.node_positions:
+                self.__addEdge(node, self.getNode(neighbour), (node_position, neighbour))
+                continue
+
+            if neighbour in self.corridor_cells:
+                continue
+
+            cells: list[tuple[int, int]] = [node_position]
+            previous: tuple[int, int] = node_position
+            current: tuple[int, int] = neighbour
+
+            # ? Corridor Cells Have Exactly Two Floor Neighbours, so the Walk Never Branches
+            while not self.getNode(current) in self.node_positions:
+                cells.append(current)
+                first, second = self.getFloorNeighbours(current)
+                previous, current = current, (second if first == previous else first)
+
+            cells.append(current)
+
+            corridor_index: int = len(self.corridors)
+            self.corridors.append(Corridor(node, self.getNode(current), tuple(cells)))
+            for offset in range(1, len(cells) - 1):
+                self.corridor_cells[cells[offset]] = (corridor_index, offset)
+
+            self.__addEdge(node, self.getNode(current), tuple(cells))
+
+class HierarchicalPathfinder:
+    def __init__(
+        self,
+        grid: MazeGrid,
+        cluster_size: int = HIERARCHY_CLUSTER_SIZE,
+        level_count: int = HIERARCHY_LEVEL_COUNT
+    ) -> None:
+        self.cluster_size: int = cluster_size
+        self.level_count: int = level_count
+
+        self.graph: JunctionGraph = JunctionGraph(grid)
+        self.level_nodes: list[set[int]] = []
+        self.level_edges: list[EdgeTable] = []
+
+        # ? Query-Local Edges Touching the Temporary Endpoint Nodes
+        self.extra_edges: list[EdgeTable] = []
+        self.positions: dict[int, tuple[int, int]] = {}
+
+        self.expansion_count: int = 0
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        if self.graph.layout_version != grid.layout_version:
+            self.graph.setGrid(grid)
+
+        self.positions = dict(self.graph.node_positions)
+        self.level_nodes = [set(self.graph.node_positions)]
+        self.level_edges = [self.graph.edges]
+        self.extra_edges = [{} for _ in range(self.level_count + 1)]
+
+        for level in range(1, self.level_count + 1):
+            self.__buildLevel(level)
+
+        self.layout_version = grid.layout_version
+
+    def getCluster(self, node: int, level: int) -> tuple[int, int]:
+        x, y = self.positions[node]
+        cluster_size: int = self.cluster_size << (level - 1)
+
+        return (x // cluster_size, y // cluster_size)
+
+    def __getEdges(self, level: int, node: int):
+        edges = self.level_edges[level].get(node)
+        if not edges is None:
+            yield from edges.items()
+
+        extra_edges = self.extra_edges[level].get(node)
+        if not extra_edges is None:
+            yield from extra_edges.items()
+
+    def __getEdge(self, level: int, first_node: int, last_node: int) -> tuple[int, tuple]:
+        edges = self.extra_edges[level].get(first_node)
+        if not edges is None and last_node in edges:
+            return edges[last_node]
+
+        return self.level_edges[level][first_node][last_node]
+
+    def __searchCluster(self, level: int, source: int, cluster: tuple[int, int]) -> tuple[dict[int, int], dict[int, int]]:
+        # ? Dijkstra on the Level Below, Confined to One Cluster of This Level
+        distances: dict[int, int] = { source: 0 }
+        parents: dict[int, int] = { source: source }
+        open_set: list[tuple[int, int]] = [(0, source)]
+
+        while open_set:
+            distance, node = heapq.heappop(open_set)
+            if distance > distances[node]:
+                continue
+
+            self.expansion_count += 1
+
+            for neighbour, (weight, _) in self.__getEdges(level - 1, node):
+                if self.getCluster(neighbour, level) != cluster:
+                    continue
+
+                neighbour_distance: int = distance + weight
+                if neighbour_distance < distances.get(neighbour, neighbour_distance + 1):
+                    distances[neighbour] = neighbour_distance
+                    parents[neighbour] = node
+                    heapq.heappush(open_set, (neighbour_distance, neighbour))
+
+        return distances, parents
+
+    def __getTrail(self, parents: dict[int, int], node: int) -> tuple[int, ...]:
+        trail: list[int] = [node]
+        while parents[node] != node:
+            node = parents[node]
+            trail.append(node)
+
+        return tuple(trail[::-1])
+
+    def __connectNode(self, level: int, node: int, targets: set[int], edges: EdgeTable) -> list[int]:
+        cluster: tuple[int, int] = self.getCluster(node, level)
+        node_edges: dict[int, tuple[int, tuple]] = edges.setdefault(node, {})
+        crossed_nodes: list[int] = []
+
+        # ? Edges Leaving the Cluster Carry Over Unchanged
+        for neighbour, (weight, _) in self.__getEdges(level - 1, node):
+            if self.getCluster(neighbour, level) != cluster:
+                node_edges[neighbour] = (weight, (node, neighbour))
+                crossed_nodes.append(neighbour)
+
+        # ? Paths Inside the Cluster Become Single Weighted Edges
+        distances, parents = self.__searchCluster(level, node, cluster)
+        for target, distance in distances.items():
+            if target != node and target in targets:
+                current: tuple[int, tuple] | None = node_edges.get(target)
+                if current is None or distance < current[0]:
+                    node_edges[target] = (distance, self.__getTrail(parents, target))
+
+        return crossed_nodes
+
+    def __buildLevel(self, level: int) -> None:
+        lower_nodes: set[int] = self.level_nodes[level - 1]
+
+        # ? Only Nodes With an Edge Crossing a Cluster Border Survive to the Next Level
+        nodes: set[int] = set()
+        for node in lower_nodes:
+            cluster: tuple[int, int] = self.getCluster(node, level)
+            if any(self.getCluster(neighbour, level) != cluster for neighbour, _ in self.__getEdges(level - 1, node)):
+                nodes.add(node)
+
+        edges: EdgeTable = {}
+        for node in nodes:
+            self.__connectNode(level, node, nodes, edges)
+
+        self.level_nodes.append(nodes)
+        self.level_edges.append(edges)
+
+    def __addExtraEdge(self, level: int, first_node: int, last_node: int, weight: int, refinement: tuple) -> None:
+        first_edges: dict[int, tuple[int, tuple]] = self.extra_edges[level].setdefault(first_node, {})
+
+        current: tuple[int, tuple] | None = first_edges.get(last_node)
+        if current is None or weight < current[0]:
+            first_edges[last_node] = (weight, refinement)
+            self.extra_edges[level].setdefault(last_node, {})[first_node] = (weight, refinement[::-1])
+
+    def __spliceEndpoint(self, endpoint: int, position: tuple[int, int]) -> None:
+        self.positions[endpoint] = position
+
+        node: int = self.graph.getNode(position)
+        if node in self.graph.node_positions:
+            self.__addExtraEdge(0, endpoint, node, 0, (position,))
+            return
+
+        corridor_index, offset = self.graph.corridor_cells[position]
+        corridor: Corridor = self.graph.corridors[corridor_index]
+
+        self.__addExtraEdge(0, endpoint, corridor.first_node, offset, corridor.cells[offset::-1])
+        self.__addExtraEdge(0, endpoint, corridor.last_node, len(corridor.cells) - 1 - offset, corridor.cells[offset:])
+
+    def __spliceSharedCorridor(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> None:
+        initial_corridor: tuple[int, int] | None = self.graph.corridor_cells.get(initial_position)
+        target_corridor: tuple[int, int] | None = self.graph.corridor_cells.get(target_position)
+
+        if initial_corridor is None or target_corridor is None or initial_corridor[0] != target_corridor[0]:
+            return
+
+        cells: tuple[tuple[int, int], ...] = self.graph.corridors[initial_corridor[0]].cells
+        initial_offset, target_offset = initial_corridor[1], target_corridor[1]
+
+        if initial_offset <= target_offset:
+            refinement: tuple = cells[initial_offset:target_offset + 1]
+        else:
+            refinement = cells[target_offset:initial_offset + 1][::-1]
+
+        self.__addExtraEdge(0, JUNCTION_START_NODE, JUNCTION_GOAL_NODE, abs(target_offset - initial_offset), refinement)
+
+    def __searchTopLevel(self) -> list[int]:
+        level: int = self.level_count
+        goal_x, goal_y = self.positions[JUNCTION_GOAL_NODE]
+
+        g_scores: dict[int, int] = { JUNCTION_START_NODE: 0 }
+        parents: dict[int, int] = { JUNCTION_START_NODE: JUNCTION_START_NODE }
+        open_set: list[tuple[int, int, int]] = [(0, 0, JUNCTION_START_NODE)]
+
+        while open_set:
+            _, g_score, node = heapq.heappop(open_set)
+
+            if node == JUNCTION_GOAL_NODE:
+                return list(self.__getTrail(parents, node))
+
+            if g_score > g_scores[node]:
+                continue
+
+            self.expansion_count += 1
+
+            for neighbour, (weight, _) in self.__getEdges(level, node):
+                neighbour_g: int = g_score + weight
+                if neighbour_g < g_scores.get(neighbour, neighbour_g + 1):
+                    g_scores[neighbour] = neighbour_g
+                    parents[neighbour] = node
+
+                    x, y = self.positions[neighbour]
+                    heapq.heappush(open_set, (neighbour_g + abs(x - goal_x) + abs(y - goal_y), neighbour_g, neighbour))
+
+        return []
+
+    def __refineEdge(self, level: int, first_node: int, last_node: int, path: list[tuple[int, int]]) -> None:
+        _, refinement = self.__getEdge(level, first_node, last_node)
+
+        if level == 0:
+            path.extend(refinement[1:])
+            return
+
+        for lower_first, lower_last in zip(refinement, refinement[1:]):
+            self.__refineEdge(level - 1, lower_first, lower_last, path)
+
+    def search(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> list[tuple[int, int]]:
+        self.expansion_count = 0
+
+        ix, iy = initial_position
+        tx, ty = target_position
+        if not (0 <= ix < self.graph.column_count and 0 <= iy < self.graph.row_count and 0 <= tx < self.graph.column_count and 0 <= ty < self.graph.row_count):
+            return []
+
+        if self.graph.solid[tx][ty]:
+            return []
+
+        if initial_position == target_position:
+            return [initial_position]
+
+        # ? A Start Inside a Wall Steps Out Through its Best Floor Neighbour
+        if self.graph.solid[ix][iy]:
+            best_path: list[tuple[int, int]] = []
+            for neighbour in self.graph.getFloorNeighbours(initial_position):
+                path: list[tuple[int, int]] = self.search(neighbour, target_position)
+                if path and (not best_path or len(path) < len(best_path) - 1):
+                    best_path = [initial_position] + path
+
+            return best_path
+
+        try:
+            self.__spliceEndpoint(JUNCTION_START_NODE, initial_position)
+            self.__spliceEndpoint(JUNCTION_GOAL_NODE, target_position)
+            self.__spliceSharedCorridor(initial_position, target_position)
+
+            # ? Each Level Sees the Endpoints as Border Nodes of Their Clusters
+            endpoints: set[int] = { JUNCTION_START_NODE, JUNCTION_GOAL_NODE }
+            for level in range(1, self.level_count + 1):
+                level_nodes: set[int] = self.level_nodes[level]
+                spliced_nodes: set[int] = set(endpoints)
+                pending_nodes: list[int] = list(endpoints)
+                targets: set[int] = level_nodes | spliced_nodes
+
+                # ? A Corridor Can Leave a Cluster and Return, Stranding Non-Border Nodes Across it
+                while pending_nodes:
+                    for crossed_node in self.__connectNode(level, pending_nodes.pop(), targets, self.extra_edges[level]):
+                        if not crossed_node in level_nodes and not crossed_node in spliced_nodes:
+                            spliced_nodes.add(crossed_node)
+                            targets.add(crossed_node)
+                            pending_nodes.append(crossed_node)
+
+                # ? Mirror Spliced Edges so Searches Can Arrive at the Goal
+                for spliced_node in spliced_nodes:
+                    for neighbour, (weight, refinement) in list(self.extra_edges[level][spliced_node].items()):
+                        neighbour_edges: dict[int, tuple[int, tuple]] = self.extra_edges[level].setdefault(neighbour, {})
+
+                        current: tuple[int, tuple] | None = neighbour_edges.get(spliced_node)
+                        if current is None or weight < current[0]:
+                            neighbour_edges[spliced_node] = (weight, refinement[::-1])
+
+            trail: list[int] = self.__searchTopLevel()
+            if not trail:
+                return []
+
+            path: list[tuple[int, int]] = [initial_position]
+            for first_node, last_node in zip(trail, trail[1:]):
+                self.__refineEdge(self.level_count, first_node, last_node, path)
+
+            return path
+        finally:
+            for extra_edges in self.extra_edges:
+                extra_edges.clear()
+
+            self.positions.pop(JUNCTION_START_NODE, None)
+            self.positions.pop(JUNCTION_GOAL_NODE, None)
+
+    def getReport(self) -> JunctionGraphReport:
+        floor_cell_count: int = sum(1 for column in self.graph.solid for solid in column if not solid)
+
+        return JunctionGraphReport(
+            floor_cell_count,
+            len(self.graph.node_positions),
+            len(self.graph.corridors),
+            [len(nodes) for nodes in self.level_nodes]
+        )
@@ -0,0 +1,101 @@
+import numpy as np
+from .maze_grid import MazeGrid
+
+class LineOfSightIndex:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+
+        # ? Bit x of Row y (and Bit y of Column x) is Set When That Cell is Solid
+        self.row_masks: list[int] = []
+        self.column_masks: list[int] = []
+
+        # ? Solid Counts Along Each Axis, for Answering Many Queries With NumPy
+        self.row_prefix: np.ndarray = np.zeros((self.column_count + 1, self.row_count), dtype=np.int32)
+        self.column_prefix: np.ndarray = np.zeros((self.column_count, self.row_count + 1), dtype=np.int32)
+
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        solid: np.ndarray = grid.solid_mask.astype(np.int32)
+        column_weights: list[int] = [1 << x for x in range(self.column_count)]
+        row_weights: list[int] = [1 << y for y in range(self.row_count)]
+
+        solid_lists: list[list[int]] = solid.tolist()
+        self.column_masks = [sum(weight for weight, is_solid in zip(row_weights, column) if is_solid) for column in solid_lists]
+        self.row_masks = [sum(weight for weight, is_solid in zip(column_weights, row) if is_solid) for row in solid.T.tolist()]
+
+        self.row_prefix[1:, :] = np.cumsum(solid, axis=0)
+        self.column_prefix[:, 1:] = np.cumsum(solid, axis=1)
+
+        self.layout_version = grid.layout_version
+
+    def isRowClear(self, y: int, first_x: int, last_x: int) -> bool:
+        if first_x > last_x:
+            first_x, last_x = last_x, first_x
+
+        span: int = ((1 << (last_x - first_x + 1)) - 1) << first_x
+        return self.row_masks[y] & span == 0
+
+    def isColumnClear(self, x: int, first_y: int, last_y: int) -> bool:
+        if first_y > last_y:
+            first_y, last_y = last_y, first_y
+
+        span: int = ((1 << (last_y - first_y + 1)) - 1) << first_y
+        return self.column_masks[x] & span == 0
+
+    def __getNextBit(self, mask: int, index: int, step: int, limit: int) -> int:
+        if step > 0:
+            ahead: int = mask >> (index + 1)
+            if ahead == 0:
+                return limit
+
+            # ? Lowest Set Bit Ahead of the Cell
+            return index + (ahead & -ahead).bit_length()
+
+        behind: int = mask & ((1 << index) - 1)
+        if behind == 0:
+            return -1
+
+        # ? Highest Set Bit Behind the Cell
+        return behind.bit_length() - 1
+
+    def getNextWall(self, cell: tuple[int, int], delta: tuple[int, int]) -> int:
+        x, y = cell
+        delta_x, delta_y = delta
+
+        if delta_x != 0:
+            return self.__getNextBit(self.row_masks[y], x, delta_x, self.column_count)
+
+        return self.__getNextBit(self.column_masks[x], y, delta_y, self.row_count)
+
+    def hasLineOfSight(self, first_cell: tuple[int, int], last_cell: tuple[int, int]) -> bool:
+        first_x, first_y = first_cell
+        last_x, last_y = last_cell
+
+        if first_x == last_x:
+            return self.isColumnClear(first_x, first_y, last_y)
+
+        if first_y == last_y:
+            return self.isRowClear(first_y, first_x, last_x)
+
+        return False
+
+    def hasLineOfSightBatch(self, first_cells: np.ndarray, last_cells: np.ndarray) -> np.ndarray:
+        first_x, first_y = first_cells[:, 0], first_cells[:, 1]
+        last_x, last_y = last_cells[:, 0], last_cells[:, 1]
+
+        low_x, high_x = np.minimum(first_x, last_x), np.maximum(first_x, last_x)
+        low_y, high_y = np.minimum(first_y, last_y), np.maximum(first_y, last_y)
+
+        # ? Clear Spans Hold Zero Solid Cells Between the Prefix Endpoints
+        same_column: np.ndarray = first_x == last_x
+        column_walls: np.ndarray = self.column_prefix[first_x, high_y + 1] - self.column_prefix[first_x, low_y]
+
+        same_row: np.ndarray = first_y == last_y
+        row_walls: np.ndarray = self.row_prefix[high_x + 1, first_y] - self.row_prefix[low_x, first_y]
+
+        return (same_column & (column_walls == 0)) | (same_row & (row_walls == 0))
@@ -0,0 +1,103 @@
+import numpy as np
+from collections import deque
+from .maze_grid import MazeGrid
+from .distance_table import DIRECTION_OFFSETS
+
+COMPONENT_NONE: int = -1
+
+class MazeComponents:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+
+        self.labels: np.ndarray = np.full((self.column_count, self.row_count), COMPONENT_NONE, dtype=np.int32)
+        self.label_lists: list[list[int]] = []
+
+        # ? Per-Component Cell Coordinates for Vectorised Nearest-Cell Snapping
+        self.component_xs: list[np.ndarray] = []
+        self.component_ys: list[np.ndarray] = []
+
+        self.layout_version: int = -1
+        self.setGrid(grid)
+
+    def setGrid(self, grid: MazeGrid) -> None:
+        assert grid.column_count == self.column_count and grid.row_count == self.row_count
+
+        solid: list[list[int]] = grid.solid_mask.tolist()
+        labels: list[list[int]] = [[COMPONENT_NONE] * self.row_count for _ in range(self.column_count)]
+
+        self.component_xs = []
+        self.component_ys = []
+
+        # ? Flood Fill Each Unlabelled Floor Cell Once
+        for x in range(self.column_count):
+            for y in range(self.row_count):
+                if solid[x][y] or labels[x][y] != COMPONENT_NONE:
+                    continue
+
+                label: int = len(self.component_xs)
+                labels[x][y] = label
+
+                cells: list[tuple[int, int]] = [(x, y)]
+                frontier: deque[tuple[int, int]] = deque(cells)
+
+                while frontier:
+                    cx, cy = frontier.popleft()
+
+                    for dx, dy in DIRECTION_OFFSETS:
+                        nx, ny = cx + dx, cy + dy
+                        if 0 <= nx < self.column_count and 0 <= ny < self.row_count and not solid[nx][ny] and labels[nx][ny] == COMPONENT_NONE:
+                            labels[nx][ny] = label
+                            cells.append((nx, ny))
+                            frontier.append((nx, ny))
+
+                component_cells: np.ndarray = np.array(cells, dtype=np.int32)
+                self.component_xs.append(component_cells[:, 0])
+                self.component_ys.append(component_cells[:, 1])
+
+        self.label_lists = labels
+        self.labels[:, :] = labels
+        self.layout_version = grid.layout_version
+
+    def getComponentCount(self) -> int:
+        return len(self.component_xs)
+
+    def getLabel(self, cell: tuple[int, int]) -> int:
+        x, y = cell
+        if 0 <= x < self.column_count and 0 <= y < self.row_count:
+            return self.label_lists[x][y]
+
+        return COMPONENT_NONE
+
+    def getStartLabel(self, cell: tuple[int, int]) -> int:
+        label: int = self.getLabel(cell)
+        if label != COMPONENT_NONE:
+            return label
+
+        # ? Searches Starting in a Wall Step Out Into a Neighbouring Component
+        x, y = cell
+        for dx, dy in DIRECTION_OFFSETS:
+            label = self.getLabel((x + dx, y + dy))
+            if label != COMPONENT_NONE:
+                return label
+
+        return COMPONENT_NONE
+
+    def isReachable(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> bool:
+        label: int = self.getLabel(target_position)
+        return label != COMPONENT_NONE and label == self.getStartLabel(initial_position)
+
+    def snapTarget(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> tuple[int, int] | None:
+        label: int = self.getStartLabel(initial_position)
+        if label == COMPONENT_NONE:
+            return None
+
+        if self.getLabel(target_position) == label:
+            return target_position
+
+        # ? Nearest by Manhattan Distance, Ties Going to the First Labelled Cell
+        xs: np.ndarray = self.component_xs[label]
+        ys: np.ndarray = self.component_ys[label]
+        nearest_index: int = int(np.argmin(np.abs(xs - target_position[0]) + np.abs(ys - target_position[1])))
+
+        return (int(xs[nearest_index]), int(ys[nearest_index]))
@@ -0,0 +1,60 @@
+import numpy as np
+import pygame as pg
+
+LAYOUT_WALL_CODE: int = 0x000000
+
+class MazeGrid:
+    def __init__(self, column_count: int, row_count: int, prop_table: dict[int, int]) -> None:
+        self.column_count: int = column_count
+        self.row_count: int = row_count
+
+        # ? Indexed [x][y] Like the Nested Lists it Replaces
+        self.solid_mask: np.ndarray = np.zeros((column_count, row_count), dtype=np.uint8)
+        self.prop_codes: np.ndarray = np.zeros((column_count, row_count), dtype=np.uint8)
+        self.floor_mask: np.ndarray = np.zeros((column_count, row_count), dtype=np.bool_)
+
+        # ? Bumped on Every Decode so Derived Tables Know to Rebuild
+        self.layout_version: int = 0
+
+        # ? Colour Code Lookup Table, Sorted for Binary Search
+        colour_codes: list[int] = sorted(prop_table)
+        self.layout_codes: np.ndarray = np.array(colour_codes, dtype=np.uint32)
+        self.layout_props: np.ndarray = np.array([prop_table[code] for code in colour_codes], dtype=np.uint8)
+
+    def __getitem__(self, x: int) -> np.ndarray:
+        return self.solid_mask[x]
+
+    def decodeLayout(self, layout: pg.Surface) -> None:
+        layout_width, layout_height = layout.get_size()
+        assert layout_width >= self.column_count
+        assert layout_height >= self.row_count
+
+        rgb: np.ndarray = pg.surfarray.array3d(layout)[:self.column_count, :self.row_count].astype(np.uint32)
+        colour_codes: np.ndarray = (rgb[:, :, 0] << 16) | (rgb[:, :, 1] << 8) | rgb[:, :, 2]
+
+        self.layout_version += 1
+
+        self.solid_mask[:, :] = colour_codes == LAYOUT_WALL_CODE
+        self.floor_mask[:, :] = rgb[:, :, 0] == 255
+
+        # ? Look Every Cell's Colour Up in the Prop Table at Once
+        if len(self.layout_codes) == 0:
+            self.prop_codes.fill(0)
+            return
+
+        table_indices: np.ndarray = np.minimum(
+            np.searchsorted(self.layout_codes, colour_codes),
+            len(self.layout_codes) - 1
+        )
+
+        self.prop_codes[:, :] = np.where(
+            self.layout_codes[table_indices] == colour_codes,
+            self.layout_props[table_indices],
+            0
+        )
+
+    def getCells(self, mask: np.ndarray) -> list[tuple[int, int]]:
+        return [(x, y) for x, y in np.argwhere(mask).tolist()]
+
+    def getPropCells(self, prop_code: int) -> list[tuple[int, int]]:
+        return self.getCells(self.prop_codes == prop_code)
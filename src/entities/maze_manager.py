@@ -1,9 +1,17 @@
 import os
 import pygame as pg
 from enum import IntEnum
-from random import random
+from random import Random
+from .maze_grid import MazeGrid
+from .distance_table import DistanceTable, getDistanceTable
+from .maze_components import MazeComponents
+from .line_of_sight import LineOfSightIndex
+from .floor_cells import FloorCellIndex
+from .prop_table import PropTable
+from .pathfinding_service import PathSolver
+from .__utils import getJumpPointSearch, getHierarchicalPathfinder
 from ..scenes import shared_config
-from ..core import getTextures, getTexture
+from ..core import getTextures, getTexture, loadLayout, getRandomStream, RandomStream
 
 MAZE_LAYOUT_FILE_EXTENSION: str = ".png"
 MAZE_LAYOUT_FOLDER_PATH: str = "./assets/mazes/"
@@ -15,6 +23,9 @@ COIN_ANIMATION_TIME: float = 0.15
 STAR_ANIMATION_TIME: float = 0.15
 SHIMMER_ANIMATION_TIME: float = 0.1
 
+# ? Set to a Folder Path to Persist Distance Tables Between Runs
+DISTANCE_TABLE_CACHE_FOLDER_PATH: str | None = None
+
 class PropType(IntEnum):
     NONE = 0
     COIN = 1
@@ -22,17 +33,41 @@ class PropType(IntEnum):
     PURSE = 3
     STAR = 4
 
+LAYOUT_PROP_TABLE: dict[int, PropType] = {
+    0xFF0000: PropType.STAR,
+    0xFF00FF: PropType.TREASURE,
+    0xFFFF00: PropType.COIN
+}
+
+class PathfindingMode(IntEnum):
+    DISTANCE_TABLE = 0
+    ASTAR = 1
+    JUMP_POINT = 2
+    JUNCTION_GRAPH = 3
+
+DEFAULT_PATHFINDING_MODE: PathfindingMode = PathfindingMode.DISTANCE_TABLE
+
 class MazeManager:
-    def __init__(self) -> None:
-        self.solid_mask: list[list[bool]] = [
-            [False for _ in range(shared_config.GRID_ROW_COUNT)]
-            for _ in range(shared_config.GRID_COLUMN_COUNT)
-        ]
+    __slots__ = (
+        "grid", "distance_table", "components", "line_of_sight", "floor_cells", "pathfinding_mode",
+        "tiles_image", "wall_textures", "floor_textures", "coin_textures", "star_textures", "chest_texture",
+        "purse_texture", "shimmer_textures", "props", "coin_animation_time", "star_animation_time",
+        "shimmer_animation_time", "coin_animation_index", "star_animation_index", "shimmer_animation_index",
+        "coin_animation_direction", "layout_file_paths"
+    )
 
-        self.prop_mask: list[list[PropType]] = [
-            [PropType.NONE for _ in range(shared_config.GRID_ROW_COUNT)]
-            for _ in range(shared_config.GRID_COLUMN_COUNT)
-        ]
+    def __init__(self) -> None:
+        self.grid: MazeGrid = MazeGrid(
+            shared_config.GRID_COLUMN_COUNT,
+            shared_config.GRID_ROW_COUNT,
+            LAYOUT_PROP_TABLE
+        )
+
+        self.distance_table: DistanceTable | None = None
+        self.components: MazeComponents | None = None
+        self.line_of_sight: LineOfSightIndex | None = None
+        self.floor_cells: FloorCellIndex | None = None
+        self.pathfinding_mode: PathfindingMode = DEFAULT_PATHFINDING_MODE
 
         self.tiles_image: pg.Surface = pg.Surface((
             shared_config.GRID_COLUMN_COUNT * shared_config.GRID_CELL_SIZE,
@@ -50,12 +85,7 @@ class MazeManager:
 
         self.shimmer_textures: list[pg.Surface] = getTextures(6, 1, False, (8, 2))
 
-        self.coin_positions: list[tuple[int, int]] = []
-        self.treasure_positions: list[tuple[int, int]] = []
-        self.purse_positions: list[tuple[int, int]] = []
-        self.star_positions: list[tuple[int, int]] = []
-
-        self.purse_payloads: dict[tuple[int, int], int] = dict[tuple[int, int], int]()
+        self.props: PropTable = PropTable(shared_config.GRID_COLUMN_COUNT, shared_config.GRID_ROW_COUNT)
 
         self.coin_animation_time: float = 0.0
         self.star_animation_time: float = 0.0
@@ -87,61 +117,57 @@ class MazeManager:
 
         self.coin_animation_direction = 1
 
-        self.coin_positions.clear()
-        self.treasure_positions.clear()
-        self.purse_positions.clear()
-        self.star_positions.clear()
-        self.purse_payloads.clear()
-
-        layout_index: int = int(random() * len(self.layout_file_paths))
-        layout: pg.Surface = pg.image.load(self.layout_file_paths[layout_index])
-
-        layout_width, layout_height = layout.get_size()
-        assert layout_width >= shared_config.GRID_COLUMN_COUNT
-        assert layout_height >= shared_config.GRID_ROW_COUNT
-
-        for x in range(shared_config.GRID_COLUMN_COUNT):
-            for y in range(shared_config.GRID_ROW_COUNT):
-                color: pg.Color = layout.get_at((x, y))
-                color_code: int = (color.r << 16) | (color.g << 8) | (color.b)
-
-                self.prop_mask[x][y] = PropType.NONE
-
-                if color.r == 255:
-                    self.solid_mask[x][y] = False
-
-                    texture_index: int = 0
-                    if random() <= FLOOR_VARIANT_PROBABILITY:
-                        texture_index = int(random() * len(self.wall_textures))
-
-                    self.tiles_image.blit(
-                        self.floor_textures[texture_index],
-                        (x * shared_config.GRID_CELL_SIZE, y * shared_config.GRID_CELL_SIZE)
-                    )
-
-                match color_code:
-                    case 0x000000:
-                        self.solid_mask[x][y] = True
-
-                        texture_index: int = 0
-                        if random() <= WALL_VARIANT_PROBABILITY:
-                            texture_index = int(random() * len(self.wall_textures))
-
-                        self.tiles_image.blit(
-                            self.wall_textures[texture_index],
-                            (x * shared_config.GRID_CELL_SIZE, y * shared_config.GRID_CELL_SIZE)
-                        )
-                    case 0xFF0000:
-                        self.star_positions.append((x, y))
-                        self.prop_mask[x][y] = PropType.STAR
-                    case 0xFF00FF:
-                        self.treasure_positions.append((x, y))
-                        self.prop_mask[x][y] = PropType.TREASURE
-                    case 0xFFFF00:
-                        self.coin_positions.append((x, y))
-                        self.prop_mask[x][y] = PropType.COIN
-                    case _:
-                        pass
+        self.props.clear()
+
+        layout_index: int = int(getRandomStream(RandomStream.MAZE_LAYOUT).random() * len(self.layout_file_paths))
+        layout_file_path: str = self.layout_file_paths[layout_index]
+        layout: pg.Surface = loadLayout(layout_file_path)
+
+        self.grid.decodeLayout(layout)
+        self.distance_table = getDistanceTable(layout_file_path, self.grid, DISTANCE_TABLE_CACHE_FOLDER_PATH)
+
+        if self.components is None:
+            self.components = MazeComponents(self.grid)
+        else:
+            self.components.setGrid(self.grid)
+
+        if self.line_of_sight is None:
+            self.line_of_sight = LineOfSightIndex(self.grid)
+        else:
+            self.line_of_sight.setGrid(self.grid)
+
+        if self.floor_cells is None:
+            self.floor_cells = FloorCellIndex(self.grid)
+        else:
+            self.floor_cells.setGrid(self.grid)
+
+        for prop_type in (PropType.STAR, PropType.TREASURE, PropType.COIN):
+            self.props.addCells(self.grid.getPropCells(prop_type), prop_type)
+
+        tile_blits: list[tuple[pg.Surface, tuple[int, int]]] = []
+        texture_stream: Random = getRandomStream(RandomStream.MAZE_TEXTURES)
+
+        for x, y in self.grid.getCells(self.grid.floor_mask):
+            texture_index: int = 0
+            if texture_stream.random() <= FLOOR_VARIANT_PROBABILITY:
+                texture_index = int(texture_stream.random() * len(self.wall_textures))
+
+            tile_blits.append((
+                self.floor_textures[texture_index],
+                (x * shared_config.GRID_CELL_SIZE, y * shared_config.GRID_CELL_SIZE)
+            ))
+
+        for x, y in self.grid.getCells(self.grid.solid_mask):
+            texture_index: int = 0
+            if texture_stream.random() <= WALL_VARIANT_PROBABILITY:
+                texture_index = int(texture_stream.random() * len(self.wall_textures))
+
+            tile_blits.append((
+                self.wall_textures[texture_index],
+                (x * shared_config.GRID_CELL_SIZE, y * shared_config.GRID_CELL_SIZE)
+            ))
+
+        self.tiles_image.blits(tile_blits, doreturn=False)
 
     def update(self, delta_time: float) -> None:
         self.coin_animation_time += delta_time
@@ -172,23 +198,12 @@ class MazeManager:
 
         if 0 <= x < shared_config.GRID_COLUMN_COUNT and 0 <= y < shared_config.GRID_ROW_COUNT:
             payload: int = 0
-            prop: PropType = self.prop_mask[x][y]
-            self.prop_mask[x][y] = PropType.NONE
-            
-            match prop:
-                case PropType.COIN:
-                    self.coin_positions.remove((x, y))
-                case PropType.TREASURE:
-                    self.treasure_positions.remove((x, y))
-                case PropType.PURSE:
-                    self.purse_positions.remove((x, y))
-                    purse_ammount: int | None = self.purse_payloads.get((x, y))
-                    if not purse_ammount is None:
-                        payload = purse_ammount
-                case PropType.STAR:
-                    self.star_positions.remove((x, y))
-                case _:
-                    pass
+            prop: PropType = PropType(self.grid.prop_codes[x, y])
+            self.grid.prop_codes[x, y] = PropType.NONE
+
+            record: tuple[int, int] | None = self.props.remove((x, y))
+            if not record is None:
+                _, payload = record
 
             return (prop, payload)
         
@@ -203,19 +218,51 @@ class MazeManager:
         y: int = int((position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
 
         if 0 <= x < shared_config.GRID_COLUMN_COUNT and 0 <= y < shared_config.GRID_ROW_COUNT:
-            self.prop_mask[x][y] = PropType.PURSE
-            self.purse_positions.append((x, y))
-            self.purse_payloads[(x, y)] = purse_ammount
+            self.grid.prop_codes[x, y] = PropType.PURSE
+            self.props.add((x, y), PropType.PURSE, purse_ammount)
+
+    def getSolidMask(self) -> MazeGrid:
+        return self.grid
+
+    def getDistanceTable(self) -> DistanceTable:
+        assert not self.distance_table is None
+        return self.distance_table
+
+    def getComponents(self) -> MazeComponents:
+        assert not self.components is None
+        return self.components
+
+    def getLineOfSight(self) -> LineOfSightIndex:
+        assert not self.line_of_sight is None
+        return self.line_of_sight
+
+    def getFloorCells(self) -> FloorCellIndex:
+        assert not self.floor_cells is None
+        return self.floor_cells
+
+    def setPathfindingMode(self, pathfinding_mode: PathfindingMode) -> None:
+        self.pathfinding_mode = pathfinding_mode
+
+    def getPathSolver(self) -> PathSolver | None:
+        assert not self.distance_table is None
 
-    def getSolidMask(self) -> list[list[bool]]:
-        return self.solid_mask
+        # ? A* Stays on the Service's Resumable Engine; Every Other Mode Answers a Query in One Call
+        match self.pathfinding_mode:
+            case PathfindingMode.ASTAR:
+                return None
+            case PathfindingMode.JUMP_POINT:
+                return getJumpPointSearch(self.grid)
+            case PathfindingMode.JUNCTION_GRAPH:
+                return getHierarchicalPathfinder(self.grid)
+            case _:
+                return self.distance_table
 
     def drawMaze(self, canvas: pg.Surface) -> None:
         canvas.blit(self.tiles_image, (shared_config.GRID_RENDER_OFFSET_X, shared_config.GRID_RENDER_OFFSET_Y))
 
     def drawProps(self, canvas: pg.Surface) -> None:
         coin_frame: pg.Surface = self.coin_textures[self.coin_animation_index]
-        for x, y in self.coin_positions:
+        for x, y in self.props.getCells(PropType.COIN):
             canvas.blit(
                 coin_frame,
                 (
@@ -224,7 +271,7 @@ class MazeManager:
                 )
             )
 
-        for x, y in self.treasure_positions:
+        for x, y in self.props.getCells(PropType.TREASURE):
             canvas.blit(
                 self.chest_texture,
                 (
@@ -233,7 +280,7 @@ class MazeManager:
                 )
             )
 
-        for x, y in self.purse_positions:
+        for x, y in self.props.getCells(PropType.PURSE):
             canvas.blit(
                 self.purse_texture,
                 (
@@ -243,7 +290,7 @@ class MazeManager:
             )
 
         star_frame: pg.Surface = self.star_textures[self.star_animation_index]
-        for x, y in self.star_positions:
+        for x, y in self.props.getCells(PropType.STAR):
             canvas.blit(
                 star_frame,
                 (
@@ -255,7 +302,7 @@ class MazeManager:
     def drawShimmers(self, canvas: pg.Surface) -> None:
         shimmer_frame: pg.Surface = self.shimmer_textures[self.shimmer_animation_index]
 
-        for x, y in self.treasure_positions:
+        for x, y in self.props.getCells(PropType.TREASURE):
             canvas.blit(
                 shimmer_frame,
                 (
@@ -264,7 +311,7 @@ class MazeManager:
                 )
             )
 
-        for x, y in self.purse_positions:
+        for x, y in self.props.getCells(PropType.PURSE):
             canvas.blit(
                 shimmer_frame,
                 (
@@ -273,7 +320,7 @@ class MazeManager:
                 )
             )
 
-        for x, y in self.star_positions:
+        for x, y in self.props.getCells(PropType.STAR):
             canvas.blit(
                 shimmer_frame,
                 (
@@ -1,12 +1,13 @@
-import math
 import pygame as pg
-from random import random
 from .player import Player
 from typing import Callable
-from ..core import getTextures
+from concurrent.futures import Future
+from ..core import getTextures, getRotatedTexture, getRandomStream, RandomStream
 from ..scenes import shared_config
 from .maze_manager import MazeManager
-from .__utils import RAD_2_DEG, performAStar
+from .line_of_sight import LineOfSightIndex
+from .entity_store import EntityStore, AnimationMode
+from .pathfinding_service import PathfindingService
 
 NOBODY_INITIAL_X: float = 23.0 * shared_config.GRID_CELL_SIZE
 NOBODY_INITIAL_Y: float = 13.0 * shared_config.GRID_CELL_SIZE
@@ -18,27 +19,30 @@ NOBODY_ROLL_FRAME_TIME: float = 0.1
 NOBODY_WALK_SPEED: float = shared_config.GRID_CELL_SIZE * 2.0
 NOBODY_ROLL_SPEED: float = shared_config.GRID_CELL_SIZE * 3.75
 
-NOBODY_COLLISION_RADIUS_SQR: float = shared_config.HALF_GRID_CELL_SIZE * shared_config.HALF_GRID_CELL_SIZE
+NOBODY_COLLISION_RADIUS: float = shared_config.HALF_GRID_CELL_SIZE
 
-NOBODY_PATH_ARRIVED_BUFFER: float = shared_config.GRID_CELL_SIZE * 0.05
+NOBODY_ROTATION_OFFSET: float = 270.0
 
 class NobodyRollyPolly:
-    def __init__(self) -> None:
-        self.position_x: float = 0.0
-        self.position_y: float = 0.0
-        self.rotation: float = 0.0
+    __slots__ = (
+        "entities", "index", "patrol_frames", "crouch_frames", "roll_frames", "active_frames", "path_index",
+        "path", "path_request", "hit_player", "roll_position", "roll_x_delta", "roll_y_delta", "updateState"
+    )
+
+    def __init__(self, entities: EntityStore) -> None:
+        # ? Movement, Facing and Frame Timing Step in the Shared Store's Batch Updates
+        self.entities: EntityStore = entities
+        self.index: int = entities.allocate(NOBODY_COLLISION_RADIUS, self.__handlePlayerHit, self.__handleArrival)
 
         self.patrol_frames: list[pg.Surface] = getTextures(3, 1, False, (9, 0))
         self.crouch_frames: list[pg.Surface] = getTextures(3, 1, False, (9, 3))
         self.roll_frames: list[pg.Surface] = getTextures(6, 1, False, (9, 5))
 
-        self.animation_index: int = 0
-        self.animation_time: float = 0.0
-        self.animation_direction: int = 1
         self.active_frames: list[pg.Surface] = self.patrol_frames
 
         self.path_index: int = 0
         self.path: list[tuple[int, int]] = []
+        self.path_request: Future | None = None
 
         self.hit_player: bool = False
         self.roll_position: tuple[int, int] = (0, 0)
@@ -46,221 +50,156 @@ class NobodyRollyPolly:
         self.roll_x_delta: int = 0
         self.roll_y_delta: int = 0
 
-        self.updateState: Callable[[float, Player, Player, MazeManager], None] = self.updatePatrolState
+        self.updateState: Callable[[float, Player, Player, MazeManager, PathfindingService], None] = self.updatePatrolState
 
-    def reset(self, maze: list[list[bool]]) -> None:
-        self.position_x = NOBODY_INITIAL_X
-        self.position_y = NOBODY_INITIAL_Y
+    def reset(self, maze: MazeManager, pathfinding: PathfindingService) -> None:
+        self.entities.setPosition(self.index, (NOBODY_INITIAL_X, NOBODY_INITIAL_Y))
 
-        self.enterPatrolState(maze)
+        self.enterPatrolState(maze, pathfinding)
 
-    def __checkPlayerCollision(self, player: Player, maze: MazeManager) -> None:
-        if player.isDead():
-            return
-        
-        x, y = player.getPosition()
-        delta_x, delta_y = x - self.position_x, y - self.position_y
-        dist_sqr: float = (delta_x * delta_x) + (delta_y * delta_y)
+    def getPosition(self) -> tuple[float, float]:
+        return self.entities.getPosition(self.index)
 
-        if dist_sqr <= NOBODY_COLLISION_RADIUS_SQR:
-            maze.dropPurse((x, y), player.killPlayer())
-            self.hit_player = True
+    def __handlePlayerHit(self, player: Player, maze: MazeManager, pathfinding: PathfindingService) -> None:
+        maze.dropPurse(player.getPosition(), player.killPlayer())
+        self.hit_player = True
 
     def update(
         self,
         delta_time: float,
         red_player: Player,
         blue_player: Player,
-        maze: MazeManager
+        maze: MazeManager,
+        pathfinding: PathfindingService
     ) -> None:
-        self.animation_time += delta_time
-        self.__checkPlayerCollision(red_player, maze)
-        self.__checkPlayerCollision(blue_player, maze)
-        self.updateState(delta_time, red_player, blue_player, maze)
+        self.updateState(delta_time, red_player, blue_player, maze, pathfinding)
+
+    def draw(self, canvas: pg.Surface, alpha: float) -> None:
+        position_x, position_y = self.entities.getRenderPosition(self.index, alpha)
 
-    def draw(self, canvas: pg.Surface) -> None:
         canvas.blit(
-            pg.transform.rotate(
-                self.active_frames[self.animation_index],
-                self.rotation
+            getRotatedTexture(
+                self.active_frames[self.entities.animation_index[self.index]],
+                float(self.entities.rotation[self.index])
             ),
             (
-                shared_config.GRID_RENDER_OFFSET_X + self.position_x,
-                shared_config.GRID_RENDER_OFFSET_Y + self.position_y
+                shared_config.GRID_RENDER_OFFSET_X + position_x,
+                shared_config.GRID_RENDER_OFFSET_Y + position_y
             )
         )
 
-    def __animateBackAndForth(self, frame_time: float) -> bool:
-        if self.animation_time >= frame_time:
-            self.animation_time -= frame_time
-            self.animation_index += self.animation_direction
+    def __setFrames(self, frames: list[pg.Surface], frame_time: float, mode: AnimationMode, reverse: bool = False) -> None:
+        self.active_frames = frames
 
-            if self.animation_index == 0 or self.animation_index == len(self.active_frames) - 1:
-                self.animation_direction *= -1
-                return True
-            
-        return False
+        if reverse:
+            self.entities.setAnimation(self.index, frame_time, len(frames), mode, len(frames) - 1, -1)
+        else:
+            self.entities.setAnimation(self.index, frame_time, len(frames), mode)
 
-    def __animateLooping(self, frame_time: float) -> bool:
-        if self.animation_time >= frame_time:
-            self.animation_time -= frame_time
-            self.animation_index += self.animation_direction
+    def __handleArrival(self) -> None:
+        self.path_index += 1
 
-            if self.animation_index >= len(self.active_frames):
-                self.animation_index = 0
-                return True
-            
-            if self.animation_index < 0:
-                self.animation_index = len(self.active_frames) - 1
-                return True
-            
-        return False
-    
-    def __followPath(self, delta_time: float, move_speed: float) -> bool:
         if self.path_index < len(self.path):
-            node_x_index, node_y_index = self.path[self.path_index]
+            self.entities.advanceWaypoint(self.index, self.path[self.path_index])
 
-            node_x: float = node_x_index * shared_config.GRID_CELL_SIZE
-            node_y: float = node_y_index * shared_config.GRID_CELL_SIZE
-
-            delta_x: float = node_x - self.position_x
-            delta_y: float = node_y - self.position_y
-
-            node_dist: float = math.sqrt((delta_x * delta_x) + (delta_y * delta_y))
-
-            if node_dist <= NOBODY_PATH_ARRIVED_BUFFER:
-                self.path_index += 1
-            else:
-                self.position_x += delta_x * move_speed * delta_time / node_dist
-                self.position_y += delta_y * move_speed * delta_time / node_dist
-
-                self.rotation = 270.0 + math.atan2(delta_y, -delta_x) * RAD_2_DEG
+    def __beginPath(self, move_speed: float) -> None:
+        # ? Later Cells Are Aimed at on Arrival, so a Path Touches the Store Once per Cell
+        if self.path_index < len(self.path):
+            self.entities.setWaypoint(self.index, self.path[self.path_index], move_speed, NOBODY_ROTATION_OFFSET)
+        else:
+            self.entities.clearWaypoint(self.index)
 
-            return False
-        
-        return True
+    def __isPathFinished(self) -> bool:
+        return self.path_index >= len(self.path)
 
     ########################################
     # Patrol State                         #
     ########################################
 
-    def __selectPatrolPath(self, maze: list[list[bool]]) -> None:
+    def __selectPatrolPath(self, maze: MazeManager, pathfinding: PathfindingService) -> None:
+        position_x, position_y = self.getPosition()
         int_initial_position: tuple[int, int] = (
-            int((self.position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
-            int((self.position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+            int((position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE),
+            int((position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
         )
 
-        target_x: int = int(random() * shared_config.GRID_COLUMN_COUNT)
-        target_y: int = int(random() * shared_config.GRID_ROW_COUNT)
-
-        for _ in range(shared_config.GRID_COLUMN_COUNT):
-            found_floor: bool = False
+        self.path_request = pathfinding.requestPath(int_initial_position, maze.getFloorCells().sampleFloorCell(getRandomStream(RandomStream.NOBODY_ROLLY_POLLY)))
 
-            for _ in range(shared_config.GRID_ROW_COUNT):
-                if not maze[target_x][target_y]:
-                    found_floor = True
-                    break
-
-                target_y = (target_y + 1) % shared_config.GRID_ROW_COUNT
-
-            if found_floor:
-                break
+    def __receivePatrolPath(self) -> None:
+        if not self.path_request.done():
+            return
 
-            target_x = (target_x + 1) % shared_config.GRID_COLUMN_COUNT
+        if not self.path_request.cancelled():
+            self.path_index = 0
+            self.path = self.path_request.result()
+            self.__beginPath(NOBODY_WALK_SPEED)
 
-        self.path_index = 0
-        self.path = performAStar(int_initial_position, (target_x, target_y), maze)
+        self.path_request = None
 
-    def __hasLineOfSight(self, player_position: tuple[float, float], maze: list[list[bool]]) -> bool:
+    def __hasLineOfSight(self, position: tuple[float, float], player_position: tuple[float, float], line_of_sight: LineOfSightIndex) -> bool:
         player_x, player_y = player_position
+        position_x, position_y = position
 
-        int_x: int = int((self.position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
-        int_y: int = int((self.position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+        int_x: int = int((position_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
+        int_y: int = int((position_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
 
         int_player_x: int = int((player_x + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
         int_player_y: int = int((player_y + shared_config.HALF_GRID_CELL_SIZE) / shared_config.GRID_CELL_SIZE)
 
+        # ? Each Axis Check is One Mask Test Against the Shared Row or Column
         if int_x == int_player_x:
-            min_y: int = 0
-            max_y: int = 0
+            self.roll_y_delta = 1 if int_y < int_player_y else -1
 
-            if int_y < int_player_y:
-                min_y = int_y
-                max_y = int_player_y
-                self.roll_y_delta = 1
-            else:
-                min_y = int_player_y
-                max_y = int_y
-                self.roll_y_delta = -1
-
-            found_wall: bool = False
-            for y in range(min_y, max_y + 1):
-                if maze[int_x][y]:
-                    found_wall = True
-                    break
-
-            if not found_wall:
+            if line_of_sight.isColumnClear(int_x, int_y, int_player_y):
                 self.roll_position = (int_player_x, int_player_y)
                 self.roll_x_delta = 0
                 return True
-            
-        if int_y == int_player_y:
-            min_x: int = 0
-            max_x: int = 0
 
-            if int_x < int_player_x:
-                min_x = int_x
-                max_x = int_player_x
-                self.roll_x_delta = 1
-            else:
-                min_x = int_player_x
-                max_x = int_x
-                self.roll_x_delta = -1
-
-            found_wall: bool = False
-            for x in range(min_x, max_x + 1):
-                if maze[x][int_y]:
-                    found_wall = True
-                    break
+        if int_y == int_player_y:
+            self.roll_x_delta = 1 if int_x < int_player_x else -1
 
-            if not found_wall:
+            if line_of_sight.isRowClear(int_y, int_x, int_player_x):
                 self.roll_position = (int_player_x, int_player_y)
                 self.roll_y_delta = 0
                 return True
 
         return False
 
-    def enterPatrolState(self, maze: list[list[bool]]) -> None:
+    def enterPatrolState(self, maze: MazeManager, pathfinding: PathfindingService) -> None:
         self.updateState = self.updatePatrolState
 
-        self.animation_index = 0
-        self.animation_time = 0.0
-        self.animation_direction = 1
-        self.active_frames = self.patrol_frames
+        self.__setFrames(self.patrol_frames, NOBODY_PATROL_FRAME_TIME, AnimationMode.BACK_AND_FORTH)
+        self.entities.clearWaypoint(self.index)
 
-        self.__selectPatrolPath(maze)
+        self.__selectPatrolPath(maze, pathfinding)
 
     def updatePatrolState(
         self,
         delta_time: float,
         red_player: Player,
         blue_player: Player,
-        maze: MazeManager
+        maze: MazeManager,
+        pathfinding: PathfindingService
     ) -> None:
-        self.__animateBackAndForth(NOBODY_PATROL_FRAME_TIME)
+        # ? Read Once From the Store, Then Shared by Both Players' Checks
+        position: tuple[float, float] = self.getPosition()
 
         if not red_player.isDead():
-            if self.__hasLineOfSight(red_player.getPosition(), maze.getSolidMask()):
+            if self.__hasLineOfSight(position, red_player.getPosition(), maze.getLineOfSight()):
                 self.enterCrouchState()
                 return
         
         if not blue_player.isDead():
-            if self.__hasLineOfSight(blue_player.getPosition(), maze.getSolidMask()):
+            if self.__hasLineOfSight(position, blue_player.getPosition(), maze.getLineOfSight()):
                 self.enterCrouchState()
                 return
 
-        if self.__followPath(delta_time, NOBODY_WALK_SPEED):
-            self.__selectPatrolPath(maze.getSolidMask())
+        if not self.path_request is None:
+            self.__receivePatrolPath()
+
+        # ? Patrol Idles in Place While its Next Path is Being Planned
+        if self.path_request is None and self.__isPathFinished():
+            self.__selectPatrolPath(maze, pathfinding)
 
     ########################################
     # Crouch State                         #
@@ -269,64 +208,73 @@ class NobodyRollyPolly:
     def enterCrouchState(self) -> None:
         self.updateState = self.updateCrouchState
 
-        self.animation_index = 0
-        self.animation_time = 0.0
-        self.animation_direction = 1
-        self.active_frames = self.crouch_frames
+        self.__setFrames(self.crouch_frames, NOBODY_CROUCH_FRAME_TIME, AnimationMode.LOOPING)
+        self.entities.clearWaypoint(self.index)
 
     def updateCrouchState(
         self,
         delta_time: float,
         red_player: Player,
         blue_player: Player,
-        maze: MazeManager
+        maze: MazeManager,
+        pathfinding: PathfindingService
     ) -> None:
-        if self.__animateLooping(NOBODY_CROUCH_FRAME_TIME):
-            self.enterRollState(maze.getSolidMask())
+        if self.entities.animation_wrapped[self.index]:
+            self.enterRollState(maze.getLineOfSight())
 
     ########################################
     # Roll State                           #
     ########################################
 
-    def enterRollState(self, maze: list[list[bool]]) -> None:
+    def enterRollState(self, line_of_sight: LineOfSightIndex) -> None:
         self.updateState = self.updateRollState
 
-        self.animation_index = 0
-        self.animation_time = 0.0
-        self.animation_direction = 1
-        self.active_frames = self.roll_frames
+        self.__setFrames(self.roll_frames, NOBODY_ROLL_FRAME_TIME, AnimationMode.LOOPING)
 
         self.hit_player = False
+        self.path_request = None
 
-        if abs(self.roll_x_delta) > 0 or abs(self.roll_y_delta) > 0:
-            roll_x, roll_y = self.roll_position
+        roll_x, roll_y = self.roll_position
+        is_inside_border: bool = 0 < roll_x < shared_config.GRID_COLUMN_COUNT - 1 and 0 < roll_y < shared_config.GRID_ROW_COUNT - 1
 
-            while 0 < roll_x < shared_config.GRID_COLUMN_COUNT - 1 and 0 < roll_y < shared_config.GRID_ROW_COUNT - 1:
-                if maze[roll_x + self.roll_x_delta][roll_y + self.roll_y_delta]:
-                    break
+        # ? Roll Until Just Before the Next Wall, Stopping at the Border Cells
+        if is_inside_border and self.roll_x_delta != 0:
+            wall_x: int = line_of_sight.getNextWall((roll_x, roll_y), (self.roll_x_delta, 0))
 
-                roll_x += self.roll_x_delta
-                roll_y += self.roll_y_delta
+            if self.roll_x_delta > 0:
+                roll_x = min(wall_x - 1, shared_config.GRID_COLUMN_COUNT - 1)
+            else:
+                roll_x = max(wall_x + 1, 0)
+        elif is_inside_border and self.roll_y_delta != 0:
+            wall_y: int = line_of_sight.getNextWall((roll_x, roll_y), (0, self.roll_y_delta))
+
+            if self.roll_y_delta > 0:
+                roll_y = min(wall_y - 1, shared_config.GRID_ROW_COUNT - 1)
+            else:
+                roll_y = max(wall_y + 1, 0)
 
-            self.roll_position = (roll_x, roll_y)
+        self.roll_position = (roll_x, roll_y)
 
+        # ? The Roll Path is Laid on the First Roll Update, so it Sets Off a Frame After the Crouch Ends
         self.path_index = 0
-        self.path = [self.roll_position]
+        self.path = []
 
     def updateRollState(
         self,
         delta_time: float,
         red_player: Player,
         blue_player: Player,
-        maze: MazeManager
+        maze: MazeManager,
+        pathfinding: PathfindingService
     ) -> None:
-        self.__animateLooping(NOBODY_ROLL_FRAME_TIME)
-
         if self.hit_player:
             self.enterHitState()
             return
 
-        if self.__followPath(delta_time, NOBODY_ROLL_SPEED):
+        if not self.path:
+            self.path = [self.roll_position]
+            self.__beginPath(NOBODY_ROLL_SPEED)
+        elif self.__isPathFinished():
             self.enterHitState()
             return
 
@@ -337,17 +285,16 @@ class NobodyRollyPolly:
     def enterHitState(self) -> None:
         self.updateState = self.updateHitState
 
-        self.animation_index = len(self.crouch_frames) - 1
-        self.animation_time = 0.0
-        self.animation_direction = -1
-        self.active_frames = self.crouch_frames
+        self.__setFrames(self.crouch_frames, NOBODY_CROUCH_FRAME_TIME, AnimationMode.LOOPING, True)
+        self.entities.clearWaypoint(self.index)
 
     def updateHitState(
         self,
         delta_time: float,
         red_player: Player,
         blue_player: Player,
-        maze: MazeManager
+        maze: MazeManager,
+        pathfinding: PathfindingService
     ) -> None:
-        if self.__animateLooping(NOBODY_CROUCH_FRAME_TIME):
-            self.enterPatrolState(maze.getSolidMask())
\ No newline at end of file
+        if self.entities.animation_wrapped[self.index]:
+            self.enterPatrolState(maze, pathfinding)
\ No newline at end of file
@@ -0,0 +1,194 @@
+from collections import deque, OrderedDict
+from typing import Callable
+from dataclasses import dataclass
+from concurrent.futures import Future
+from .maze_grid import MazeGrid
+from .astar_engine import AStarEngine
+from .maze_components import MazeComponents
+from .pathfinding_workers import PathfindingWorkerPool, PathSolver
+
+PATHFINDING_EXPANSION_BUDGET: int = 256
+PATHFINDING_CACHE_SIZE: int = 128
+
+PathKey = tuple[tuple[int, int], tuple[int, int], int]
+
+@dataclass
+class PathfindingStats:
+    request_count: int
+    cache_hits: int
+    coalesced_count: int
+    search_count: int
+    expansion_count: int
+    pending_count: int
+
+class PathfindingService:
+    def __init__(
+        self,
+        expansion_budget: int = PATHFINDING_EXPANSION_BUDGET,
+        cache_size: int = PATHFINDING_CACHE_SIZE,
+        worker_pool: PathfindingWorkerPool | None = None
+    ) -> None:
+        self.expansion_budget: int = expansion_budget
+        self.cache_size: int = cache_size
+
+        # ? With a Pool, Searches Leave the Main Thread and Skip the Budget
+        self.worker_pool: PathfindingWorkerPool | None = worker_pool
+        self.worker_futures: dict[PathKey, Future] = {}
+
+        self.grid: MazeGrid | None = None
+        self.components: MazeComponents | None = None
+        self.engine: AStarEngine | None = None
+        self.solver: PathSolver | None = None
+
+        self.cache: OrderedDict[PathKey, list[tuple[int, int]]] = OrderedDict()
+        self.pending: dict[PathKey, Future] = {}
+        self.queue: deque[PathKey] = deque()
+        self.active_key: PathKey | None = None
+
+        self.request_count: int = 0
+        self.cache_hits: int = 0
+        self.coalesced_count: int = 0
+        self.search_count: int = 0
+        self.expansion_count: int = 0
+
+    def reset(
+        self,
+        grid: MazeGrid,
+        components: MazeComponents | None = None,
+        solver: PathSolver | None = None
+    ) -> None:
+        self.grid = grid
+        self.components = components
+        self.solver = solver
+
+        # ? The Service Owns its Engine so Sliced Searches Are Never Clobbered
+        if self.engine is None:
+            self.engine = AStarEngine(grid)
+        elif self.engine.layout_version != grid.layout_version:
+            self.engine.setGrid(grid)
+
+        # ? Workers Run the Same Mode as the Main Thread, Building Their Own Solver per Layout
+        if not self.worker_pool is None:
+            self.worker_pool.publish(grid, AStarEngine if solver is None else type(solver))
+
+        # ? Requests Against the Previous Layout Will Never Resolve
+        for future in self.pending.values():
+            future.cancel()
+
+        self.cache.clear()
+        self.pending.clear()
+        self.worker_futures.clear()
+        self.queue.clear()
+        self.active_key = None
+
+    def requestPath(
+        self,
+        initial_position: tuple[int, int],
+        target_position: tuple[int, int],
+        callback: Callable[[Future], None] | None = None
+    ) -> Future:
+        assert not self.grid is None
+        self.request_count += 1
+
+        # ? Unreachable Goals Snap Before Keying so Retries Hit the Cache
+        if not self.components is None:
+            snapped_position: tuple[int, int] | None = self.components.snapTarget(initial_position, target_position)
+            target_position = initial_position if snapped_position is None else snapped_position
+
+        key: PathKey = (initial_position, target_position, self.grid.layout_version)
+        future: Future | None = self.pending.get(key)
+
+        if future is None:
+            future = Future()
+
+            path: list[tuple[int, int]] | None = self.cache.get(key)
+            if path is None:
+                self.pending[key] = future
+
+                if self.worker_pool is None:
+                    self.queue.append(key)
+                else:
+                    self.worker_futures[key] = self.worker_pool.submit(initial_position, target_position)
+                    self.search_count += 1
+            else:
+                self.cache_hits += 1
+                self.cache.move_to_end(key)
+                future.set_result(list(path))
+        else:
+            # ? Identical Queries Share One Search and One Future
+            self.coalesced_count += 1
+
+        if not callback is None:
+            future.add_done_callback(callback)
+
+        return future
+
+    def update(self) -> None:
+        assert not self.engine is None
+
+        # ? Worker Results Are Delivered Here so Callbacks Stay on the Main Thread
+        if self.worker_futures:
+            for key in [key for key, worker_future in self.worker_futures.items() if worker_future.done()]:
+                self.__completePath(key, self.worker_futures.pop(key).result())
+
+        # ? One-Shot Solvers Cannot Pause, so a Frame Runs at Most One Whole Search
+        if not self.solver is None:
+            if self.queue:
+                solved_key: PathKey = self.queue.popleft()
+                initial_position, target_position, _ = solved_key
+                self.search_count += 1
+
+                path: list[tuple[int, int]] = self.solver.search(initial_position, target_position)
+                self.expansion_count += self.solver.expansion_count
+
+                self.__completePath(solved_key, path)
+
+            return
+
+        budget: int = self.expansion_budget
+
+        # ? Searches Run Until the Frame's Budget is Spent and Resume Next Frame
+        while budget > 0:
+            if self.active_key is None:
+                if not self.queue:
+                    break
+
+                self.active_key = self.queue.popleft()
+                initial_position, target_position, _ = self.active_key
+
+                self.engine.begin(initial_position, target_position)
+                self.search_count += 1
+
+            expansion_count: int = self.engine.expansion_count
+            is_done: bool = self.engine.step(budget)
+
+            # ? Every Step Pays at Least One Unit so the Loop Always Ends
+            expanded: int = max(self.engine.expansion_count - expansion_count, 1)
+            budget -= expanded
+            self.expansion_count += expanded
+
+            if is_done:
+                completed_key: PathKey = self.active_key
+                self.active_key = None
+
+                self.__completePath(completed_key, self.engine.getPath())
+
+    def __completePath(self, key: PathKey, path: list[tuple[int, int]]) -> None:
+        self.cache[key] = path
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+        future: Future = self.pending.pop(key)
+        if not future.cancelled():
+            future.set_result(list(path))
+
+    def getStats(self) -> PathfindingStats:
+        return PathfindingStats(
+            self.request_count,
+            self.cache_hits,
+            self.coalesced_count,
+            self.search_count,
+            self.expansion_count,
+            len(self.pending)
+        )
@@ -0,0 +1,146 @@
+import os
+import threading
+import numpy as np
+from enum import IntEnum
+from multiprocessing import shared_memory
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from .maze_grid import MazeGrid
+from .astar_engine import AStarEngine
+from .distance_table import DistanceTable
+from .jump_point_search import JumpPointSearch
+from .junction_graph import HierarchicalPathfinder
+
+class PathfindingWorkerKind(IntEnum):
+    THREAD = 0
+    PROCESS = 1
+
+# ? Any Search Built From a Grid That Answers a Whole Query Through search() and Reports its Expansions
+PathSolver = AStarEngine | JumpPointSearch | HierarchicalPathfinder | DistanceTable
+
+DEFAULT_PATHFINDING_WORKER_COUNT: int = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+# ? Each Worker Keeps One Solver for the Most Recently Published Layout
+__worker_state: threading.local = threading.local()
+
+class SharedMazeGrid:
+    def __init__(self, grid: MazeGrid) -> None:
+        self.column_count: int = grid.column_count
+        self.row_count: int = grid.row_count
+        self.layout_version: int = grid.layout_version
+
+        # ? The Solid Mask is Copied Once per Layout, Then Only its Name Travels
+        self.memory: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=grid.solid_mask.nbytes)
+        self.solid_mask: np.ndarray = np.ndarray(grid.solid_mask.shape, dtype=np.uint8, buffer=self.memory.buf)
+        self.solid_mask[:, :] = grid.solid_mask
+
+        self.name: str = self.memory.name
+
+    def close(self) -> None:
+        # ? Views Must be Dropped Before the Buffer Can be Released
+        del self.solid_mask
+
+        self.memory.close()
+        self.memory.unlink()
+
+def __attachWorkerGrid(
+    name: str,
+    column_count: int,
+    row_count: int,
+    layout_version: int,
+    solver_type: type[PathSolver]
+) -> PathSolver:
+    solver: PathSolver | None = getattr(__worker_state, "solver", None)
+
+    if getattr(__worker_state, "key", None) == (name, layout_version, solver_type) and not solver is None:
+        return solver
+
+    memory: shared_memory.SharedMemory | None = getattr(__worker_state, "memory", None)
+    if not memory is None:
+        memory.close()
+
+    memory = shared_memory.SharedMemory(name=name)
+
+    grid: MazeGrid = MazeGrid(column_count, row_count, {})
+    grid.solid_mask = np.ndarray((column_count, row_count), dtype=np.uint8, buffer=memory.buf)
+    grid.layout_version = layout_version
+
+    # ? Distance Tables Belong to One Layout; Every Other Solver Rebuilds its Tables in Place
+    if type(solver) is solver_type and not isinstance(solver, DistanceTable):
+        solver.setGrid(grid)
+    else:
+        solver = solver_type(grid)
+
+    # ? The Solver Keeps its Own Tables, so the View Can Go
+    del grid
+
+    __worker_state.memory = memory
+    __worker_state.solver = solver
+    __worker_state.key = (name, layout_version, solver_type)
+
+    return solver
+
+def searchSharedGrid(
+    name: str,
+    column_count: int,
+    row_count: int,
+    layout_version: int,
+    solver_type: type[PathSolver],
+    initial_position: tuple[int, int],
+    target_position: tuple[int, int]
+) -> list[tuple[int, int]]:
+    solver: PathSolver = __attachWorkerGrid(name, column_count, row_count, layout_version, solver_type)
+    return solver.search(initial_position, target_position)
+
+class PathfindingWorkerPool:
+    def __init__(
+        self,
+        worker_kind: PathfindingWorkerKind = PathfindingWorkerKind.PROCESS,
+        worker_count: int = DEFAULT_PATHFINDING_WORKER_COUNT
+    ) -> None:
+        self.worker_kind: PathfindingWorkerKind = worker_kind
+
+        # ? Threads Share the GIL, so Only Processes Free the Main Thread
+        self.executor: Executor
+        if worker_kind == PathfindingWorkerKind.PROCESS:
+            self.executor = ProcessPoolExecutor(worker_count)
+        else:
+            self.executor = ThreadPoolExecutor(worker_count, "pathfinding_worker")
+
+        self.shared_grid: SharedMazeGrid | None = None
+        self.published_grid: MazeGrid | None = None
+        self.solver_type: type[PathSolver] = AStarEngine
+
+    def publish(self, grid: MazeGrid, solver_type: type[PathSolver] = AStarEngine) -> None:
+        # ? Workers Build Their Own Solver of This Type, so Switching Modes Needs No New Copy of the Mask
+        self.solver_type = solver_type
+
+        if not self.shared_grid is None:
+            if self.published_grid is grid and self.shared_grid.layout_version == grid.layout_version:
+                return
+
+            self.shared_grid.close()
+
+        self.shared_grid = SharedMazeGrid(grid)
+        self.published_grid = grid
+
+    def submit(self, initial_position: tuple[int, int], target_position: tuple[int, int]) -> Future:
+        assert not self.shared_grid is None
+
+        return self.executor.submit(
+            searchSharedGrid,
+            self.shared_grid.name,
+            self.shared_grid.column_count,
+            self.shared_grid.row_count,
+            self.shared_grid.layout_version,
+            self.solver_type,
+            initial_position,
+            target_position
+        )
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+        if not self.shared_grid is None:
+            self.shared_grid.close()
+            self.shared_grid = None
+            self.published_grid = None
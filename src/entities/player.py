@@ -1,9 +1,10 @@
 import math
 import pygame as pg
 from .__utils import RAD_2_DEG
+from .maze_grid import MazeGrid
 from .maze_manager import PropType
 from ..scenes import shared_config
-from ..core import Input, getTextures
+from ..core import Input, VirtualJoystick, GameContext, getTextures, getRotatedTexture
 
 PLAYER_WALK_SPEED: float = 4.0 * shared_config.GRID_CELL_SIZE
 PLAYER_ANIMATION_FRAME_TIME: float = 0.1
@@ -30,9 +31,15 @@ DEATH_ANIMATION_TIME: float = 0.2
 PURSE_DROP_AMMOUNT: int = 100
 
 class Player:
-    def __init__(self, is_red: bool, joystick: pg.joystick.JoystickType) -> None:
+    __slots__ = (
+        "is_red", "app", "score", "is_dead", "animation_index", "animation_time", "animation_frames",
+        "star_power_frames", "death_frames", "star_power_active", "star_power_time", "position_x",
+        "position_y", "previous_x", "previous_y", "rotation", "input_x", "input_y", "input_factor_x", "input_factor_y"
+    )
+
+    def __init__(self, is_red: bool, app: GameContext) -> None:
         self.is_red: bool = is_red
-        self.joystick: pg.joystick.JoystickType = joystick
+        self.app: GameContext = app
 
         self.score: int = 0
         self.is_dead: bool = False
@@ -49,6 +56,10 @@ class Player:
         self.position_x: float = 0.0
         self.position_y: float = 0.0
 
+        # ? Position at the Start of the Last Step, Blended With the Current One When Drawing
+        self.previous_x: float = 0.0
+        self.previous_y: float = 0.0
+
         self.rotation: float = 0.0
 
         self.input_x: float = 0.0
@@ -81,16 +92,26 @@ class Player:
             self.position_y = BLUE_PLAYER_INITIAL_Y
             self.rotation = BLUE_PLAYER_INITIAL_ROTATION
 
+        self.previous_x, self.previous_y = self.position_x, self.position_y
+
     def getScore(self) -> int:
         return self.score
     
     def getPosition(self) -> tuple[float, float]:
         return (self.position_x, self.position_y)
     
+    def getRenderPosition(self, alpha: float) -> tuple[float, float]:
+        return (
+            self.previous_x + (self.position_x - self.previous_x) * alpha,
+            self.previous_y + (self.position_y - self.previous_y) * alpha
+        )
+
     def isDead(self) -> bool:
         return self.is_dead
     
     def update(self, delta_time: float) -> None:
+        self.previous_x, self.previous_y = self.position_x, self.position_y
+
         if self.is_dead:
             self.animation_time += delta_time
 
@@ -116,12 +137,17 @@ class Player:
                 self.position_y = BLUE_PLAYER_INITIAL_Y
                 self.rotation = BLUE_PLAYER_INITIAL_ROTATION
 
+            # ? Respawning Snaps Rather Than Sliding Back Across the Maze
+            self.previous_x, self.previous_y = self.position_x, self.position_y
+
         if self.star_power_active:
             self.star_power_time -= delta_time
             self.star_power_active = self.star_power_time > 0.0
 
-        self.input_x: float = self.joystick.get_axis(Input.LEFT_STICK_Y_AXIS) * self.input_factor_x
-        self.input_y: float = self.joystick.get_axis(Input.LEFT_STICK_X_AXIS) * self.input_factor_y
+        joystick: pg.joystick.JoystickType | VirtualJoystick = self.app.red_joystick if self.is_red else self.app.blue_joystick
+
+        self.input_x: float = joystick.get_axis(Input.LEFT_STICK_Y_AXIS) * self.input_factor_x
+        self.input_y: float = joystick.get_axis(Input.LEFT_STICK_X_AXIS) * self.input_factor_y
 
         if abs(self.input_x) > JOYSTICK_AXIS_THRESHOLD or abs(self.input_y) > JOYSTICK_AXIS_THRESHOLD:
             input_mag: float = math.sqrt((self.input_x * self.input_x) + (self.input_y * self.input_y))
@@ -142,7 +168,7 @@ class Player:
             self.animation_index = 0
             self.animation_time = 0.0
 
-    def handleWallCollisions(self, solid_mask: list[list[bool]]) -> None:
+    def handleWallCollisions(self, solid_mask: MazeGrid) -> None:
         map_x_index: int = int (self.position_x / shared_config.GRID_CELL_SIZE)
         map_y_index: int = int (self.position_y / shared_config.GRID_CELL_SIZE)
 
@@ -213,13 +239,15 @@ class Player:
         
         return drop_ammount
 
-    def draw(self, canvas: pg.Surface) -> None:
+    def draw(self, canvas: pg.Surface, alpha: float) -> None:
+        position_x, position_y = self.getRenderPosition(alpha)
+
         if self.is_dead:
             canvas.blit(
                 self.death_frames[self.animation_index],
                 (
-                    shared_config.GRID_RENDER_OFFSET_X + self.position_x,
-                    shared_config.GRID_RENDER_OFFSET_Y + self.position_y
+                    shared_config.GRID_RENDER_OFFSET_X + position_x,
+                    shared_config.GRID_RENDER_OFFSET_Y + position_y
                 )
             )
 
@@ -231,9 +259,9 @@ class Player:
         )
 
         canvas.blit(
-            pg.transform.rotate(base_texture, self.rotation),
+            getRotatedTexture(base_texture, self.rotation),
             (
-                shared_config.GRID_RENDER_OFFSET_X + self.position_x,
-                shared_config.GRID_RENDER_OFFSET_Y + self.position_y
+                shared_config.GRID_RENDER_OFFSET_X + position_x,
+                shared_config.GRID_RENDER_OFFSET_Y + position_y
             )
         )
\ No newline at end of file
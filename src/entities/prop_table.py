@@ -0,0 +1,81 @@
+import numpy as np
+
+PROP_TABLE_CAPACITY: int = 64
+PROP_SLOT_NONE: int = -1
+
+# ? Unaligned so Each Record Packs Into Nine Bytes
+PROP_RECORD_DTYPE: np.dtype = np.dtype([
+    ("x", np.uint16),
+    ("y", np.uint16),
+    ("prop_type", np.uint8),
+    ("payload", np.int32)
+])
+
+class PropTable:
+    __slots__ = ("column_count", "row_count", "count", "records", "cell_slots")
+
+    def __init__(self, column_count: int, row_count: int, capacity: int = PROP_TABLE_CAPACITY) -> None:
+        self.column_count: int = column_count
+        self.row_count: int = row_count
+
+        self.count: int = 0
+        self.records: np.ndarray = np.zeros(capacity, dtype=PROP_RECORD_DTYPE)
+
+        # ? Record Slot per Grid Cell, so Lookups and Removals Never Scan
+        self.cell_slots: np.ndarray = np.full(column_count * row_count, PROP_SLOT_NONE, dtype=np.int32)
+
+    def clear(self) -> None:
+        self.cell_slots[self.records["x"][:self.count].astype(np.int32) * self.row_count + self.records["y"][:self.count]] = PROP_SLOT_NONE
+        self.count = 0
+
+    def add(self, cell: tuple[int, int], prop_type: int, payload: int = 0) -> None:
+        x, y = cell
+        cell_index: int = x * self.row_count + y
+
+        slot: int = int(self.cell_slots[cell_index])
+        if slot == PROP_SLOT_NONE:
+            if self.count == len(self.records):
+                self.records = np.resize(self.records, len(self.records) * 2)
+
+            slot = self.count
+            self.count += 1
+            self.cell_slots[cell_index] = slot
+
+        # ? A Prop Added on an Occupied Cell Replaces the One Already There
+        self.records[slot] = (x, y, prop_type, payload)
+
+    def addCells(self, cells: list[tuple[int, int]], prop_type: int) -> None:
+        for cell in cells:
+            self.add(cell, prop_type)
+
+    def remove(self, cell: tuple[int, int]) -> tuple[int, int] | None:
+        x, y = cell
+        cell_index: int = x * self.row_count + y
+
+        slot: int = int(self.cell_slots[cell_index])
+        if slot == PROP_SLOT_NONE:
+            return None
+
+        prop_type, payload = int(self.records["prop_type"][slot]), int(self.records["payload"][slot])
+        self.cell_slots[cell_index] = PROP_SLOT_NONE
+
+        # ? Swap the Last Record Into the Hole to Keep Records Dense
+        self.count -= 1
+        if slot != self.count:
+            last_record: np.void = self.records[self.count]
+            self.records[slot] = last_record
+            self.cell_slots[int(last_record["x"]) * self.row_count + int(last_record["y"])] = slot
+
+        return (prop_type, payload)
+
+    def getCells(self, prop_type: int) -> list[tuple[int, int]]:
+        records: np.ndarray = self.records[:self.count]
+        matches: np.ndarray = records["prop_type"] == prop_type
+
+        return list(zip(records["x"][matches].tolist(), records["y"][matches].tolist()))
+
+    def getCount(self) -> int:
+        return self.count
+
+    def getByteCount(self) -> int:
+        return self.records.nbytes + self.cell_slots.nbytes
@@ -16,9 +16,12 @@ class WinStates(IntEnum):
     DRAW = 2
 
 class ConclusionScene(Scene):
-    def __init__(self, app: GameContext) -> None:
+    def __init__(self, app: GameContext, highscore_file_path: str | None = HIGHSCORE_FILE_PATH) -> None:
         super().__init__(app)
 
+        # ? None Keeps the Highscore in Memory, for Runs That Must Not Touch the Player's File
+        self.highscore_file_path: str | None = highscore_file_path
+
         self.pause_time: float = 0.0
 
         self.win_state: WinStates = WinStates.DRAW
@@ -37,8 +40,8 @@ class ConclusionScene(Scene):
         
         self.new_highscore_text: pg.Surface = self.small_font.render("NEW HIGHSCORE!", False, (255, 255, 255))
 
-        if exists(HIGHSCORE_FILE_PATH):
-            with open(HIGHSCORE_FILE_PATH, "r") as highscore_file:
+        if not self.highscore_file_path is None and exists(self.highscore_file_path):
+            with open(self.highscore_file_path, "r") as highscore_file:
                 self.highscore = int(highscore_file.readline())
 
     def enter(self) -> None:
@@ -48,8 +51,9 @@ class ConclusionScene(Scene):
         self.background_image.fill((50, 50, 50), special_flags=pg.BLEND_RGB_MULT)
 
         if self.win_score > self.highscore:
-            with open(HIGHSCORE_FILE_PATH, "w") as highscore_file:
-                highscore_file.write(f"{self.win_score}")
+            if not self.highscore_file_path is None:
+                with open(self.highscore_file_path, "w") as highscore_file:
+                    highscore_file.write(f"{self.win_score}")
 
             self.highscore = self.win_score
             self.new_highscore = True
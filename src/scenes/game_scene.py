@@ -2,14 +2,23 @@ import pygame as pg
 from .scene import Scene
 from ..scenes import shared_config
 from .conclusion_scene import ConclusionScene
-from ..core import GameContext, createFont, getTextures, getTexture
-from ..entities import Player, MazeManager, SkinnyBird, NobodyRollyPolly, ChaseEnemy
+from ..core import GameContext, TextLabel, getGlyphAtlas, getTextures, getTexture
+from ..entities import Player, MazeManager, SkinnyBird, NobodyRollyPolly, ChaseEnemy, FlowFieldService, PathfindingService, PathfindingWorkerPool, PathfindingWorkerKind, PathfindingMode, EntityStore
 
 GAME_DURATION: float = 45.0
 
 GAME_UI_BUFFER_X: int = 8
 GAME_UI_BUFFER_Y: int = 16
 
+GAME_UI_FONT_SIZE: int = 56
+GAME_UI_GLYPHS: str = "0123456789pts"
+
+# ? None Keeps Searches on the Main Thread Under the Per-Frame Budget
+GAME_PATHFINDING_WORKER_KIND: PathfindingWorkerKind | None = None
+
+# ? Patrol Goals Are Mostly New Cells, Which the Junction Graph Answers Without Growing a Table Row
+GAME_PATHFINDING_MODE: PathfindingMode = PathfindingMode.JUNCTION_GRAPH
+
 MASON_MANTIS_FRAME_TIME: float = 0.25
 SCORP_DRAGON_FRAME_TIME: float = 0.15
 
@@ -38,28 +47,49 @@ class GameScene(Scene):
         self.flashlight_texture: pg.Surface = getTexture(tile_size=(480, 480), source_path="./assets/sprites/spr_flashlight_fade.png")
 
         self.game_time: float = 0.0
+        self.render_alpha: float = 1.0
 
-        self.red_player: Player = Player(True, app.red_joystick)
-        self.blue_player: Player = Player(False, app.blue_joystick)
+        self.red_player: Player = Player(True, app)
+        self.blue_player: Player = Player(False, app)
 
         self.maze_manager: MazeManager = MazeManager()
+        self.maze_manager.setPathfindingMode(GAME_PATHFINDING_MODE)
+        self.flow_fields: FlowFieldService = FlowFieldService()
+        self.pathfinding_workers: PathfindingWorkerPool | None = None
+        if not GAME_PATHFINDING_WORKER_KIND is None:
+            self.pathfinding_workers = PathfindingWorkerPool(GAME_PATHFINDING_WORKER_KIND)
+
+        self.pathfinding: PathfindingService = PathfindingService(worker_pool=self.pathfinding_workers)
+
+        self.entities: EntityStore = EntityStore()
 
-        self.skinny_bird: SkinnyBird = SkinnyBird()
+        self.skinny_bird: SkinnyBird = SkinnyBird(self.entities)
 
-        self.rolly_polly: NobodyRollyPolly = NobodyRollyPolly()
+        self.rolly_polly: NobodyRollyPolly = NobodyRollyPolly(self.entities)
 
         self.mason_mantis: ChaseEnemy = ChaseEnemy(
+            self.entities,
             MASON_MANTIS_FRAME_TIME,
             getTextures(1, 6, root_indices=(2, 7)),
             (MASON_MANTIS_INITIAL_X, MASON_MANTIS_INITIAL_Y)
         )
         self.scorp_dragon: ChaseEnemy = ChaseEnemy(
+            self.entities,
             SCORP_DRAGON_FRAME_TIME,
             getTextures(1, 4, root_indices=(1, 4)),
             (SCORP_DRAGON_INITIAL_X, SCORP_DRAGON_INITIAL_Y)
         )
 
-        self.ui_font: pg.font.FontType = createFont(56)
+        red_ui_atlas = getGlyphAtlas(GAME_UI_FONT_SIZE, shared_config.UI_RED_TEXT, 90.0)
+        blue_ui_atlas = getGlyphAtlas(GAME_UI_FONT_SIZE, shared_config.UI_BLUE_TEXT, 270.0)
+
+        red_ui_atlas.prebake(GAME_UI_GLYPHS)
+        blue_ui_atlas.prebake(GAME_UI_GLYPHS)
+
+        self.red_score_label: TextLabel = TextLabel(red_ui_atlas, "{}pts")
+        self.red_time_label: TextLabel = TextLabel(red_ui_atlas, "{}s")
+        self.blue_score_label: TextLabel = TextLabel(blue_ui_atlas, "{}pts")
+        self.blue_time_label: TextLabel = TextLabel(blue_ui_atlas, "{}s")
 
     def enter(self) -> None:
         self.game_time = GAME_DURATION
@@ -71,10 +101,18 @@ class GameScene(Scene):
 
         self.skinny_bird.reset()
 
-        self.rolly_polly.reset(self.maze_manager.getSolidMask())
+        self.pathfinding.reset(
+            self.maze_manager.getSolidMask(),
+            self.maze_manager.getComponents(),
+            self.maze_manager.getPathSolver()
+        )
+
+        self.rolly_polly.reset(self.maze_manager, self.pathfinding)
+
+        self.flow_fields.reset(self.maze_manager.getDistanceTable())
 
-        self.mason_mantis.reset(self.red_player.getPosition(), self.maze_manager.getSolidMask())
-        self.scorp_dragon.reset(self.blue_player.getPosition(), self.maze_manager.getSolidMask())
+        self.mason_mantis.reset()
+        self.scorp_dragon.reset()
 
     def exit(self) -> None:
         self.conclusion_scene.setFinalScores(
@@ -82,7 +120,17 @@ class GameScene(Scene):
             self.blue_player.getScore()
         )
 
+    def release(self) -> None:
+        if not self.pathfinding_workers is None:
+            self.pathfinding_workers.shutdown()
+            self.pathfinding_workers = None
+
+    def interpolate(self, alpha: float) -> None:
+        self.render_alpha = alpha
+
     def update(self, delta_time: float) -> None:
+        self.entities.storePreviousPositions()
+
         self.game_time -= delta_time
         if self.game_time < 0.0:
             self.game_time = 0.0
@@ -102,12 +150,27 @@ class GameScene(Scene):
             blue_prop, blue_prop_payload = self.maze_manager.handleCollection(self.blue_player.getPosition())
             self.blue_player.applyProp(blue_prop, blue_prop_payload)
 
+        self.entities.updateAnimations(delta_time)
+
+        self.updateEnemies(delta_time)
+
+        # ? Enemies Have Chosen Their Waypoints; Step and Collide Them All at Once
+        self.entities.updateMovement(delta_time)
+        self.entities.resolvePlayerHits((self.red_player, self.blue_player), self.maze_manager, self.pathfinding)
+
+        # ? Requests Made This Frame Share One Expansion Budget
+        self.pathfinding.update()
+
+    def updateEnemies(self, delta_time: float) -> None:
         self.skinny_bird.update(delta_time, self.red_player, self.blue_player, self.maze_manager)
 
-        self.rolly_polly.update(delta_time, self.red_player, self.blue_player, self.maze_manager)
+        self.rolly_polly.update(delta_time, self.red_player, self.blue_player, self.maze_manager, self.pathfinding)
 
-        self.mason_mantis.update(delta_time, self.red_player, self.blue_player, self.maze_manager)
-        self.scorp_dragon.update(delta_time, self.blue_player, self.red_player, self.maze_manager)
+        self.flow_fields.updateTarget(self.red_player, self.red_player.getPosition())
+        self.flow_fields.updateTarget(self.blue_player, self.blue_player.getPosition())
+
+        self.mason_mantis.update(delta_time, self.red_player, self.maze_manager, self.flow_fields)
+        self.scorp_dragon.update(delta_time, self.blue_player, self.maze_manager, self.flow_fields)
 
     def draw(self, canvas: pg.Surface) -> None:
         canvas_width, canvas_height = canvas.get_size()
@@ -115,18 +178,56 @@ class GameScene(Scene):
         self.maze_manager.drawMaze(canvas)
         self.maze_manager.drawProps(canvas)
 
-        self.skinny_bird.draw(canvas)
+        self.drawEnemies(canvas)
+
+        self.red_player.draw(canvas, self.render_alpha)
+        self.blue_player.draw(canvas, self.render_alpha)
 
-        self.rolly_polly.draw(canvas)
+        self.drawFlashlights(canvas)
 
-        self.mason_mantis.draw(canvas)
-        self.scorp_dragon.draw(canvas)
+        # ? UI Rendering
+
+        red_score_text: pg.Surface = self.red_score_label.render(self.red_player.getScore())
+        red_time_text: pg.Surface = self.red_time_label.render(int(self.game_time))
+
+        blue_score_text: pg.Surface = self.blue_score_label.render(self.blue_player.getScore())
+        blue_time_text: pg.Surface = self.blue_time_label.render(int(self.game_time))
 
-        self.red_player.draw(canvas)
-        self.blue_player.draw(canvas)
+        red_score_width, red_score_height = red_score_text.get_size()
+        red_time_width = red_time_text.get_width()
+        blue_time_height = blue_time_text.get_height()
 
-        red_x, red_y = self.red_player.getPosition()
-        blue_x, blue_y = self.blue_player.getPosition()
+        canvas.blit(
+            red_score_text,
+            (canvas_width - red_score_width - GAME_UI_BUFFER_X, canvas_height - red_score_height - GAME_UI_BUFFER_Y)
+        )
+
+        canvas.blit(
+            red_time_text,
+            (canvas_width - red_time_width - GAME_UI_BUFFER_X, GAME_UI_BUFFER_Y)
+        )
+
+        canvas.blit(
+            blue_score_text,
+            (GAME_UI_BUFFER_X, GAME_UI_BUFFER_Y)
+        )
+
+        canvas.blit(
+            blue_time_text,
+            (GAME_UI_BUFFER_X, canvas_height - blue_time_height - GAME_UI_BUFFER_Y)
+        )
+
+    def drawEnemies(self, canvas: pg.Surface) -> None:
+        self.skinny_bird.draw(canvas, self.render_alpha)
+
+        self.rolly_polly.draw(canvas, self.render_alpha)
+
+        self.mason_mantis.draw(canvas, self.render_alpha)
+        self.scorp_dragon.draw(canvas, self.render_alpha)
+
+    def drawFlashlights(self, canvas: pg.Surface) -> None:
+        red_x, red_y = self.red_player.getRenderPosition(self.render_alpha)
+        blue_x, blue_y = self.blue_player.getRenderPosition(self.render_alpha)
 
         flash_width, flash_height = self.flashlight_texture.get_size()
         half_flash_width, half_flash_height = flash_width * 0.5, flash_height * 0.5
@@ -170,55 +271,5 @@ class GameScene(Scene):
             special_flags=pg.BLEND_RGB_ADD
         )
 
-        # ? UI Rendering
-
-        red_score_text: pg.Surface = pg.transform.rotate(self.ui_font.render(
-            f"{self.red_player.getScore()}pts",
-            False,
-            shared_config.UI_RED_TEXT
-        ), 90.0)
-
-        red_time_text: pg.Surface = pg.transform.rotate(self.ui_font.render(
-            f"{int(self.game_time)}s",
-            False,
-            shared_config.UI_RED_TEXT
-        ), 90.0)
-
-        blue_score_text: pg.Surface = pg.transform.rotate(self.ui_font.render(
-            f"{self.blue_player.getScore()}pts",
-            False,
-            shared_config.UI_BLUE_TEXT
-        ), 270.0)
-
-        blue_time_text: pg.Surface = pg.transform.rotate(self.ui_font.render(
-            f"{int(self.game_time)}s",
-            False,
-            shared_config.UI_BLUE_TEXT
-        ), 270.0)
-
-        red_score_width, red_score_height = red_score_text.get_size()
-        red_time_width = red_time_text.get_width()
-        blue_time_height = blue_time_text.get_height()
-
-        canvas.blit(
-            red_score_text,
-            (canvas_width - red_score_width - GAME_UI_BUFFER_X, canvas_height - red_score_height - GAME_UI_BUFFER_Y)
-        )
-
-        canvas.blit(
-            red_time_text,
-            (canvas_width - red_time_width - GAME_UI_BUFFER_X, GAME_UI_BUFFER_Y)
-        )
-
-        canvas.blit(
-            blue_score_text,
-            (GAME_UI_BUFFER_X, GAME_UI_BUFFER_Y)
-        )
-
-        canvas.blit(
-            blue_time_text,
-            (GAME_UI_BUFFER_X, canvas_height - blue_time_height - GAME_UI_BUFFER_Y)
-        )
-
     def shouldTransition(self) -> bool:
         return self.game_time <= 0.0
\ No newline at end of file
@@ -26,4 +26,10 @@ class Scene(ABC):
 
     @abstractmethod
     def shouldTransition(self) -> bool:
+        pass
+
+    def interpolate(self, alpha: float) -> None:
+        pass
+
+    def release(self) -> None:
         pass
\ No newline at end of file